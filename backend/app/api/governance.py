@@ -6,6 +6,7 @@ including proposal creation, voting, delegation, and governance statistics.
 """
 
 import logging
+import math
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta, timezone
 
@@ -1292,6 +1293,18 @@ async def get_governance_stats() -> Dict[str, Any]:
         }
     }
 
+def _raise_if_rate_limited(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a governance read shed by the rate limiter into an HTTP 429."""
+    if not result.get("success") and result.get("error") == "rate_limited":
+        retry_after_ms = result.get("retry_after_ms", 1000)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=result,
+            headers={"Retry-After": str(math.ceil(retry_after_ms / 1000))}
+        )
+    return result
+
+
 @router.get("/proposal/{proposal_id}/status")
 async def get_proposal_status(
     proposal_id: str,
@@ -1301,7 +1314,9 @@ async def get_proposal_status(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_proposal_status(proposal_id=proposal_id)
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting proposal status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1320,7 +1335,9 @@ async def get_vote_receipt(
             proposal_id=proposal_id,
             voter=voter
         )
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting vote receipt: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1334,7 +1351,9 @@ async def get_quorum(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_quorum()
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting quorum: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1348,7 +1367,9 @@ async def get_voting_delay(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_voting_delay()
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting voting delay: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1362,7 +1383,9 @@ async def get_voting_period(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_voting_period()
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting voting period: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1376,7 +1399,9 @@ async def get_proposal_threshold(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_proposal_threshold()
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting proposal threshold: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1390,7 +1415,9 @@ async def get_all_proposals(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_all_proposals()
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting all proposals: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1404,7 +1431,9 @@ async def get_active_proposals(
     try:
         governance_service = get_governance_service()
         result = await governance_service.get_active_proposals()
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting active proposals: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1419,7 +1448,9 @@ async def check_can_execute(
     try:
         governance_service = get_governance_service()
         result = await governance_service.can_execute(proposal_id=proposal_id)
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error checking execution status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1438,7 +1469,9 @@ async def check_has_voted(
             proposal_id=proposal_id,
             voter=voter
         )
-        return result
+        return _raise_if_rate_limited(result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error checking voting status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -13,8 +13,8 @@ Based on the complete contract analysis, this supports all 4 main contracts:
 
 import os
 import json
-from typing import Optional, List, Dict, Any
-from pydantic import Field, validator
+from typing import Optional, List, Dict, Any, Iterable
+from pydantic import AliasChoices, Field, validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -83,6 +83,16 @@ class Settings(BaseSettings):
     # Hedera Transaction Settings
     max_transaction_fee: int = Field(default=100, env="MAX_TRANSACTION_FEE")
     max_query_payment: int = Field(default=50, env="MAX_QUERY_PAYMENT")
+    hedera_client_pool_size: int = Field(default=4, env="HEDERA_CLIENT_POOL_SIZE")
+    hedera_max_concurrent_queries: int = Field(default=10, env="HEDERA_MAX_CONCURRENT_QUERIES")
+    hedera_governance_qps: float = Field(
+        default=50.0,
+        validation_alias=AliasChoices("HEDERA_GOV_QPS", "HEDERA_GOVERNANCE_QPS")
+    )
+    
+    # Local reputation index (kept fresh from ReputationOracle events)
+    reputation_index_path: str = Field(default="./reputation_index.db", env="REPUTATION_INDEX_PATH")
+    reputation_index_poll_interval: float = Field(default=5.0, env="REPUTATION_INDEX_POLL_INTERVAL")
     
     # Smart Contract Addresses (All 4 main contracts)
     # Placeholders until deployment - will be updated by deployment script
@@ -229,6 +239,29 @@ def get_contract_address(contract_name: str) -> str:
         return ""
 
 
+def get_contract_addresses(contract_names: Iterable[str]) -> Dict[str, str]:
+    """
+    Get the deployed addresses for several contracts from one config load.
+    
+    Args:
+        contract_names: Names of the contracts (e.g., 'SkillToken', 'TalentPool')
+        
+    Returns:
+        Dictionary mapping each contract name to its address, or "" if not deployed
+    """
+    contract_names = list(contract_names)
+    try:
+        contracts = get_contract_config().get('contracts', {})
+        return {
+            contract_name: contracts.get(contract_name, {}).get('address', '')
+            for contract_name in contract_names
+        }
+        
+    except Exception as e:
+        print(f"❌ Failed to get contract addresses: {str(e)}")
+        return dict.fromkeys(contract_names, "")
+
+
 def validate_contract_deployments() -> Dict[str, bool]:
     """
     Validate that all required contracts are deployed.
@@ -14,7 +14,10 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 
 from app.api import skills, pools, mcp, reputation, governance
-from app.utils.hedera import initialize_hedera_client, check_hedera_connection, check_contract_deployments
+from app.utils.hedera import (
+    initialize_hedera_client, check_hedera_connection, check_contract_deployments,
+    start_reputation_indexer, stop_reputation_indexer, close_http_client
+)
 from app.utils.mcp_server import get_mcp_client
 
 # Configure logging
@@ -49,6 +52,9 @@ async def lifespan(app: FastAPI):
         contract_status = await check_contract_deployments()
         logger.info(f"Contract deployment status: {contract_status}")
         
+        # Keep the local reputation index in sync with oracle events
+        start_reputation_indexer()
+        
     except Exception as e:
         logger.warning(f"Hedera initialization warning: {str(e)}")
     
@@ -72,6 +78,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown logic
     logger.info("Application shutting down gracefully")
+    await stop_reputation_indexer()
+    await close_http_client()
 
 # Create FastAPI app with enhanced configuration
 app = FastAPI(
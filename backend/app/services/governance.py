@@ -69,6 +69,14 @@ _fallback_delegations = {}
 _fallback_counter = 1000
 
 
+def _read_failure(result: Dict[str, Any], default_error: str) -> Dict[str, Any]:
+    """Build a read failure, keeping the rate limiter's retry hint."""
+    failure = {"success": False, "error": result.get("error", default_error)}
+    if "retry_after_ms" in result:
+        failure["retry_after_ms"] = result["retry_after_ms"]
+    return failure
+
+
 class ProposalType(str, Enum):
     """Types of governance proposals."""
     PARAMETER_CHANGE = "parameter_change"
@@ -1503,10 +1511,7 @@ class GovernanceService:
         try:
             result = await get_proposal_status(proposal_id=proposal_id)
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", f"Failed to get status for proposal {proposal_id}")
-                }
+                return _read_failure(result, f"Failed to get status for proposal {proposal_id}")
             return result
         except Exception as e:
             logger.error(f"Error getting proposal status: {str(e)}")
@@ -1529,10 +1534,7 @@ class GovernanceService:
         try:
             result = await get_vote_receipt(proposal_id=proposal_id, voter=voter)
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", f"Failed to get vote receipt for proposal {proposal_id}")
-                }
+                return _read_failure(result, f"Failed to get vote receipt for proposal {proposal_id}")
             return result
         except Exception as e:
             logger.error(f"Error getting vote receipt: {str(e)}")
@@ -1551,10 +1553,7 @@ class GovernanceService:
         try:
             result = await get_quorum()
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", "Failed to get quorum")
-                }
+                return _read_failure(result, "Failed to get quorum")
             return result
         except Exception as e:
             logger.error(f"Error getting quorum: {str(e)}")
@@ -1573,10 +1572,7 @@ class GovernanceService:
         try:
             result = await get_voting_delay()
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", "Failed to get voting delay")
-                }
+                return _read_failure(result, "Failed to get voting delay")
             return result
         except Exception as e:
             logger.error(f"Error getting voting delay: {str(e)}")
@@ -1595,10 +1591,7 @@ class GovernanceService:
         try:
             result = await get_voting_period()
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", "Failed to get voting period")
-                }
+                return _read_failure(result, "Failed to get voting period")
             return result
         except Exception as e:
             logger.error(f"Error getting voting period: {str(e)}")
@@ -1617,10 +1610,7 @@ class GovernanceService:
         try:
             result = await get_proposal_threshold()
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", "Failed to get proposal threshold")
-                }
+                return _read_failure(result, "Failed to get proposal threshold")
             return result
         except Exception as e:
             logger.error(f"Error getting proposal threshold: {str(e)}")
@@ -1639,10 +1629,7 @@ class GovernanceService:
         try:
             result = await get_all_proposals()
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", "Failed to get all proposals")
-                }
+                return _read_failure(result, "Failed to get all proposals")
             return result
         except Exception as e:
             logger.error(f"Error getting all proposals: {str(e)}")
@@ -1661,10 +1648,7 @@ class GovernanceService:
         try:
             result = await get_active_proposals()
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", "Failed to get active proposals")
-                }
+                return _read_failure(result, "Failed to get active proposals")
             return result
         except Exception as e:
             logger.error(f"Error getting active proposals: {str(e)}")
@@ -1686,10 +1670,7 @@ class GovernanceService:
         try:
             result = await can_execute(proposal_id=proposal_id)
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", f"Failed to check execution status for proposal {proposal_id}")
-                }
+                return _read_failure(result, f"Failed to check execution status for proposal {proposal_id}")
             return result
         except Exception as e:
             logger.error(f"Error checking execution status: {str(e)}")
@@ -1712,10 +1693,7 @@ class GovernanceService:
         try:
             result = await has_voted(proposal_id=proposal_id, voter=voter)
             if not result.get("success"):
-                return {
-                    "success": False,
-                    "error": result.get("error", f"Failed to check voting status for proposal {proposal_id}")
-                }
+                return _read_failure(result, f"Failed to check voting status for proposal {proposal_id}")
             return result
         except Exception as e:
             logger.error(f"Error checking voting status: {str(e)}")
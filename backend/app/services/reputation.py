@@ -44,7 +44,7 @@ from app.utils.hedera import (
     get_contract_manager, get_client, submit_hcs_message,
     validate_hedera_address, resolve_challenge, slash_oracle,
     withdraw_oracle_stake, get_oracle_performance, get_category_score,
-    get_work_evaluation, get_user_evaluations, get_global_stats,
+    get_category_scores_batch, get_work_evaluation, get_user_evaluations, get_global_stats,
     update_oracle_status
 )
 
@@ -1665,6 +1665,34 @@ class ReputationService:
                 "error": str(e)
             }
 
+    async def get_category_scores(self, user_address: str, categories: List[str]) -> Dict[str, Any]:
+        """
+        Get a user's reputation scores across several categories at once.
+        
+        Args:
+            user_address: User's address
+            categories: Skill categories
+            
+        Returns:
+            Dictionary containing the score for each category.
+        """
+        try:
+            results = await get_category_scores_batch(user_address=user_address, categories=categories)
+            return {
+                "success": True,
+                "user_address": user_address,
+                "scores": {
+                    category: result.get("score") if result.get("success") else None
+                    for category, result in results.items()
+                }
+            }
+        except Exception as e:
+            logger.error(f"Error getting category scores: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     async def get_work_evaluation(self, evaluation_id: str) -> Dict[str, Any]:
         """
         Get work evaluation details.
@@ -9,15 +9,31 @@ This unified module combines all Hedera functionality into a single, professiona
 """
 
 import os
+import re
 import json
+import time
+import random
+import sqlite3
+import threading
+import copy
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List, Union, Tuple, TYPE_CHECKING
+from typing import (
+    Optional, Dict, Any, List, Union, Tuple, Callable, Mapping, AsyncIterator, Awaitable, Iterable,
+    Sequence, Set, TYPE_CHECKING
+)
 from datetime import datetime, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from types import MappingProxyType
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
+import httpx
 from dotenv import load_dotenv
+from eth_abi import encode as abi_encode, decode as abi_decode
+from eth_hash.auto import keccak
 
 if TYPE_CHECKING:
     from hedera import (
@@ -48,7 +64,9 @@ from hedera import (
     Status, PrecheckStatusException, ReceiptStatusException
 )
 
-from app.config import get_settings, get_contract_config, get_contract_abi, get_contract_address
+from app.config import (
+    Settings, get_settings, get_contract_config, get_contract_abi, get_contract_address, get_network_config
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -119,7 +137,7 @@ class SkillTokenData:
     expiry_date: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionResult:
     """Transaction execution result."""
     success: bool
@@ -131,6 +149,31 @@ class TransactionResult:
     pool_id: Optional[str] = None
 
 
+@dataclass(slots=True)
+class CallSpec:
+    """A read-only contract call dispatched through the JSON-RPC relay."""
+    contract_address: str
+    function: str  # Solidity signature, e.g. "getReputationScore(address)"
+    args: Tuple[Any, ...] = ()
+    output_types: Tuple[str, ...] = ()
+    data: Optional[bytes] = None  # Pre-encoded calldata; skips encoding function/args
+
+
+@dataclass(slots=True)
+class CallResult:
+    """Decoded result of a single batched contract call."""
+    success: bool
+    values: Tuple[Any, ...] = ()
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class PoolAction:
+    """A TalentPool write for batch_pool_actions, e.g. PoolAction("closePool", (pool_id,))."""
+    function: str  # TalentPool function name, e.g. "selectCandidate"
+    args: Tuple[Any, ...] = ()
+
+
 # =============================================================================
 # GLOBAL VARIABLES
 # =============================================================================
@@ -138,13 +181,157 @@ class TransactionResult:
 # Global Hedera client instance
 _hedera_client: Optional[Client] = None
 
+# Success status bound once; each attribute lookup on the Java enum crosses JNI
+_SUCCESS = Status.Success
+
 # Contract configuration cache
 _contract_config: Optional[Dict[str, Dict[str, Any]]] = None
 
+# =============================================================================
+# CACHING
+# =============================================================================
+
+class _TTLCache:
+    """
+    Small bounded in-memory cache whose entries expire after a fixed TTL.
+    
+    Entries are evicted oldest-first once ``maxsize`` is reached, so memory
+    stays bounded regardless of how many distinct keys are read.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic(), value)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Reads currently in flight, so concurrent callers for the same key share one request
+_INFLIGHT: Dict[Tuple[str, str], asyncio.Future] = {}
+
+
+async def _coalesced(key: Tuple[str, str], factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run ``factory()`` once for all concurrent callers with the same key.
+    
+    The shared task is shielded, so a cancelled caller does not cancel the
+    request the other callers are waiting on.
+    
+    Args:
+        key: (operation, argument) identifying the read
+        factory: Zero-argument coroutine function performing the read
+        
+    Returns:
+        Whatever the shared read returns
+    """
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = asyncio.ensure_future(factory())
+        _INFLIGHT[key] = future
+        future.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return await asyncio.shield(future)
+
+
+async def _cached_read(
+    cache: _TTLCache,
+    key: Tuple[str, str],
+    factory: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Serve a read from ``cache``, sharing one read among concurrent misses.
+    
+    Only successful results are cached, so transient failures are retried.
+    Callers get a deep copy and cannot corrupt the cached entry.
+    """
+    cached = cache.get(key)
+    if cached is None:
+        cached = await _coalesced(key, factory)
+        if cached.get("success"):
+            cache.set(key, cached)
+    return copy.deepcopy(cached)
+
+
+# Reputation scores only change when an evaluation is submitted
+_REPUTATION_TTL = 30.0
+_REPUTATION_CACHE = _TTLCache(maxsize=10_000, ttl=_REPUTATION_TTL)
+
+
+def _reputation_key(user_address: str) -> str:
+    """Normalize a user address so Hedera IDs and EVM addresses share cache entries."""
+    try:
+        return _to_evm_address(user_address)
+    except ValueError:
+        return user_address
+
+
+def invalidate_reputation_cache(user_address: Optional[str] = None) -> None:
+    """
+    Drop cached and indexed reputation scores.
+    
+    Args:
+        user_address: Address to invalidate; clears the whole cache if omitted
+    """
+    if user_address is None:
+        _REPUTATION_CACHE.clear()
+    else:
+        key = _reputation_key(user_address)
+        _REPUTATION_CACHE.pop(key)
+        _delete_reputation_index(key)
+
+
 # =============================================================================
 # CLIENT INITIALIZATION
 # =============================================================================
 
+def _build_hedera_client(settings: Settings) -> Client:
+    """Create a Hedera client for the configured network and operator."""
+    # Parse operator account ID
+    operator_id = AccountId.fromString(settings.hedera_account_id)
+    
+    # Parse operator private key
+    operator_key = PrivateKey.fromString(settings.hedera_private_key)
+    
+    # Create client based on network
+    if settings.hedera_network == "testnet":
+        client = Client.forTestnet()
+    elif settings.hedera_network == "mainnet":
+        client = Client.forMainnet()
+    elif settings.hedera_network == "previewnet":
+        client = Client.forPreviewnet()
+    else:
+        raise ValueError(f"Unsupported network: {settings.hedera_network}")
+    
+    # Set operator
+    client.setOperator(operator_id, operator_key)
+    
+    # Set default transaction fee
+    client.setDefaultMaxTransactionFee(Hbar(settings.max_transaction_fee))
+    client.setDefaultMaxQueryPayment(Hbar(settings.max_query_payment))
+    
+    return client
+
+
 def initialize_hedera_client() -> Client:
     """
     Initialize and configure the Hedera client.
@@ -162,37 +349,15 @@ def initialize_hedera_client() -> Client:
     
     try:
         settings = get_settings()
-        
-        # Parse operator account ID
-        operator_id = AccountId.fromString(settings.hedera_account_id)
-        
-        # Parse operator private key
-        operator_key = PrivateKey.fromString(settings.hedera_private_key)
-        
-        # Create client based on network
-        if settings.hedera_network == "testnet":
-            client = Client.forTestnet()
-        elif settings.hedera_network == "mainnet":
-            client = Client.forMainnet()
-        elif settings.hedera_network == "previewnet":
-            client = Client.forPreviewnet()
-        else:
-            raise ValueError(f"Unsupported network: {settings.hedera_network}")
-        
-        # Set operator
-        client.setOperator(operator_id, operator_key)
-        
-        # Set default transaction fee
-        client.setDefaultMaxTransactionFee(Hbar(settings.max_transaction_fee))
-        client.setDefaultMaxQueryPayment(Hbar(settings.max_query_payment))
+        client = _build_hedera_client(settings)
         
         _hedera_client = client
-        logger.info(f"Hedera client initialized for {settings.hedera_network}")
+        logger.info("Hedera client initialized for %s", settings.hedera_network)
         
         return client
         
     except Exception as e:
-        logger.error(f"Failed to initialize Hedera client: {str(e)}")
+        logger.error("Failed to initialize Hedera client: %s", e)
         raise Exception(f"Hedera client initialization failed: {str(e)}")
 
 
@@ -211,6 +376,45 @@ def get_hedera_client() -> Client:
     return _hedera_client
 
 
+class _HederaClientPool:
+    """
+    Round-robin pool of Hedera clients.
+    
+    Each client owns its own gRPC channels, so spreading concurrent
+    transactions across clients keeps them from queueing on one
+    connection's stream limit. Node health and failover are already
+    handled inside each client by the SDK.
+    """
+    
+    def __init__(self) -> None:
+        self._clients: List[Client] = []
+        self._next = 0
+    
+    def _warm(self) -> None:
+        settings = get_settings()
+        size = max(1, settings.hedera_client_pool_size)
+        clients = [get_hedera_client()]
+        for _ in range(size - 1):
+            try:
+                clients.append(_build_hedera_client(settings))
+            except Exception as e:
+                logger.warning("Failed to create pooled Hedera client: %s", e)
+                break
+        self._clients = clients
+        logger.info("Hedera client pool warmed with %d clients", len(clients))
+    
+    def acquire(self) -> Client:
+        """Return the next client in rotation, warming the pool on first use."""
+        if not self._clients:
+            self._warm()
+        client = self._clients[self._next % len(self._clients)]
+        self._next += 1
+        return client
+
+
+_client_pool = _HederaClientPool()
+
+
 # =============================================================================
 # SMART CONTRACT INTEGRATION
 # =============================================================================
@@ -230,6 +434,82 @@ def get_contract_manager() -> Dict[str, Dict[str, Any]]:
     return _contract_config
 
 
+# Resolved (address, ContractId) pairs, cleared when the contract config is reloaded
+_contract_id_cache: Dict[str, Tuple[Optional[str], Optional[ContractId]]] = {}
+# Contracts that were missing, mapped to when the deployment file is next checked
+_contract_misses: Dict[str, float] = {}
+_CONTRACT_MISS_TTL = 30.0
+
+
+def reload_contract_manager() -> Dict[str, Dict[str, Any]]:
+    """
+    Reload the contract configuration, e.g. after a redeployment.
+    
+    Returns:
+        Dictionary containing the reloaded contract configurations
+    """
+    global _contract_config
+    
+    _contract_config = get_contract_config()
+    _contract_id_cache.clear()
+    _contract_misses.clear()
+    invalidate_pool_cache()
+    # A redeployed contract restarts its IDs, so results keyed by them are void
+    _RECENT_WRITES.clear()
+    _EXECUTED_PROPOSALS.clear()
+    
+    return _contract_config
+
+
+def _resolve_contract(contract_name: str) -> Tuple[Optional[str], Optional[ContractId]]:
+    """
+    Resolve a deployed contract's address and ContractId.
+    
+    Memoized per name, so the common path is a single dictionary lookup; the
+    memo is cleared whenever the config is reloaded. A missing contract is
+    re-checked against the deployment file every ``_CONTRACT_MISS_TTL``
+    seconds, and the config is reloaded once the contract shows up there.
+    
+    Args:
+        contract_name: Contract name as listed in the deployment config
+        
+    Returns:
+        (address, ContractId) if the contract is deployed, (None, None) otherwise
+    """
+    resolved = _contract_id_cache.get(contract_name)
+    if resolved is not None and (
+        resolved[0] is not None or time.monotonic() < _contract_misses.get(contract_name, 0.0)
+    ):
+        return resolved
+    
+    if resolved is not None:
+        if not get_contract_config().get('contracts', {}).get(contract_name, {}).get('address'):
+            _contract_misses[contract_name] = time.monotonic() + _CONTRACT_MISS_TTL
+            return resolved
+        reload_contract_manager()
+    
+    address = get_contract_manager().get('contracts', {}).get(contract_name, {}).get('address')
+    resolved = (address, ContractId.fromString(address)) if address else (None, None)
+    _contract_id_cache[contract_name] = resolved
+    if not address:
+        _contract_misses[contract_name] = time.monotonic() + _CONTRACT_MISS_TTL
+    
+    return resolved
+
+
+def _get_contract_id(contract_name: str) -> Optional[ContractId]:
+    """
+    Resolve a deployed contract's ContractId.
+    
+    Args:
+        contract_name: Contract name as listed in the deployment config
+        
+    Returns:
+        ContractId if the contract is deployed, None otherwise
+    """
+    return _resolve_contract(contract_name)[1]
+
+
 def get_client() -> Client:
     """
     Get the Hedera client instance (alias for get_hedera_client).
@@ -240,807 +520,1123 @@ def get_client() -> Client:
     return get_hedera_client()
 
 
-async def create_skill_token(
-    recipient_address: str,
-    skill_name: str,
-    skill_category: str,
-    level: int = 1,
-    description: str = "",
-    metadata_uri: str = ""
-) -> TransactionResult:
+# =============================================================================
+# BLOCKING SDK EXECUTION
+# =============================================================================
+
+# The SDK is synchronous; its network calls run on a bounded pool so they
+# never block the event loop and concurrent callers actually overlap.
+_HEDERA_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedera-sdk")
+
+
+async def _exec(fn: Callable[..., Any], *args: Any) -> Any:
     """
-    Create a skill token using the SkillToken smart contract.
+    Run a blocking SDK call on the Hedera executor.
     
     Args:
-        recipient_address: Hedera account ID to receive the token
-        skill_name: Name of the skill
-        skill_category: Category of the skill
-        level: Initial skill level (1-10)
-        description: Description of the skill
-        metadata_uri: URI to metadata
+        fn: Blocking callable, e.g. ``transaction.execute``
+        *args: Positional arguments for ``fn``
         
     Returns:
-        TransactionResult with success status and details
+        Whatever ``fn`` returns
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="SkillToken contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters - match the actual ABI signature
-        # mintSkillToken(address recipient, string skillName, string skillCategory, uint8 level, string description, string metadataUri)
-        params = ContractFunctionParameters()
-        params.addAddress(recipient_address)
-        params.addString(skill_name)
-        params.addString(skill_category)
-        params.addUint8(level)
-        params.addString(description)
-        params.addString(metadata_uri)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(300000)  # Adjust gas as needed
-        transaction.setFunction("mintSkillToken", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            # Get the transaction record to extract token ID from logs
-            record = response.getRecord(client)
-            
-            # Extract token ID from contract function result
-            function_result = record.contractFunctionResult
-            token_id = None
-            if function_result and function_result.getUint256(0):
-                token_id = str(function_result.getUint256(0))
-            
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed,
-                contract_address=contract_address,
-                token_id=token_id
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to create skill token: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HEDERA_EXECUTOR, partial(fn, *args))
 
 
-async def add_skill_experience(
-    token_id: str,
-    experience_points: int
-) -> TransactionResult:
+# Receipt poll schedule, aligned with Hedera's ~3s consensus: 2s, 3s, 4.5s, then 5s
+_RECEIPT_FIRST_POLL = 2.0
+_RECEIPT_MAX_POLL = 5.0
+
+
+async def _await_receipt(
+    response: TransactionResponse,
+    client: Client,
+    timeout: float = 60.0
+) -> TransactionReceipt:
     """
-    Add experience points to a skill token.
+    Wait for a transaction receipt without blocking the event loop.
+    
+    Each poll is a single receipt query attempt. The first poll waits
+    ``_RECEIPT_FIRST_POLL`` seconds, since no receipt exists before consensus
+    (typically 2-3s) is reached; later waits back off up to
+    ``_RECEIPT_MAX_POLL``.
     
     Args:
-        token_id: ID of the skill token
-        experience_points: Experience points to add
+        response: Transaction response from ``execute``
+        client: Hedera client
+        timeout: Seconds to keep polling before giving up
         
     Returns:
-        TransactionResult with success status and details
+        Transaction receipt
+        
+    Raises:
+        Exception: The last polling error once the timeout is exhausted
     """
-    try:
-        # For now, this is a placeholder since the contract doesn't have this function
-        # In a real implementation, this would call a contract function
-        logger.info(f"Adding {experience_points} experience points to token {token_id}")
+    deadline = time.monotonic() + timeout
+    query = response.getReceiptQuery().setMaxAttempts(1)
+    delay = _RECEIPT_FIRST_POLL
+    
+    while True:
+        await asyncio.sleep(delay)
+        try:
+            return await _exec(query.execute, client)
+        except Exception:
+            if time.monotonic() + delay >= deadline:
+                raise
+            delay = min(_RECEIPT_MAX_POLL, delay * 1.5)
+
+
+async def _mirror_confirm(transaction_id: str, timeout: float = 60.0) -> Any:
+    """
+    Poll the mirror node until it reports the outcome of a transaction.
+    
+    Args:
+        transaction_id: Transaction ID in SDK form (``0.0.x@seconds.nanos``)
+        timeout: Seconds to keep polling before giving up
         
-        return TransactionResult(
-            success=True,
-            transaction_id=f"exp_{token_id}_{int(datetime.now().timestamp())}",
-            gas_used=0
-        )
+    Returns:
+        Status.Success, or the mirror node's result code for a failed transaction
         
-    except Exception as e:
-        logger.error(f"Failed to add skill experience: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    Raises:
+        TimeoutError: If the mirror node has not seen the transaction in time
+    """
+    account_id, _, valid_start = transaction_id.partition('@')
+    url = (
+        f"{get_settings().hedera_mirror_node_url.rstrip('/')}/api/v1/transactions/"
+        f"{account_id}-{valid_start.replace('.', '-')}"
+    )
+    deadline = time.monotonic() + timeout
+    
+    while time.monotonic() < deadline:
+        await asyncio.sleep(1.0)
+        try:
+            response = await _get_http_client().get(url)
+            if response.status_code == 404:
+                continue
+            response.raise_for_status()
+            transactions = response.json().get('transactions') or []
+        except (httpx.HTTPError, ValueError):
+            continue
+        
+        if transactions:
+            result = transactions[0].get('result')
+            return _SUCCESS if result == 'SUCCESS' else result
+    
+    raise TimeoutError(f"Transaction {transaction_id} not found on mirror node")
 
 
-async def update_skill_level(
-    token_id: str,
-    new_level: int,
-    new_metadata_uri: str = ""
-) -> TransactionResult:
+async def _await_confirmation(
+    response: TransactionResponse,
+    client: Client,
+    timeout: float = 60.0
+) -> Any:
     """
-    Update skill token level using the SkillToken smart contract.
+    Wait for a transaction's status from whichever channel reports it first.
+    
+    The receipt poll and a mirror node lookup race each other; the loser is
+    cancelled. Use this when only the status is needed, not the receipt.
     
     Args:
-        token_id: ID of the skill token to update
-        new_level: New skill level (1-10)
-        new_metadata_uri: New metadata URI
+        response: Transaction response from ``execute``
+        client: Hedera client
+        timeout: Seconds each channel keeps polling before giving up
         
     Returns:
-        TransactionResult with success status and details
+        Status.Success, or the failing status
+        
+    Raises:
+        Exception: The receipt polling error if neither channel confirmed
     """
+    receipt_task = asyncio.create_task(_await_receipt(response, client, timeout))
+    mirror_task = asyncio.create_task(_mirror_confirm(response.transactionId.toString(), timeout))
+    pending = {receipt_task, mirror_task}
+    
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="SkillToken contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters - match the actual ABI signature
-        # updateSkillLevel(uint256 tokenId, uint8 newLevel, string newMetadataUri)
-        params = ContractFunctionParameters()
-        params.addUint256(int(token_id))
-        params.addUint8(new_level)
-        params.addString(new_metadata_uri)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)  # Adjust gas as needed
-        transaction.setFunction("updateSkillLevel", params)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if receipt_task in done and receipt_task.exception() is None:
+                return receipt_task.result().status
+            if mirror_task in done and mirror_task.exception() is None:
+                return mirror_task.result()
+        # Both channels failed; the receipt error names the status
+        raise receipt_task.exception() or RuntimeError("Transaction was not confirmed")
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+# =============================================================================
+# GAS TELEMETRY
+# =============================================================================
+
+# Rolling gasUsed samples per (contract, function)
+_GAS_WINDOW = 256
+_GAS_MIN_SAMPLES = 32
+_GAS_SAMPLES: Dict[Tuple[str, str], deque] = {}
+
+
+def _record_gas(contract_name: str, function_name: str, gas_used: Optional[int]) -> None:
+    """Record the gas used by a successful contract call."""
+    if not gas_used:
+        return
+    
+    samples = _GAS_SAMPLES.get((contract_name, function_name))
+    if samples is None:
+        samples = _GAS_SAMPLES[(contract_name, function_name)] = deque(maxlen=_GAS_WINDOW)
+    samples.append(int(gas_used))
+
+
+def _estimate_gas(contract_name: str, function_name: str, default: int) -> int:
+    """
+    Get a gas limit for a contract call from recently observed usage.
+    
+    Args:
+        contract_name: Contract name
+        function_name: Contract function name
+        default: Hardcoded limit, used until enough samples exist
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+    Returns:
+        p95 of recent gasUsed plus 10% headroom, never above ``default``
+    """
+    samples = _GAS_SAMPLES.get((contract_name, function_name))
+    if samples is None or len(samples) < _GAS_MIN_SAMPLES:
+        return default
+    
+    window = sorted(samples)
+    return min(int(window[int(0.95 * len(window))] * 1.1), default)
+
+
+def _reset_gas(contract_name: str, function_name: str) -> bool:
+    """
+    Drop the gas samples of a call that ran out of gas.
+    
+    Samples only come from successful calls, so without this an estimate that
+    is too low for a costlier state would never recover. The call falls back
+    to its hardcoded limit until enough new samples exist.
+    
+    Returns:
+        Whether the dropped samples were setting the call's gas limit
+    """
+    samples = _GAS_SAMPLES.pop((contract_name, function_name), None)
+    return samples is not None and len(samples) >= _GAS_MIN_SAMPLES
+
+
+# =============================================================================
+# TRANSACTION RESULTS
+# =============================================================================
+
+def _result(
+    status: Any,
+    response: TransactionResponse,
+    contract_address: Optional[str] = None,
+    gas_used: Optional[int] = 0,
+    token_id: Optional[str] = None,
+    gas_key: Optional[Tuple[str, str]] = None
+) -> TransactionResult:
+    """
+    Build the TransactionResult for an executed contract transaction.
+    
+    Args:
+        status: Receipt status of the transaction
+        response: Transaction response from ``execute``
+        contract_address: Address of the called contract
+        gas_used: Gas used by the call
+        token_id: Id returned by the call, if any
+        gas_key: (contract, function) to record gas usage under on success,
+            and to reset on INSUFFICIENT_GAS
         
-        if receipt.status == Status.Success:
-            record = response.getRecord(client)
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed if record else 0
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to update skill level: {str(e)}")
+    Returns:
+        TransactionResult reflecting the receipt status
+    """
+    if status != _SUCCESS:
+        if gas_key is not None and str(status) == 'INSUFFICIENT_GAS':
+            _reset_gas(*gas_key)
         return TransactionResult(
             success=False,
-            error=str(e)
+            error=f"Transaction failed with status: {status}"
         )
+    
+    if gas_key is not None:
+        _record_gas(*gas_key, gas_used)
+    
+    return TransactionResult(
+        success=True,
+        transaction_id=response.transactionId.toString(),
+        gas_used=gas_used,
+        contract_address=contract_address,
+        token_id=token_id
+    )
 
 
-async def create_job_pool(
-    title: str,
-    description: str,
-    required_skills: List[Dict[str, Any]],
-    stake_amount: float,
-    duration_days: int
-) -> TransactionResult:
+async def _finalize(
+    response: TransactionResponse,
+    client: Client,
+    contract_address: Optional[str] = None,
+    gas_key: Optional[Tuple[str, str]] = None,
+    status: Any = None
+) -> Tuple[TransactionResult, Optional[TransactionRecord]]:
     """
-    Create a job pool using the TalentPool smart contract.
+    Wait for a submitted contract transaction and build its result.
+    
+    The record is only fetched, once, when the transaction succeeded.
     
     Args:
-        title: Job pool title
-        description: Job pool description
-        required_skills: List of required skills
-        stake_amount: Stake amount in HBAR
-        duration_days: Duration of the pool in days
+        response: Transaction response from ``execute``
+        client: Client the transaction was executed with
+        contract_address: Address of the called contract
+        gas_key: (contract, function) to record gas usage under on success
+        status: Status already confirmed by the caller, if any
         
     Returns:
-        TransactionResult with success status and details
+        Tuple of the TransactionResult and the transaction record, which is
+        None unless the transaction succeeded
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        talent_pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = talent_pool_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="TalentPool contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare JobPoolRequest struct according to the ABI
-        # struct JobPoolRequest {
-        #     string title;
-        #     string description;
-        #     uint256[] requiredSkills;
-        #     uint256 minReputation;
-        #     uint256 stakeAmount;
-        #     uint256 durationDays;
-        #     uint256 maxApplicants;
-        #     uint256 applicationDeadline;
-        # }
-        
-        # Convert required skills to skill IDs (simplified)
-        skill_ids = [hash(skill.get('name', '')) % 1000000 for skill in required_skills]
-        
-        # Calculate application deadline
-        application_deadline = int(datetime.now().timestamp()) + (duration_days * 24 * 60 * 60)
-        
-        params = ContractFunctionParameters()
-        
-        # Add the JobPoolRequest struct as a tuple
-        params.addString(title)  # title
-        params.addString(description)  # description
-        params.addUint256Array(skill_ids)  # requiredSkills
-        params.addUint256(0)  # minReputation (default to 0)
-        params.addUint256(int(stake_amount * 100_000_000))  # stakeAmount in tinybars
-        params.addUint256(duration_days)  # durationDays
-        params.addUint256(100)  # maxApplicants (default to 100)
-        params.addUint256(application_deadline)  # applicationDeadline
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(500000)  # Adjust gas as needed
-        transaction.setFunction("createJobPool", params)
-        
-        # Set payable amount
-        transaction.setPayableAmount(Hbar.fromTinybars(int(stake_amount * 100_000_000)))
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+    if status is None:
+        status = await _await_confirmation(response, client)
+    if status != _SUCCESS:
+        return _result(status, response, gas_key=gas_key), None
+    
+    record = await _exec(response.getRecord, client)
+    gas_used = record.gasUsed if record else 0
+    return _result(status, response, contract_address, gas_used, gas_key=gas_key), record
+
+
+def _combine_results(
+    results: List[TransactionResult],
+    contract_address: Optional[str] = None
+) -> TransactionResult:
+    """
+    Fold the results of several transactions into one.
+    
+    Results sharing a transaction (an atomic batch) are counted once.
+    
+    Args:
+        results: Per-transaction results
+        contract_address: Address to report on the combined result
         
-        if receipt.status == Status.Success:
-            # Get pool ID from contract function result
-            record = response.getRecord(client)
-            pool_id = None
-            if record and record.contractFunctionResult:
-                try:
-                    pool_id = str(record.contractFunctionResult.getUint256(0))
-                except:
-                    pool_id = f"pool_{int(datetime.now().timestamp())}"
-            
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed if record else 0,
-                contract_address=contract_address,
-                pool_id=pool_id
-            )
+    Returns:
+        TransactionResult that succeeds only if all results did; transaction_id
+        lists the comma-separated transactions
+    """
+    succeeded: Dict[Optional[str], TransactionResult] = {}
+    errors: Dict[str, None] = {}
+    for result in results:
+        if result.success:
+            succeeded.setdefault(result.transaction_id, result)
         else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to create job pool: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+            errors.setdefault(result.error or "Transaction failed")
+    
+    return TransactionResult(
+        success=not errors,
+        transaction_id=",".join(filter(None, succeeded)) or None,
+        error="; ".join(errors) or None,
+        gas_used=sum(result.gas_used or 0 for result in succeeded.values()),
+        contract_address=contract_address
+    )
 
 
-async def apply_to_pool(
-    pool_id: int,
-    skill_token_ids: List[int],
-    cover_letter: str = ""
-) -> TransactionResult:
+def _returned_id(record: TransactionRecord, fallback_prefix: str) -> Optional[str]:
     """
-    Apply to a job pool using the TalentPool smart contract.
+    Read the uint256 id returned by a contract call from its record.
     
     Args:
-        pool_id: ID of the job pool
-        skill_token_ids: List of skill token IDs
-        cover_letter: Cover letter for the application
+        record: Transaction record
+        fallback_prefix: Prefix for a timestamp-based id if the result cannot be parsed
         
     Returns:
-        TransactionResult with success status and details
+        The returned id, or None if the record has no function result
     """
+    if not record.contractFunctionResult:
+        return None
+    
     try:
-        # For now, this is a placeholder since the contract doesn't have this function
-        # In a real implementation, this would call a contract function
-        logger.info(f"Applying to pool {pool_id} with skills {skill_token_ids}")
-        
-        return TransactionResult(
-            success=True,
-            transaction_id=f"apply_{pool_id}_{int(datetime.now().timestamp())}",
-            gas_used=0
-        )
-        
-    except Exception as e:
-        logger.error(f"Failed to apply to pool: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        return str(record.contractFunctionResult.getUint256(0))
+    except Exception:
+        return f"{fallback_prefix}_{time.time_ns() // 1_000_000_000}"
 
 
-async def make_pool_match(
-    pool_id: int,
-    candidate_address: str,
-    match_score: int
-) -> TransactionResult:
+# =============================================================================
+# TRANSACTION BATCHING
+# =============================================================================
+
+def build_contract_transaction(
+    contract_name: str,
+    function_name: str,
+    params: Optional[ContractFunctionParameters] = None,
+    gas: int = 200000
+) -> Optional[ContractExecuteTransaction]:
     """
-    Make a pool match using the TalentPool smart contract.
+    Build an unsubmitted contract transaction, e.g. for batch_submit.
     
     Args:
-        pool_id: ID of the job pool
-        candidate_address: Address of the matched candidate
-        match_score: Match score for the candidate
+        contract_name: Contract name as listed in the deployment config
+        function_name: Contract function to call
+        params: Function parameters, if any
+        gas: Gas limit
         
     Returns:
-        TransactionResult with success status and details
+        ContractExecuteTransaction, or None if the contract is not deployed
     """
+    contract_id = _get_contract_id(contract_name)
+    if contract_id is None:
+        return None
+    
+    transaction = ContractExecuteTransaction()
+    transaction.setContractId(contract_id)
+    transaction.setGas(gas)
+    if params is None:
+        transaction.setFunction(function_name)
+    else:
+        transaction.setFunction(function_name, params)
+    
+    return transaction
+
+
+async def _submit_transaction(transaction: Transaction) -> TransactionResult:
+    """Submit a single transaction and wait for its receipt."""
     try:
-        # For now, this is a placeholder since the contract doesn't have this function
-        # In a real implementation, this would call a contract function
-        logger.info(f"Making match for pool {pool_id} with candidate {candidate_address}")
-        
-        return TransactionResult(
-            success=True,
-            transaction_id=f"match_{pool_id}_{int(datetime.now().timestamp())}",
-            gas_used=0
-        )
-        
+        client = _client_pool.acquire()
+        response = await _exec(transaction.execute, client)
+        receipt = await _await_receipt(response, client)
+        return _result(receipt.status, response)
     except Exception as e:
-        logger.error(f"Failed to make pool match: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        logger.error("Failed to submit transaction: %s", e)
+        return TransactionResult(success=False, error=str(e))
 
 
-async def get_job_pool_info(pool_id: int) -> Optional[Dict[str, Any]]:
+async def batch_submit(transactions: List[Transaction]) -> List[TransactionResult]:
     """
-    Get job pool information from the TalentPool smart contract.
+    Submit several transactions in one HIP-551 atomic batch.
+    
+    All inner transactions succeed or fail together in a single consensus
+    round-trip. With an SDK build that predates BatchTransaction they are
+    submitted one at a time, in order, stopping at the first failure; the
+    writes before it are not rolled back, and the ones after it are reported
+    as not submitted.
     
     Args:
-        pool_id: ID of the job pool
+        transactions: Unsubmitted transactions, e.g. from build_contract_transaction
         
     Returns:
-        Job pool information if found, None otherwise
+        One TransactionResult per transaction, in order
     """
+    if not transactions:
+        return []
+    
+    batch_transaction_cls = getattr(hedera, 'BatchTransaction', None)
+    if batch_transaction_cls is None:
+        results: List[TransactionResult] = []
+        for transaction in transactions:
+            result = await _submit_transaction(transaction)
+            results.append(result)
+            if not result.success:
+                break
+        
+        skipped = TransactionResult(
+            success=False,
+            error="Not submitted: an earlier transaction in the batch failed"
+        )
+        return results + [replace(skipped) for _ in transactions[len(results):]]
+    
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+        client = _client_pool.acquire()
+        batch_key = client.getOperatorPublicKey()
         
-        # Get TalentPool contract info
-        talent_pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = talent_pool_config.get('address')
+        batch = batch_transaction_cls()
+        for transaction in transactions:
+            batch.addInnerTransaction(transaction.batchify(client, batch_key))
         
-        if not contract_address:
-            logger.warning("TalentPool contract not deployed")
-            return None
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getJobPool(uint256 poolId)
-        params = ContractFunctionParameters()
-        params.addUint256(pool_id)
-        
-        # Query contract function
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(200000)
-        query.setFunction("getJobPool", params)
-        
-        # Execute query
-        response = query.execute(client)
-        result = response.getFunctionResult()
-        
-        if result:
-            # Parse the JobPool struct returned
-            # struct JobPool {
-            #     uint256 id;
-            #     address company;
-            #     string title;
-            #     string description;
-            #     uint256[] requiredSkills;
-            #     uint256 minReputation;
-            #     uint256 stakeAmount;
-            #     uint256 durationDays;
-            #     uint256 maxApplicants;
-            #     uint256 applicationDeadline;
-            #     enum PoolStatus status;
-            #     uint256 createdAt;
-            # }
-            
-            try:
-                id = result.getUint256(0)
-                company = result.getAddress(1)
-                title = result.getString(2)
-                description = result.getString(3)
-                # requiredSkills array would need special parsing
-                min_reputation = result.getUint256(5)
-                stake_amount = result.getUint256(6)
-                duration_days = result.getUint256(7)
-                max_applicants = result.getUint256(8)
-                application_deadline = result.getUint256(9)
-                status = result.getUint8(10)  # enum as uint8
-                created_at = result.getUint256(11)
-                
-                # Convert status enum
-                status_map = {0: "active", 1: "closed", 2: "completed", 3: "cancelled"}
-                status_str = status_map.get(status, "unknown")
-                
-                return {
-                    'id': pool_id,
-                    'company': company,
-                    'title': title,
-                    'description': description,
-                    'min_reputation': min_reputation,
-                    'stake_amount': float(stake_amount) / 100_000_000,  # Convert from tinybars to HBAR
-                    'duration_days': duration_days,
-                    'max_applicants': max_applicants,
-                    'application_deadline': application_deadline,
-                    'status': status_str,
-                    'created_at': created_at
-                }
-            except Exception as parse_error:
-                logger.error(f"Failed to parse job pool data: {parse_error}")
-                return None
-        
-        return None
+        response = await _exec(batch.execute, client)
+        receipt = await _await_receipt(response, client)
+        result = _result(receipt.status, response)
         
     except Exception as e:
-        logger.error(f"Failed to get job pool info: {str(e)}")
-        return None
+        logger.error("Failed to submit transaction batch: %s", e)
+        result = TransactionResult(success=False, error=str(e))
+    
+    return [replace(result) for _ in transactions]
 
 
-async def submit_hcs_message(topic_id: str, message: str) -> TransactionResult:
+# =============================================================================
+# CONTRACT WRITE DISPATCH
+# =============================================================================
+
+# ContractFunctionParameters adder for each Solidity parameter type
+_PARAM_ADDERS: Dict[str, str] = {
+    "address": "addAddress",
+    "address[]": "addAddressArray",
+    "bool": "addBool",
+    "bool[]": "addBoolArray",
+    "bytes": "addBytes",
+    "string": "addString",
+    "string[]": "addStringArray",
+    "uint8": "addUint8",
+    "uint8[]": "addUint8Array",
+    "uint64": "addUint64",
+    "uint256": "addUint256",
+    "uint256[]": "addUint256Array",
+}
+
+# Scalar integer types; IDs arrive as strings from the API layer
+_INT_PARAM_TYPES = frozenset(("uint8", "uint64", "uint256"))
+
+# Non-array types whose encoded size, and so storage gas, grows with the value
+_DYNAMIC_PARAM_TYPES = frozenset(("string", "bytes"))
+
+# Contract, parameter types and maximum gas of each write routed through _execute_contract_call
+_CONTRACT_METHODS: Dict[str, Tuple[str, Tuple[str, ...], int]] = {
+    "registerOracle": ("ReputationOracle", ("string", "string[]"), 200000),
+    "submitWorkEvaluation": (
+        "ReputationOracle",
+        ("address", "uint256[]", "string", "string", "uint8", "uint8[]", "string", "string"),
+        300000
+    ),
+    "resolveChallenge": ("ReputationOracle", ("uint256", "bool", "string"), 200000),
+    "slashOracle": ("ReputationOracle", ("address", "uint256", "string"), 200000),
+    "withdrawOracleStake": ("ReputationOracle", (), 200000),
+    "updateOracleStatus": ("ReputationOracle", ("address", "bool", "string"), 200000),
+    "updateOracleStatusBatch": ("ReputationOracle", ("address[]", "bool[]", "string[]"), 200000),
+    "endorseSkillToken": ("SkillToken", ("uint256", "string"), 200000),
+    "renewSkillToken": ("SkillToken", ("uint256", "uint64"), 200000),
+    "revokeSkillToken": ("SkillToken", ("uint256", "string"), 200000),
+    "markExpiredTokens": ("SkillToken", ("uint256[]",), 300000),
+    "selectCandidate": ("TalentPool", ("uint256", "address"), 200000),
+    "completePool": ("TalentPool", ("uint256",), 200000),
+    "closePool": ("TalentPool", ("uint256",), 200000),
+    "withdrawApplication": ("TalentPool", ("uint256",), 200000),
+    "queueProposal": ("Governance", ("uint256",), 200000),
+    "executeProposal": ("Governance", ("uint256",), 300000),
+    "cancelProposal": ("Governance", ("uint256",), 200000),
+    "castVoteWithSignature": ("Governance", ("uint256", "uint8", "string", "bytes"), 250000),
+    "batchExecuteProposals": ("Governance", ("uint256[]",), 500000),  # Higher gas for batch operation
+}
+
+# Extra gas per element of the first array argument, for batch writes whose
+# cost grows with the batch rather than fitting a fixed limit
+_PER_ITEM_GAS: Dict[str, int] = {
+    "updateOracleStatusBatch": 50000,
+}
+
+
+@lru_cache(maxsize=None)
+def _param_plan(function_name: str) -> Tuple[Tuple[Tuple[str, bool], ...], bool]:
+    """
+    Resolve how to add each parameter of a dispatched write, once per function.
+    
+    Returns:
+        Tuple of (adder method name, coerce to int) per parameter, and whether
+        any parameter is dynamically sized (an array, string or bytes)
     """
-    Submit a message to HCS topic.
+    param_types = _CONTRACT_METHODS[function_name][1]
+    adders = tuple((_PARAM_ADDERS[param_type], param_type in _INT_PARAM_TYPES) for param_type in param_types)
+    has_dynamic = any(
+        param_type in _DYNAMIC_PARAM_TYPES or param_type.endswith('[]') for param_type in param_types
+    )
+    return adders, has_dynamic
+
+
+def _build_contract_call(
+    function_name: str,
+    args: Tuple[Any, ...] = ()
+) -> Tuple[Optional[str], Optional[ContractExecuteTransaction]]:
+    """
+    Build the unsubmitted transaction for a write listed in ``_CONTRACT_METHODS``.
     
     Args:
-        topic_id: HCS topic ID
-        message: Message to submit
+        function_name: Contract function to call
+        args: Arguments in the order of the function's parameter types
         
     Returns:
-        TransactionResult with success status and details
+        Tuple of the contract address and the transaction; both are None if
+        the contract is not deployed
     """
-    try:
-        client = get_hedera_client()
-        
-        # Parse topic ID
-        topic = TopicId.fromString(topic_id)
-        
-        # Create and submit message
-        transaction = TopicMessageSubmitTransaction()
-        transaction.setTopicId(topic)
-        transaction.setMessage(message)
-        
-        # Execute transaction
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to submit HCS message: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    contract_name, _, gas = _CONTRACT_METHODS[function_name]
+    contract_address, contract_id = _resolve_contract(contract_name)
+    if contract_id is None:
+        return None, None
+    
+    adders, has_dynamic = _param_plan(function_name)
+    params = ContractFunctionParameters()
+    for (adder, is_int), arg in zip(adders, args):
+        getattr(params, adder)(int(arg) if is_int else arg)
+    
+    # Gas for array, string and bytes arguments grows with their length, so
+    # past samples don't bound it
+    if not has_dynamic:
+        gas = _estimate_gas(contract_name, function_name, gas)
+    elif function_name in _PER_ITEM_GAS:
+        gas += _PER_ITEM_GAS[function_name] * len(args[0])
+    
+    transaction = ContractExecuteTransaction()
+    transaction.setContractId(contract_id)
+    transaction.setGas(gas)
+    transaction.setFunction(function_name, params)
+    
+    return contract_address, transaction
 
 
-async def create_nft_token(
-    name: str,
-    symbol: str,
-    metadata: Dict[str, Any]
-) -> TransactionResult:
+# Writes that succeeded in the last few seconds; an identical repeat (a double
+# click on "Execute Proposal") gets the first result instead of a second transaction
+_RECENT_WRITES = _TTLCache(maxsize=1024, ttl=10.0)
+
+
+def _write_key(function_name: str, args: Tuple[Any, ...]) -> Tuple[str, str]:
+    """Key identifying a dispatched write for coalescing and ``_RECENT_WRITES``."""
+    return ("write", repr((function_name, args)))
+
+
+async def _execute_contract_call(
+    function_name: str,
+    args: Tuple[Any, ...] = ()
+) -> Tuple[TransactionResult, Optional[TransactionRecord]]:
     """
-    Create an NFT token on Hedera.
+    Execute a contract write listed in ``_CONTRACT_METHODS``.
+    
+    Identical concurrent writes share one transaction, and a repeat within
+    10 seconds of a successful write returns that write's result.
     
     Args:
-        name: Token name
-        symbol: Token symbol
-        metadata: Token metadata
+        function_name: Contract function to call
+        args: Arguments in the order of the function's parameter types
         
     Returns:
-        TransactionResult with success status and details
+        Tuple of the TransactionResult and the transaction record, which is
+        None unless the transaction succeeded
+    """
+    key = _write_key(function_name, args)
+    recent: Optional[Tuple[TransactionResult, Optional[TransactionRecord]]] = _RECENT_WRITES.get(key)
+    if recent is not None:
+        return recent
+    
+    outcome: Tuple[TransactionResult, Optional[TransactionRecord]] = await _coalesced(
+        key, partial(_submit_contract_call, function_name, args)
+    )
+    if outcome[0].success:
+        _RECENT_WRITES.set(key, outcome)
+    return outcome
+
+
+# Statuses for which the network shed the transaction under load without
+# executing it, so resubmitting cannot apply the write twice
+_RETRYABLE_STATUSES = frozenset(("BUSY", "PLATFORM_TRANSACTION_NOT_CREATED", "THROTTLED_AT_CONSENSUS"))
+_WRITE_RETRIES = 4
+
+
+async def _submit_contract_call(
+    function_name: str,
+    args: Tuple[Any, ...]
+) -> Tuple[TransactionResult, Optional[TransactionRecord]]:
+    """
+    Build, submit and confirm a dispatched contract write.
+    
+    Transactions shed with a status in ``_RETRYABLE_STATUSES`` are resubmitted
+    up to ``_WRITE_RETRIES`` times with jittered exponential backoff. A write
+    that ran out of an estimated gas limit is resubmitted once with the
+    function's default limit.
     """
+    contract_name = _CONTRACT_METHODS[function_name][0]
+    
     try:
-        client = get_hedera_client()
-        
-        # Create token
-        transaction = TokenCreateTransaction()
-        transaction.setTokenName(name)
-        transaction.setTokenSymbol(symbol)
-        transaction.setTokenType(TokenType.NON_FUNGIBLE_UNIQUE)
-        transaction.setSupplyType(TokenSupplyType.FINITE)
-        transaction.setMaxSupply(1000000)
+        client = _client_pool.acquire()
         
-        # Set treasury and keys
-        operator_id = client.getOperatorAccountId()
-        transaction.setTreasuryAccountId(operator_id)
+        for attempt in range(_WRITE_RETRIES + 1):
+            # Rebuilt per attempt so each submission gets a fresh transaction ID
+            contract_address, transaction = _build_contract_call(function_name, args)
+            
+            if transaction is None:
+                return TransactionResult(
+                    success=False,
+                    error=f"{contract_name} contract not deployed"
+                ), None
+            
+            try:
+                response = await _exec(transaction.execute, client)
+                status = await _await_confirmation(response, client)
+            except Exception as e:
+                # Precheck rejections surface as SDK exceptions naming the status
+                if attempt == _WRITE_RETRIES or not any(name in str(e) for name in _RETRYABLE_STATUSES):
+                    raise
+            else:
+                # The reverted attempt applied nothing, so it is safe to resubmit
+                if (
+                    str(status) == 'INSUFFICIENT_GAS'
+                    and attempt < _WRITE_RETRIES
+                    and _reset_gas(contract_name, function_name)
+                ):
+                    continue
+                if attempt == _WRITE_RETRIES or str(status) not in _RETRYABLE_STATUSES:
+                    return await _finalize(
+                        response, client, contract_address, (contract_name, function_name), status
+                    )
+            
+            await asyncio.sleep(min(0.1 * 2 ** attempt + random.random() * 0.1, 2.0))
         
-        # Execute transaction
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        # Not reached: the last attempt always returns or raises
+        raise RuntimeError(f"{function_name} retries exhausted")
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed,
-                contract_address=str(receipt.tokenId)
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Token creation failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to create NFT token: {str(e)}")
+        logger.error("Failed to execute %s.%s: %s", contract_name, function_name, e)
         return TransactionResult(
             success=False,
             error=str(e)
-        )
+        ), None
 
 
-async def mint_nft(
-    token_id: str,
-    metadata_uri: str,
-    recipient_id: str
-) -> TransactionResult:
+async def batch_pool_actions(actions: List[PoolAction]) -> TransactionResult:
     """
-    Mint an NFT to a recipient.
+    Submit several TalentPool writes as one HIP-551 atomic batch.
+    
+    Without BatchTransaction support the writes run in order and stop at the
+    first failure, without rolling back the ones before it (see batch_submit).
     
     Args:
-        token_id: Token ID
-        metadata_uri: Metadata URI
-        recipient_id: Recipient account ID
+        actions: TalentPool writes, e.g. selectCandidate followed by completePool
         
     Returns:
-        TransactionResult with success status and details
+        TransactionResult that succeeds only if every action succeeded
     """
     try:
-        client = get_hedera_client()
-        
-        # Parse token and recipient IDs
-        token = TokenId.fromString(token_id)
-        recipient = AccountId.fromString(recipient_id)
-        
-        # Mint NFT
-        transaction = TokenMintTransaction()
-        transaction.setTokenId(token)
-        transaction.addMetadata(metadata_uri.encode('utf-8'))
-        
-        # Execute transaction
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        contract_address = None
+        transactions = []
+        for action in actions:
+            if _CONTRACT_METHODS[action.function][0] != 'TalentPool':
+                raise ValueError(f"Not a TalentPool action: {action.function}")
+            contract_address, transaction = _build_contract_call(action.function, action.args)
+            if transaction is None:
+                return TransactionResult(
+                    success=False,
+                    error="TalentPool contract not deployed"
+                )
+            transactions.append(transaction)
+        
+        results = await batch_submit(transactions)
+        result = _combine_results(results, contract_address)
+        for action, action_result in zip(actions, results):
+            if action_result.success:
+                invalidate_pool_cache(action.args[0] if action.args else None)
+        return result
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"NFT minting failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to mint NFT: {str(e)}")
+        logger.error("Failed to submit pool action batch: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def get_skill_token_info(token_id: str) -> Optional[SkillTokenData]:
+# =============================================================================
+# ABI ENCODING AND BATCHED READS
+# =============================================================================
+
+# Shared HTTP client for the JSON-RPC relay and mirror node, created on first use
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
     """
-    Get skill token information from the smart contract.
+    Get the shared async HTTP client used for relay and mirror node calls.
+    
+    HTTP/2 lets concurrent reads to the same host share one TLS connection
+    instead of churning through HTTP/1.1 connections.
+    """
+    global _http_client
+    
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(10.0, connect=2.0)
+        )
+    
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, e.g. on application shutdown."""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _json_rpc_url() -> str:
+    """Get the JSON-RPC relay endpoint for the configured network."""
+    return f"{get_network_config()['rpcUrl'].rstrip('/')}/api"
+
+
+@lru_cache(maxsize=1024)
+def _to_evm_address(address: str) -> str:
+    """
+    Convert a Hedera entity ID to its long-zero EVM address.
+    
+    Memoized, since the same contract and user addresses are converted on
+    every read that targets them.
     
     Args:
-        token_id: ID of the skill token
+        address: Hedera ID (``shard.realm.num``) or 0x-prefixed EVM address
         
     Returns:
-        SkillTokenData if found, None otherwise
+        Lower-case 0x-prefixed EVM address
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            logger.warning("SkillToken contract not deployed")
-            return None
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+    if address.startswith('0x'):
+        return address.lower()
+    
+    shard, realm, num = (int(part) for part in address.split('.'))
+    return f"0x{shard:08x}{realm:016x}{num:016x}"
+
+
+def _encode_calldatas(
+    calldatas: Sequence[Union[str, bytes, bytearray]]
+) -> List[Union[bytes, bytearray]]:
+    """
+    Convert proposal call payloads to bytes for ``addBytesArray``.
+    
+    Already-encoded payloads pass through untouched and 0x-prefixed hex is
+    decoded directly; anything else is treated as UTF-8 text.
+    
+    Args:
+        calldatas: Call payloads as bytes, hex strings or text
         
-        # Prepare function parameters
-        params = ContractFunctionParameters()
-        params.addUint256(int(token_id))
-        
-        # Query contract function - getSkillData(uint256 tokenId)
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getSkillData", params)
-        
-        # Execute query
-        response = query.execute(client)
-        result = response.getFunctionResult()
-        
-        if result:
-            # Parse the SkillData struct returned
-            # struct SkillData {
-            #     string skillName;
-            #     string skillCategory;
-            #     uint8 level;
-            #     string description;
-            #     string metadataUri;
-            #     uint64 createdAt;
-            #     uint64 expiryDate;
-            # }
-            
-            skill_name = result.getString(0)
-            skill_category = result.getString(1)
-            level = result.getUint8(2)
-            description = result.getString(3)
-            metadata_uri = result.getString(4)
-            created_at = result.getUint64(5)
-            expiry_date = result.getUint64(6)
-            
-            # Convert category string to enum
-            try:
-                category_enum = SkillCategory(skill_category.lower())
-            except ValueError:
-                category_enum = SkillCategory.OTHER
-            
-            return SkillTokenData(
-                token_id=token_id,
-                skill_name=skill_name,
-                skill_category=category_enum,
-                level=level,
-                description=description,
-                metadata_uri=metadata_uri,
-                owner_address="",  # We'd need to call ownerOf separately
-                created_at=datetime.fromtimestamp(created_at, timezone.utc),
-                expiry_date=datetime.fromtimestamp(expiry_date, timezone.utc) if expiry_date > 0 else None
-            )
-        
-        return None
+    Returns:
+        List of byte payloads
+    """
+    encoded: List[Union[bytes, bytearray]] = []
+    for data in calldatas:
+        if isinstance(data, (bytes, bytearray)):
+            encoded.append(data)
+        elif data.startswith('0x'):
+            encoded.append(bytes.fromhex(data[2:]))
+        else:
+            encoded.append(data.encode('utf-8'))
+    return encoded
+
+
+# Selectors for the signatures this module encodes itself, hashed once at import
+_SELECTORS: Dict[str, bytes] = {
+    signature: keccak(signature.encode())[:4]
+    for signature in (
+        "getReputationScore(address)",
+        "getOraclePerformance(address)",
+        "getSkillEndorsements(uint256)",
+        "getQuorum()",
+        "getVotingDelay()",
+        "getVotingPeriod()",
+        "getProposalThreshold()",
+        "getProposalStatus(uint256)",
+        "hasVoted(uint256,address)",
+        "canExecute(uint256)",
+        "getVoteReceipt(uint256,address)",
+        "getPoolMetrics(uint256)",
+        "getGlobalStats()",
+        "getActivePoolsCount()",
+        "getTotalPoolsCount()",
+    )
+}
+
+
+def _function_selector(signature: str) -> bytes:
+    """Get the 4-byte selector for a Solidity function signature."""
+    selector = _SELECTORS.get(signature)
+    if selector is None:
+        selector = _SELECTORS[signature] = keccak(signature.encode())[:4]
+    return selector
+
+
+@lru_cache(maxsize=256)
+def _signature_types(signature: str) -> Tuple[str, ...]:
+    """Extract the argument types from a Solidity function signature."""
+    inner = signature[signature.index('(') + 1:signature.rindex(')')]
+    return tuple(inner.split(',')) if inner else ()
+
+
+@lru_cache(maxsize=50_000)
+def _addr_bytes(address: str) -> bytes:
+    """Get the 20 raw bytes of an address (Hedera ID or EVM), memoized for scoring loops."""
+    return bytes.fromhex(_to_evm_address(address)[2:])
+
+
+def _address_word(address: str) -> bytes:
+    """ABI-encode an address (Hedera ID or EVM) as a single 32-byte word."""
+    return _addr_bytes(address).rjust(32, b'\x00')
+
+
+_GET_REPUTATION_SCORE_SELECTOR = _SELECTORS["getReputationScore(address)"]
+
+
+def _encode_get_reputation_score(user_address: str) -> bytes:
+    """Encode ``getReputationScore(address)`` calldata without going through eth_abi."""
+    return _GET_REPUTATION_SCORE_SELECTOR + _address_word(user_address)
+
+
+def _reputation_call(contract_address: str, user_address: str) -> CallSpec:
+    """
+    Build the ``getReputationScore`` read for one user.
+    
+    The contract returns (uint256 overallScore, uint256 totalEvaluations,
+    uint64 lastUpdated, bool isActive).
+    """
+    return CallSpec(
+        contract_address=contract_address,
+        function="getReputationScore(address)",
+        args=(user_address,),
+        output_types=("uint256", "uint256", "uint64", "bool"),
+        data=_encode_get_reputation_score(user_address)
+    )
+
+
+def _reputation_from_values(user_address: str, values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Map decoded ``getReputationScore`` values to a reputation dict."""
+    overall_score, total_evaluations, last_updated, is_active = values
+    return {
+        'user_address': user_address,
+        'overall_score': overall_score,
+        'total_evaluations': total_evaluations,
+        'last_updated': last_updated,
+        'is_active': is_active
+    }
+
+
+# Single-word argument types, packed directly instead of through eth_abi
+_WORD_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    "uint256": lambda value: int(value).to_bytes(32, 'big'),
+    "bool": lambda value: int(bool(value)).to_bytes(32, 'big'),
+    "address": _address_word,
+}
+
+
+def _encode_call(signature: str, args: Tuple[Any, ...]) -> bytes:
+    """
+    ABI-encode a contract call.
+    
+    Args:
+        signature: Solidity function signature
+        args: Positional arguments; Hedera IDs are accepted for address types
         
+    Returns:
+        Selector followed by the encoded arguments
+    """
+    types = _signature_types(signature)
+    if all(abi_type in _WORD_ENCODERS for abi_type in types):
+        return _function_selector(signature) + b"".join(
+            _WORD_ENCODERS[abi_type](arg) for abi_type, arg in zip(types, args)
+        )
+    values = [
+        _addr_bytes(arg) if abi_type == 'address' else arg
+        for abi_type, arg in zip(types, args)
+    ]
+    return _function_selector(signature) + abi_encode(list(types), values)
+
+
+@lru_cache(maxsize=256)
+def _encode_category_call(signature: str, category: str) -> bytes:
+    """
+    Memoized ``_encode_call`` for reads whose only argument is a skill category.
+    
+    Categories come from a small closed set, so the UTF-8 and ABI encoding of
+    each such read is done once rather than on every call. Reads that also
+    take a user address are encoded directly; memoizing them would only churn.
+    """
+    return _encode_call(signature, (category,))
+
+
+def _calldata_hex(call: CallSpec) -> str:
+    """Get the 0x-prefixed calldata for a call, encoding it unless pre-encoded."""
+    data = call.data if call.data is not None else _encode_call(call.function, call.args)
+    return "0x" + data.hex()
+
+
+def _decode_call_result(call: CallSpec, result: str) -> CallResult:
+    """Decode a 0x-prefixed eth_call result according to the call's output types."""
+    try:
+        values = abi_decode(list(call.output_types), bytes.fromhex(result[2:]))
+        return CallResult(success=True, values=tuple(values))
     except Exception as e:
-        logger.error(f"Failed to get skill token info: {str(e)}")
-        return None
+        return CallResult(success=False, error=f"Could not decode result: {str(e)}")
 
 
-async def get_user_skills(owner_address: str) -> List[SkillTokenData]:
+async def batch_contract_call(calls: List[CallSpec]) -> List[CallResult]:
     """
-    Get all skill tokens owned by a user.
+    Execute several read-only contract calls in one JSON-RPC round-trip.
     
     Args:
-        owner_address: Hedera account ID of the owner
+        calls: Calls to execute
         
     Returns:
-        List of SkillTokenData
+        One CallResult per call, in the same order
     """
+    if not calls:
+        return []
+    
+    payload = [
+        {
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "eth_call",
+            "params": [
+                {"to": _to_evm_address(call.contract_address), "data": _calldata_hex(call)},
+                "latest"
+            ]
+        }
+        for i, call in enumerate(calls)
+    ]
+    
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            logger.warning("SkillToken contract not deployed")
-            return []
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getTokensByOwner(address owner)
-        params = ContractFunctionParameters()
-        params.addAddress(owner_address)
-        
-        # Query contract function
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(200000)
-        query.setFunction("getTokensByOwner", params)
+        response = await _get_http_client().post(_json_rpc_url(), json=payload)
+        response.raise_for_status()
+        replies = response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        logger.error("Batched contract call failed: %s", e)
+        return [CallResult(success=False, error=str(e)) for _ in calls]
+    
+    # The relay answers with a single error object when the whole batch is rejected
+    if isinstance(replies, dict):
+        replies = [replies]
+    by_id = {reply.get('id'): reply for reply in replies}
+    
+    results = []
+    for i, call in enumerate(calls):
+        reply = by_id.get(i)
+        if reply is None:
+            results.append(CallResult(success=False, error="No response from JSON-RPC relay"))
+        elif 'error' in reply:
+            results.append(CallResult(success=False, error=str(reply['error'].get('message', reply['error']))))
+        else:
+            results.append(_decode_call_result(call, reply['result']))
+    
+    return results
+
+
+async def _mirror_contract_call(call: CallSpec) -> CallResult:
+    """
+    Execute a read-only contract call through the mirror node's contracts/call API.
+    
+    Args:
+        call: Call to execute
         
-        # Execute query
-        response = query.execute(client)
-        result = response.getFunctionResult()
+    Returns:
+        Decoded CallResult
+    """
+    url = f"{get_settings().hedera_mirror_node_url.rstrip('/')}/api/v1/contracts/call"
+    body = {
+        "to": _to_evm_address(call.contract_address),
+        "data": _calldata_hex(call),
+        "block": "latest",
+        "estimate": False
+    }
+    
+    try:
+        response = await _get_http_client().post(url, json=body)
+        response.raise_for_status()
+        result = response.json()['result']
+    except (httpx.HTTPError, ValueError, KeyError) as e:
+        return CallResult(success=False, error=str(e))
+    
+    return _decode_call_result(call, result)
+
+
+async def _relay_contract_call(call: CallSpec) -> CallResult:
+    """Execute a single read-only contract call through the JSON-RPC relay."""
+    result, = await batch_contract_call([call])
+    return result
+
+
+# Decayed win scores per read provider, kept separately for each set of
+# providers raced together; the recent best winner is tried first
+_HEDGE_WINS: Dict[Tuple[str, ...], Dict[str, float]] = {}
+_HEDGE_DECAY = 0.9
+
+
+async def _hedged(
+    attempts: List[Tuple[str, Any]],
+    delay: float = 0.05,
+    pinned: bool = False
+) -> CallResult:
+    """
+    Race equivalent reads against several providers and keep the first success.
+    
+    Providers are started ``delay`` seconds apart, recent best winner first,
+    so a slow provider only costs the stagger instead of its full latency.
+    Requests still in flight are cancelled once one succeeds.
+    
+    Args:
+        attempts: (provider name, zero-argument coroutine factory) pairs
+        delay: Seconds to wait before starting the next provider
+        pinned: Keep the given order, e.g. so a free provider always goes first
         
-        if result:
-            # Get array of token IDs
-            token_ids = []
-            try:
-                # Parse uint256 array result
-                array_size = result.getUint256(0)  # First element is array length
-                for i in range(1, int(array_size) + 1):
-                    token_ids.append(str(result.getUint256(i)))
-            except Exception as parse_error:
-                logger.warning(f"Could not parse token IDs array: {parse_error}")
-                return []
-            
-            # Get detailed info for each token
-            skills = []
-            for token_id in token_ids:
-                skill_info = await get_skill_token_info(token_id)
-                if skill_info:
-                    skill_info.owner_address = owner_address
-                    skills.append(skill_info)
-            
-            return skills
+    Returns:
+        The first successful CallResult, or the last failure if none succeeded
+    """
+    wins = None
+    if not pinned:
+        wins = _HEDGE_WINS.setdefault(tuple(name for name, _ in attempts), {})
+        attempts = sorted(attempts, key=lambda attempt: -wins.get(attempt[0], 0.0))
+    pending: Dict[asyncio.Task[CallResult], str] = {}
+    last = CallResult(success=False, error="No provider available")
+    
+    def _settle(done: Iterable[asyncio.Task[CallResult]]) -> Optional[CallResult]:
+        nonlocal last
+        for task in done:
+            name = pending.pop(task)
+            if task.exception() is not None:
+                last = CallResult(success=False, error=str(task.exception()))
+            elif task.result().success:
+                if wins is not None:
+                    for provider in wins:
+                        wins[provider] *= _HEDGE_DECAY
+                    wins[name] = wins.get(name, 0.0) + 1
+                return task.result()
+            else:
+                last = task.result()
+        return None
+    
+    try:
+        for name, factory in attempts:
+            pending[asyncio.create_task(factory())] = name
+            done, _ = await asyncio.wait(pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            winner = _settle(done)
+            if winner is not None:
+                return winner
         
-        return []
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = _settle(done)
+            if winner is not None:
+                return winner
         
-    except Exception as e:
-        logger.error(f"Failed to get user skills: {str(e)}")
-        return []
+        return last
+    finally:
+        for task in pending:
+            task.cancel()
 
 
-async def submit_work_evaluation_to_oracle(
-    user_address: str,
-    skill_token_ids: List[str],
-    work_description: str,
-    work_content: str,
-    overall_score: int,
-    skill_scores: List[int],
-    feedback: str,
-    ipfs_hash: str = ""
+async def _hedged_contract_call(call: CallSpec) -> CallResult:
+    """Execute a read-only contract call hedged across the JSON-RPC relay and mirror node."""
+    return await _hedged([
+        ("relay", lambda: _relay_contract_call(call)),
+        ("mirror", lambda: _mirror_contract_call(call)),
+    ])
+
+
+async def create_skill_token(
+    recipient_address: str,
+    skill_name: str,
+    skill_category: str,
+    level: int = 1,
+    description: str = "",
+    metadata_uri: str = ""
 ) -> TransactionResult:
     """
-    Submit work evaluation to the ReputationOracle contract.
+    Create a skill token using the SkillToken smart contract.
     
     Args:
-        user_address: User being evaluated
-        skill_token_ids: List of skill token IDs
-        work_description: Description of the work
-        work_content: Work content or artifacts
-        overall_score: Overall score (0-100)
-        skill_scores: Individual skill scores
-        feedback: Evaluation feedback
-        ipfs_hash: IPFS hash for additional data
+        recipient_address: Hedera account ID to receive the token
+        skill_name: Name of the skill
+        skill_category: Category of the skill
+        level: Initial skill level (1-10)
+        description: Description of the skill
+        metadata_uri: URI to metadata
         
     Returns:
         TransactionResult with success status and details
@@ -1049,154 +1645,116 @@ async def submit_work_evaluation_to_oracle(
         client = get_hedera_client()
         contract_config = get_contract_manager()
         
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        # Get SkillToken contract info
+        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
+        contract_address = skill_token_config.get('address')
         
         if not contract_address:
             return TransactionResult(
                 success=False,
-                error="ReputationOracle contract not deployed"
+                error="SkillToken contract not deployed"
             )
         
         # Create contract ID
         contract_id = ContractId.fromString(contract_address)
         
-        # Prepare function parameters for submitWorkEvaluation
-        # submitWorkEvaluation(address user, uint256[] skillTokenIds, string workDescription, 
-        #                     string workContent, uint256 overallScore, uint256[] skillScores, 
-        #                     string feedback, string ipfsHash)
+        # Prepare function parameters - match the actual ABI signature
+        # mintSkillToken(address recipient, string skillName, string skillCategory, uint8 level, string description, string metadataUri)
         params = ContractFunctionParameters()
-        params.addAddress(user_address)
-        params.addUint256Array([int(token_id) for token_id in skill_token_ids])
-        params.addString(work_description)
-        params.addString(work_content)
-        params.addUint256(overall_score)
-        params.addUint256Array(skill_scores)
-        params.addString(feedback)
-        params.addString(ipfs_hash)
+        params.addAddress(recipient_address)
+        params.addString(skill_name)
+        params.addString(skill_category)
+        params.addUint8(level)
+        params.addString(description)
+        params.addString(metadata_uri)
         
         # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(400000)
-        transaction.setFunction("submitWorkEvaluation", params)
+        transaction.setGas(300000)  # Adjust gas as needed
+        transaction.setFunction("mintSkillToken", params)
         
         # Sign and execute
         response = transaction.execute(client)
         receipt = response.getReceipt(client)
         
-        if receipt.status == Status.Success:
-            # Get evaluation ID from contract function result
+        status = receipt.status
+        if status == _SUCCESS:
+            # Get the transaction record to extract token ID from logs
             record = response.getRecord(client)
-            evaluation_id = None
-            if record and record.contractFunctionResult:
-                try:
-                    evaluation_id = str(record.contractFunctionResult.getUint256(0))
-                except:
-                    evaluation_id = f"eval_{int(datetime.now().timestamp())}"
+            
+            # Extract token ID from contract function result
+            function_result = record.contractFunctionResult
+            token_id = None
+            if function_result and function_result.getUint256(0):
+                token_id = str(function_result.getUint256(0))
             
             return TransactionResult(
                 success=True,
                 transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed if record else 0,
+                gas_used=record.gasUsed,
                 contract_address=contract_address,
-                token_id=evaluation_id  # Reuse token_id field for evaluation_id
+                token_id=token_id
             )
         else:
             return TransactionResult(
                 success=False,
-                error=f"Transaction failed with status: {receipt.status}"
+                error=f"Transaction failed with status: {status}"
             )
             
     except Exception as e:
-        logger.error(f"Failed to submit work evaluation to oracle: {str(e)}")
+        logger.error("Failed to create skill token: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def get_reputation_score_from_oracle(user_address: str) -> Optional[Dict[str, Any]]:
+async def add_skill_experience(
+    token_id: str,
+    experience_points: int
+) -> TransactionResult:
     """
-    Get reputation score from the ReputationOracle contract.
+    Add experience points to a skill token.
     
     Args:
-        user_address: User's Hedera account address
+        token_id: ID of the skill token
+        experience_points: Experience points to add
         
     Returns:
-        Reputation data if found, None otherwise
+        TransactionResult with success status and details
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
-        
-        if not contract_address:
-            logger.warning("ReputationOracle contract not deployed")
-            return None
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getReputationScore(address user)
-        params = ContractFunctionParameters()
-        params.addAddress(user_address)
-        
-        # Query contract function
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getReputationScore", params)
-        
-        # Execute query
-        response = query.execute(client)
-        result = response.getFunctionResult()
-        
-        if result:
-            # Parse the return values:
-            # returns (uint256 overallScore, uint256 totalEvaluations, uint64 lastUpdated, bool isActive)
-            overall_score = result.getUint256(0)
-            total_evaluations = result.getUint256(1)
-            last_updated = result.getUint64(2)
-            is_active = result.getBool(3)
-            
-            return {
-                'user_address': user_address,
-                'overall_score': overall_score,
-                'total_evaluations': total_evaluations,
-                'last_updated': last_updated,
-                'is_active': is_active
-            }
+        # For now, this is a placeholder since the contract doesn't have this function
+        # In a real implementation, this would call a contract function
+        logger.info("Adding %s experience points to token %s", experience_points, token_id)
         
-        return None
+        return TransactionResult(
+            success=True,
+            transaction_id=f"exp_{token_id}_{int(datetime.now().timestamp())}",
+            gas_used=0
+        )
         
     except Exception as e:
-        logger.error(f"Failed to get reputation score from oracle: {str(e)}")
-        return None
+        logger.error("Failed to add skill experience: %s", e)
+        return TransactionResult(
+            success=False,
+            error=str(e)
+        )
 
 
-async def create_governance_proposal(
-    title: str,
-    description: str,
-    targets: List[str] = None,
-    values: List[int] = None,
-    calldatas: List[str] = None,
-    ipfs_hash: str = ""
+async def update_skill_level(
+    token_id: str,
+    new_level: int,
+    new_metadata_uri: str = ""
 ) -> TransactionResult:
     """
-    Create a governance proposal.
+    Update skill token level using the SkillToken smart contract.
     
     Args:
-        title: Proposal title
-        description: Proposal description
-        targets: Target contract addresses
-        values: Values to send with calls
-        calldatas: Call data for each target
-        ipfs_hash: IPFS hash for additional proposal data
+        token_id: ID of the skill token to update
+        new_level: New skill level (1-10)
+        new_metadata_uri: New metadata URI
         
     Returns:
         TransactionResult with success status and details
@@ -1205,3016 +1763,3828 @@ async def create_governance_proposal(
         client = get_hedera_client()
         contract_config = get_contract_manager()
         
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
+        # Get SkillToken contract info
+        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
+        contract_address = skill_token_config.get('address')
         
         if not contract_address:
             return TransactionResult(
                 success=False,
-                error="Governance contract not deployed"
+                error="SkillToken contract not deployed"
             )
         
         # Create contract ID
         contract_id = ContractId.fromString(contract_address)
         
-        # Default empty arrays if not provided
-        targets = targets or []
-        values = values or []
-        calldatas = calldatas or []
-        
-        # Prepare function parameters for createProposal
+        # Prepare function parameters - match the actual ABI signature
+        # updateSkillLevel(uint256 tokenId, uint8 newLevel, string newMetadataUri)
         params = ContractFunctionParameters()
-        params.addString(title)
-        params.addString(description)
-        params.addAddressArray(targets)
-        params.addUint256Array(values)
-        params.addBytesArray([bytes(data, 'utf-8') for data in calldatas])
-        params.addString(ipfs_hash)
+        params.addUint256(int(token_id))
+        params.addUint8(new_level)
+        params.addString(new_metadata_uri)
         
         # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(300000)
-        transaction.setFunction("createProposal", params)
+        transaction.setGas(200000)  # Adjust gas as needed
+        transaction.setFunction("updateSkillLevel", params)
         
         # Sign and execute
         response = transaction.execute(client)
         receipt = response.getReceipt(client)
         
-        if receipt.status == Status.Success:
-            # Get proposal ID from contract function result
+        status = receipt.status
+        if status == _SUCCESS:
             record = response.getRecord(client)
-            proposal_id = None
-            if record and record.contractFunctionResult:
-                try:
-                    proposal_id = str(record.contractFunctionResult.getUint256(0))
-                except:
-                    proposal_id = f"proposal_{int(datetime.now().timestamp())}"
-            
             return TransactionResult(
                 success=True,
                 transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed if record else 0,
-                contract_address=contract_address,
-                token_id=proposal_id  # Reuse token_id field for proposal_id
+                gas_used=record.gasUsed if record else 0
             )
         else:
             return TransactionResult(
                 success=False,
-                error=f"Transaction failed with status: {receipt.status}"
+                error=f"Transaction failed with status: {status}"
             )
             
     except Exception as e:
-        logger.error(f"Failed to create governance proposal: {str(e)}")
+        logger.error("Failed to update skill level: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def cast_governance_vote(
-    proposal_id: int,
-    vote: int,  # 0 = Against, 1 = For, 2 = Abstain
-    reason: str = ""
+async def create_job_pool(
+    title: str,
+    description: str,
+    required_skills: List[Dict[str, Any]],
+    stake_amount: float,
+    duration_days: int
 ) -> TransactionResult:
     """
-    Cast a vote on a governance proposal.
+    Create a job pool using the TalentPool smart contract.
     
     Args:
-        proposal_id: Proposal ID to vote on
-        vote: Vote type (0=Against, 1=For, 2=Abstain)
-        reason: Optional reason for the vote
+        title: Job pool title
+        description: Job pool description
+        required_skills: List of required skills
+        stake_amount: Stake amount in HBAR
+        duration_days: Duration of the pool in days
         
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
+        contract_address, contract_id = _resolve_contract('TalentPool')
         
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="Governance contract not deployed"
+                error="TalentPool contract not deployed"
             )
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        # Prepare JobPoolRequest struct according to the ABI
+        # struct JobPoolRequest {
+        #     string title;
+        #     string description;
+        #     uint256[] requiredSkills;
+        #     uint256 minReputation;
+        #     uint256 stakeAmount;
+        #     uint256 durationDays;
+        #     uint256 maxApplicants;
+        #     uint256 applicationDeadline;
+        # }
+        
+        # Convert required skills to skill IDs (simplified)
+        skill_ids = [hash(skill.get('name', '')) % 1000000 for skill in required_skills]
+        
+        # Calculate application deadline
+        application_deadline = int(datetime.now().timestamp()) + (duration_days * 24 * 60 * 60)
         
-        # Prepare function parameters for castVote
         params = ContractFunctionParameters()
-        params.addUint256(proposal_id)
-        params.addUint8(vote)
-        params.addString(reason)
+        
+        # Add the JobPoolRequest struct as a tuple
+        params.addString(title)  # title
+        params.addString(description)  # description
+        params.addUint256Array(skill_ids)  # requiredSkills
+        params.addUint256(0)  # minReputation (default to 0)
+        params.addUint256(int(stake_amount * 100_000_000))  # stakeAmount in tinybars
+        params.addUint256(duration_days)  # durationDays
+        params.addUint256(100)  # maxApplicants (default to 100)
+        params.addUint256(application_deadline)  # applicationDeadline
         
         # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("castVote", params)
+        transaction.setGas(500000)  # Adjust gas as needed
+        transaction.setFunction("createJobPool", params)
+        
+        # Set payable amount
+        transaction.setPayableAmount(Hbar.fromTinybars(int(stake_amount * 100_000_000)))
         
         # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        response = await _exec(transaction.execute, client)
+        receipt = await _await_receipt(response, client)
         
-        if receipt.status == Status.Success:
+        status = receipt.status
+        if status == _SUCCESS:
+            # Get pool ID from contract function result
+            record = await _exec(response.getRecord, client)
+            pool_id = None
+            if record and record.contractFunctionResult:
+                try:
+                    pool_id = str(record.contractFunctionResult.getUint256(0))
+                except:
+                    pool_id = f"pool_{int(datetime.now().timestamp())}"
+            
+            invalidate_pool_cache()
             return TransactionResult(
                 success=True,
                 transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0,
-                contract_address=contract_address
+                gas_used=record.gasUsed if record else 0,
+                contract_address=contract_address,
+                pool_id=pool_id
             )
         else:
             return TransactionResult(
                 success=False,
-                error=f"Transaction failed with status: {receipt.status}"
+                error=f"Transaction failed with status: {status}"
             )
             
     except Exception as e:
-        logger.error(f"Failed to cast governance vote: {str(e)}")
+        logger.error("Failed to create job pool: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def delegate_voting_power(
-    delegatee: str
+async def apply_to_pool(
+    pool_id: int,
+    skill_token_ids: List[int],
+    cover_letter: str = ""
 ) -> TransactionResult:
     """
-    Delegate voting power to another address.
+    Apply to a job pool using the TalentPool smart contract.
     
     Args:
-        delegatee: Address to delegate voting power to
+        pool_id: ID of the job pool
+        skill_token_ids: List of skill token IDs
+        cover_letter: Cover letter for the application
         
     Returns:
         TransactionResult with success status and details
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="Governance contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for delegate
-        params = ContractFunctionParameters()
-        params.addAddress(delegatee)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(150000)
-        transaction.setFunction("delegate", params)
+        # For now, this is a placeholder since the contract doesn't have this function
+        # In a real implementation, this would call a contract function
+        logger.info("Applying to pool %s with skills %s", pool_id, skill_token_ids)
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        # Applications move the pool's metrics and the global totals
+        invalidate_pool_cache(pool_id)
+        return TransactionResult(
+            success=True,
+            transaction_id=f"apply_{pool_id}_{int(datetime.now().timestamp())}",
+            gas_used=0
+        )
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to delegate voting power: {str(e)}")
+        logger.error("Failed to apply to pool: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def undelegate_voting_power() -> TransactionResult:
+async def make_pool_match(
+    pool_id: int,
+    candidate_address: str,
+    match_score: int
+) -> TransactionResult:
     """
-    Undelegate voting power (remove delegation).
+    Make a pool match using the TalentPool smart contract.
     
+    Args:
+        pool_id: ID of the job pool
+        candidate_address: Address of the matched candidate
+        match_score: Match score for the candidate
+        
     Returns:
         TransactionResult with success status and details
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
+        # For now, this is a placeholder since the contract doesn't have this function
+        # In a real implementation, this would call a contract function
+        logger.info("Making match for pool %s with candidate %s", pool_id, candidate_address)
         
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="Governance contract not deployed"
-            )
+        # Matches move the pool's metrics and the global totals
+        invalidate_pool_cache(pool_id)
+        return TransactionResult(
+            success=True,
+            transaction_id=f"match_{pool_id}_{int(datetime.now().timestamp())}",
+            gas_used=0
+        )
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+    except Exception as e:
+        logger.error("Failed to make pool match: %s", e)
+        return TransactionResult(
+            success=False,
+            error=str(e)
+        )
+
+
+async def get_job_pool_info(pool_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get job pool information from the TalentPool smart contract.
+    
+    Args:
+        pool_id: ID of the job pool
         
-        # Execute contract function (no parameters needed)
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(150000)
-        transaction.setFunction("undelegate")
+    Returns:
+        Job pool information if found, None otherwise
+    """
+    try:
+        client = _client_pool.acquire()
+        _, contract_id = _resolve_contract('TalentPool')
         
-        # Sign and execute
+        if contract_id is None:
+            logger.warning("TalentPool contract not deployed")
+            return None
+        
+        # Prepare function parameters for getJobPool(uint256 poolId)
+        params = ContractFunctionParameters()
+        params.addUint256(pool_id)
+        
+        # Query contract function
+        query = ContractCallQuery()
+        query.setContractId(contract_id)
+        query.setGas(200000)
+        query.setFunction("getJobPool", params)
+        
+        # Execute query off the event loop
+        response = await _exec(query.execute, client)
+        result = response.getFunctionResult()
+        
+        if result:
+            # Parse the JobPool struct returned
+            # struct JobPool {
+            #     uint256 id;
+            #     address company;
+            #     string title;
+            #     string description;
+            #     uint256[] requiredSkills;
+            #     uint256 minReputation;
+            #     uint256 stakeAmount;
+            #     uint256 durationDays;
+            #     uint256 maxApplicants;
+            #     uint256 applicationDeadline;
+            #     enum PoolStatus status;
+            #     uint256 createdAt;
+            # }
+            
+            try:
+                id = result.getUint256(0)
+                company = result.getAddress(1)
+                title = result.getString(2)
+                description = result.getString(3)
+                # requiredSkills array would need special parsing
+                min_reputation = result.getUint256(5)
+                stake_amount = result.getUint256(6)
+                duration_days = result.getUint256(7)
+                max_applicants = result.getUint256(8)
+                application_deadline = result.getUint256(9)
+                status = result.getUint8(10)  # enum as uint8
+                created_at = result.getUint256(11)
+                
+                # Convert status enum
+                status_map = {0: "active", 1: "closed", 2: "completed", 3: "cancelled"}
+                status_str = status_map.get(status, "unknown")
+                
+                return {
+                    'id': pool_id,
+                    'company': company,
+                    'title': title,
+                    'description': description,
+                    'min_reputation': min_reputation,
+                    'stake_amount': float(stake_amount) / 100_000_000,  # Convert from tinybars to HBAR
+                    'duration_days': duration_days,
+                    'max_applicants': max_applicants,
+                    'application_deadline': application_deadline,
+                    'status': status_str,
+                    'created_at': created_at
+                }
+            except Exception as parse_error:
+                logger.error("Failed to parse job pool data: %s", parse_error)
+                return None
+        
+        return None
+        
+    except Exception as e:
+        logger.error("Failed to get job pool info: %s", e)
+        return None
+
+
+async def submit_hcs_message(topic_id: str, message: str) -> TransactionResult:
+    """
+    Submit a message to HCS topic.
+    
+    Args:
+        topic_id: HCS topic ID
+        message: Message to submit
+        
+    Returns:
+        TransactionResult with success status and details
+    """
+    try:
+        client = get_hedera_client()
+        
+        # Parse topic ID
+        topic = TopicId.fromString(topic_id)
+        
+        # Create and submit message
+        transaction = TopicMessageSubmitTransaction()
+        transaction.setTopicId(topic)
+        transaction.setMessage(message)
+        
+        # Execute transaction
         response = transaction.execute(client)
         receipt = response.getReceipt(client)
         
-        if receipt.status == Status.Success:
+        status = receipt.status
+        if status == _SUCCESS:
             return TransactionResult(
                 success=True,
                 transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0,
-                contract_address=contract_address
+                gas_used=receipt.gasUsed
             )
         else:
             return TransactionResult(
                 success=False,
-                error=f"Transaction failed with status: {receipt.status}"
+                error=f"Transaction failed with status: {status}"
             )
             
     except Exception as e:
-        logger.error(f"Failed to undelegate voting power: {str(e)}")
+        logger.error("Failed to submit HCS message: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def create_emergency_proposal(
-    title: str,
-    description: str,
-    targets: List[str],
-    values: List[int],
-    calldatas: List[str],
-    ipfs_hash: str,
-    justification: str
+async def create_nft_token(
+    name: str,
+    symbol: str,
+    metadata: Dict[str, Any]
 ) -> TransactionResult:
     """
-    Create an emergency governance proposal.
+    Create an NFT token on Hedera.
     
     Args:
-        title: Emergency proposal title
-        description: Emergency proposal description
-        targets: Target contract addresses
-        values: Values to send with calls
-        calldatas: Call data for each target
-        ipfs_hash: IPFS hash for additional proposal data
-        justification: Emergency justification
+        name: Token name
+        symbol: Token symbol
+        metadata: Token metadata
         
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
         
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
+        # Create token
+        transaction = TokenCreateTransaction()
+        transaction.setTokenName(name)
+        transaction.setTokenSymbol(symbol)
+        transaction.setTokenType(TokenType.NON_FUNGIBLE_UNIQUE)
+        transaction.setSupplyType(TokenSupplyType.FINITE)
+        transaction.setMaxSupply(1000000)
         
-        if not contract_address:
+        # Set treasury and keys
+        operator_id = client.getOperatorAccountId()
+        transaction.setTreasuryAccountId(operator_id)
+        
+        # Execute transaction
+        response = transaction.execute(client)
+        receipt = response.getReceipt(client)
+        
+        status = receipt.status
+        if status == _SUCCESS:
+            return TransactionResult(
+                success=True,
+                transaction_id=response.transactionId.toString(),
+                gas_used=receipt.gasUsed,
+                contract_address=str(receipt.tokenId)
+            )
+        else:
             return TransactionResult(
                 success=False,
-                error="Governance contract not deployed"
+                error=f"Token creation failed with status: {status}"
             )
+            
+    except Exception as e:
+        logger.error("Failed to create NFT token: %s", e)
+        return TransactionResult(
+            success=False,
+            error=str(e)
+        )
+
+
+async def mint_nft(
+    token_id: str,
+    metadata_uri: str,
+    recipient_id: str
+) -> TransactionResult:
+    """
+    Mint an NFT to a recipient.
+    
+    Args:
+        token_id: Token ID
+        metadata_uri: Metadata URI
+        recipient_id: Recipient account ID
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+    Returns:
+        TransactionResult with success status and details
+    """
+    try:
+        client = get_hedera_client()
         
-        # Prepare function parameters for createEmergencyProposal
-        params = ContractFunctionParameters()
-        params.addString(title)
-        params.addString(description)
-        params.addAddressArray(targets)
-        params.addUint256Array(values)
-        params.addBytesArray([bytes(data, 'utf-8') for data in calldatas])
-        params.addString(ipfs_hash)
-        params.addString(justification)
+        # Parse token and recipient IDs
+        token = TokenId.fromString(token_id)
+        recipient = AccountId.fromString(recipient_id)
         
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(300000)
-        transaction.setFunction("createEmergencyProposal", params)
+        # Mint NFT
+        transaction = TokenMintTransaction()
+        transaction.setTokenId(token)
+        transaction.addMetadata(metadata_uri.encode('utf-8'))
         
-        # Sign and execute
+        # Execute transaction
         response = transaction.execute(client)
         receipt = response.getReceipt(client)
         
-        if receipt.status == Status.Success:
-            # Get proposal ID from contract function result
-            record = response.getRecord(client)
-            proposal_id = None
-            if record and record.contractFunctionResult:
-                try:
-                    proposal_id = str(record.contractFunctionResult.getUint256(0))
-                except:
-                    proposal_id = f"emergency_proposal_{int(datetime.now().timestamp())}"
-            
+        status = receipt.status
+        if status == _SUCCESS:
             return TransactionResult(
                 success=True,
                 transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed if record else 0,
-                contract_address=contract_address,
-                token_id=proposal_id  # Reuse token_id field for proposal_id
+                gas_used=receipt.gasUsed
             )
         else:
             return TransactionResult(
                 success=False,
-                error=f"Transaction failed with status: {receipt.status}"
+                error=f"NFT minting failed with status: {status}"
             )
             
     except Exception as e:
-        logger.error(f"Failed to create emergency governance proposal: {str(e)}")
+        logger.error("Failed to mint NFT: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-# =============================================================================
-# CONTRACT DEPLOYMENT AND VERIFICATION
-# =============================================================================
-
-async def check_contract_deployments() -> Dict[str, bool]:
+async def get_skill_token_info(token_id: str) -> Optional[SkillTokenData]:
     """
-    Check the deployment status of all required contracts.
+    Get skill token information from the smart contract.
     
+    Args:
+        token_id: ID of the skill token
+        
     Returns:
-        Dictionary mapping contract names to deployment status
+        SkillTokenData if found, None otherwise
     """
     try:
+        client = get_hedera_client()
         contract_config = get_contract_manager()
-        deployment_status = {}
         
-        for contract_name, config in contract_config.items():
-            address = config.get('address', '')
-            abi = config.get('abi', [])
-            
-            # Check if contract is deployed and has ABI
-            is_deployed = bool(address and address.startswith('0.0.'))
-            has_abi = len(abi) > 0
-            
-            deployment_status[contract_name] = {
-                'deployed': is_deployed,
-                'address': address,
-                'has_abi': has_abi,
-                'ready': is_deployed and has_abi
-            }
+        # Get SkillToken contract info
+        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
+        contract_address = skill_token_config.get('address')
         
-        return deployment_status
+        if not contract_address:
+            logger.warning("SkillToken contract not deployed")
+            return None
+        
+        # Create contract ID
+        contract_id = ContractId.fromString(contract_address)
+        
+        # Prepare function parameters
+        params = ContractFunctionParameters()
+        params.addUint256(int(token_id))
+        
+        # Query contract function - getSkillData(uint256 tokenId)
+        query = ContractCallQuery()
+        query.setContractId(contract_id)
+        query.setGas(100000)
+        query.setFunction("getSkillData", params)
+        
+        # Execute query
+        response = query.execute(client)
+        result = response.getFunctionResult()
+        
+        if result:
+            # Parse the SkillData struct returned
+            # struct SkillData {
+            #     string skillName;
+            #     string skillCategory;
+            #     uint8 level;
+            #     string description;
+            #     string metadataUri;
+            #     uint64 createdAt;
+            #     uint64 expiryDate;
+            # }
+            
+            skill_name = result.getString(0)
+            skill_category = result.getString(1)
+            level = result.getUint8(2)
+            description = result.getString(3)
+            metadata_uri = result.getString(4)
+            created_at = result.getUint64(5)
+            expiry_date = result.getUint64(6)
+            
+            # Convert category string to enum
+            try:
+                category_enum = SkillCategory(skill_category.lower())
+            except ValueError:
+                category_enum = SkillCategory.OTHER
+            
+            return SkillTokenData(
+                token_id=token_id,
+                skill_name=skill_name,
+                skill_category=category_enum,
+                level=level,
+                description=description,
+                metadata_uri=metadata_uri,
+                owner_address="",  # We'd need to call ownerOf separately
+                created_at=datetime.fromtimestamp(created_at, timezone.utc),
+                expiry_date=datetime.fromtimestamp(expiry_date, timezone.utc) if expiry_date > 0 else None
+            )
+        
+        return None
         
     except Exception as e:
-        logger.error(f"Failed to check contract deployments: {str(e)}")
-        return {}
+        logger.error("Failed to get skill token info: %s", e)
+        return None
 
 
-async def verify_contract_functionality() -> Dict[str, Dict[str, Any]]:
+async def get_user_skills(owner_address: str) -> List[SkillTokenData]:
     """
-    Verify that deployed contracts are functioning correctly.
+    Get all skill tokens owned by a user.
     
+    Args:
+        owner_address: Hedera account ID of the owner
+        
     Returns:
-        Dictionary with verification results for each contract
+        List of SkillTokenData
     """
     try:
+        client = get_hedera_client()
         contract_config = get_contract_manager()
-        verification_results = {}
         
-        for contract_name, config in contract_config.items():
-            if not config.get('deployed'):
-                verification_results[contract_name] = {
-                    'status': 'not_deployed',
-                    'message': 'Contract not deployed'
-                }
-                continue
-            
-            # Try to call a basic view function to verify functionality
+        # Get SkillToken contract info
+        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
+        contract_address = skill_token_config.get('address')
+        
+        if not contract_address:
+            logger.warning("SkillToken contract not deployed")
+            return []
+        
+        # Create contract ID
+        contract_id = ContractId.fromString(contract_address)
+        
+        # Prepare function parameters for getTokensByOwner(address owner)
+        params = ContractFunctionParameters()
+        params.addAddress(owner_address)
+        
+        # Query contract function
+        query = ContractCallQuery()
+        query.setContractId(contract_id)
+        query.setGas(200000)
+        query.setFunction("getTokensByOwner", params)
+        
+        # Execute query
+        response = query.execute(client)
+        result = response.getFunctionResult()
+        
+        if result:
+            # Get array of token IDs
+            token_ids = []
             try:
-                if contract_name == 'SkillToken':
-                    # Try to get total supply or similar
-                    result = await get_skill_token_info("1")  # Test with token ID 1
-                    verification_results[contract_name] = {
-                        'status': 'functional' if result is not None else 'error',
-                        'message': 'Contract responding to queries' if result is not None else 'Query failed'
-                    }
-                else:
-                    verification_results[contract_name] = {
-                        'status': 'not_tested',
-                        'message': 'Verification not implemented for this contract type'
-                    }
-                    
-            except Exception as e:
-                verification_results[contract_name] = {
-                    'status': 'error',
-                    'message': f'Verification failed: {str(e)}'
-                }
+                # Parse uint256 array result
+                array_size = result.getUint256(0)  # First element is array length
+                for i in range(1, int(array_size) + 1):
+                    token_ids.append(str(result.getUint256(i)))
+            except Exception as parse_error:
+                logger.warning("Could not parse token IDs array: %s", parse_error)
+                return []
+            
+            # Get detailed info for each token
+            skills = []
+            for token_id in token_ids:
+                skill_info = await get_skill_token_info(token_id)
+                if skill_info:
+                    skill_info.owner_address = owner_address
+                    skills.append(skill_info)
+            
+            return skills
         
-        return verification_results
+        return []
         
     except Exception as e:
-        logger.error(f"Failed to verify contract functionality: {str(e)}")
-        return {}
-
+        logger.error("Failed to get user skills: %s", e)
+        return []
 
-# =============================================================================
-# HEALTH CHECK FUNCTIONS
-# =============================================================================
 
-async def check_hedera_connection() -> Dict[str, Any]:
+async def submit_work_evaluation_to_oracle(
+    user_address: str,
+    skill_token_ids: List[str],
+    work_description: str,
+    work_content: str,
+    overall_score: int,
+    skill_scores: List[int],
+    feedback: str,
+    ipfs_hash: str = ""
+) -> TransactionResult:
     """
-    Check Hedera network connection health.
+    Submit work evaluation to the ReputationOracle contract.
     
+    Args:
+        user_address: User being evaluated
+        skill_token_ids: List of skill token IDs
+        work_description: Description of the work
+        work_content: Work content or artifacts
+        overall_score: Overall score (0-100)
+        skill_scores: Individual skill scores
+        feedback: Evaluation feedback
+        ipfs_hash: IPFS hash for additional data
+        
     Returns:
-        Dictionary with connection status and details
+        TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
+        contract_id = _get_contract_id('ReputationOracle')
         
-        # Try to get account info to test connection
-        operator_id = client.getOperatorAccountId()
-        account_info = AccountInfoQuery().setAccountId(operator_id).execute(client)
+        if contract_id is None:
+            return TransactionResult(
+                success=False,
+                error="ReputationOracle contract not deployed"
+            )
+        contract_address = contract_id.toString()
         
-        return {
-            'status': 'connected',
-            'network': str(client.getNetworkName()),
-            'operator_account': str(operator_id),
-            'account_balance': str(account_info.balance),
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
+        # Prepare function parameters for submitWorkEvaluation
+        # submitWorkEvaluation(address user, uint256[] skillTokenIds, string workDescription, 
+        #                     string workContent, uint256 overallScore, uint256[] skillScores, 
+        #                     string feedback, string ipfsHash)
+        params = ContractFunctionParameters()
+        params.addAddress(user_address)
+        params.addUint256Array([int(token_id) for token_id in skill_token_ids])
+        params.addString(work_description)
+        params.addString(work_content)
+        params.addUint256(overall_score)
+        params.addUint256Array(skill_scores)
+        params.addString(feedback)
+        params.addString(ipfs_hash)
+        
+        # Execute contract function
+        transaction = ContractExecuteTransaction()
+        transaction.setContractId(contract_id)
+        transaction.setGas(400000)
+        transaction.setFunction("submitWorkEvaluation", params)
         
+        # Sign and execute; the paid record query is only made for a successful call
+        response = await _exec(transaction.execute, client)
+        receipt = await _exec(response.getReceipt, client)
+        record = await _exec(response.getRecord, client) if receipt.status == _SUCCESS else None
+        
+        if record:
+            # The stored score is now stale
+            invalidate_reputation_cache(user_address)
+        
+        # token_id carries the returned evaluation ID
+        return _result(
+            receipt.status,
+            response,
+            contract_address,
+            gas_used=record.gasUsed if record else 0,
+            token_id=_returned_id(record, "eval") if record else None
+        )
+            
     except Exception as e:
-        return {
-            'status': 'disconnected',
-            'error': str(e),
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-
+        logger.error("Failed to submit work evaluation to oracle: %s", e)
+        return TransactionResult(
+            success=False,
+            error=str(e)
+        )
 
-# =============================================================================
-# UTILITY FUNCTIONS
-# =============================================================================
 
-def validate_hedera_address(address: str) -> bool:
+async def get_reputation_score_from_oracle(user_address: str) -> Optional[Dict[str, Any]]:
     """
-    Validate Hedera account address format.
+    Get reputation score from the ReputationOracle contract.
+    
+    Reads are served from the in-memory cache, then from the local reputation
+    index while the indexer is running and current, and only hit the chain on
+    a miss.
     
     Args:
-        address: Address string to validate
+        user_address: User's Hedera account address
         
     Returns:
-        True if valid, False otherwise
+        Reputation data if found, None otherwise
     """
+    key = _reputation_key(user_address)
+    cached = _REPUTATION_CACHE.get(key)
+    if cached is not None:
+        return dict(cached, user_address=user_address)
+    
     try:
-        if not address.startswith('0.0.'):
-            return False
+        indexed = (await _read_reputation_index([key])).get(key)
+        if indexed is not None:
+            _REPUTATION_CACHE.set(key, indexed)
+            return dict(indexed, user_address=user_address)
         
-        # Try to parse as AccountId
-        AccountId.fromString(address)
-        return True
+        contract_id = _get_contract_id('ReputationOracle')
         
-    except Exception:
-        return False
+        if contract_id is None:
+            logger.warning("ReputationOracle contract not deployed")
+            return None
+        
+        result, = await batch_contract_call([_reputation_call(contract_id.toString(), user_address)])
+        
+        if not result.success:
+            logger.warning("getReputationScore call failed: %s", result.error)
+            return None
+        
+        reputation = _reputation_from_values(user_address, result.values)
+        _REPUTATION_CACHE.set(key, reputation)
+        await _exec(_write_reputation_index, {key: reputation})
+        return dict(reputation)
+        
+    except Exception as e:
+        logger.error("Failed to get reputation score from oracle: %s", e)
+        return None
 
 
-def format_hedera_address(address: str) -> str:
+async def get_reputation_scores_bulk(user_addresses: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Format Hedera address for display.
+    Get reputation scores for many users at once.
+    
+    Cached and indexed scores are served locally; every remaining user is
+    read from the ReputationOracle in a single batched round-trip.
     
     Args:
-        address: Raw Hedera address
+        user_addresses: Users' Hedera account addresses
         
     Returns:
-        Formatted address string
+        Mapping of user address to reputation data; users whose score could
+        not be read are omitted
     """
-    if not address:
-        return ""
+    scores = {}
+    missing = []
     
-    if len(address) > 10:
-        return f"{address[:6]}...{address[-4:]}"
+    try:
+        uncached = {}
+        for user_address in dict.fromkeys(user_addresses):
+            key = _reputation_key(user_address)
+            reputation = _REPUTATION_CACHE.get(key)
+            if reputation is not None:
+                scores[user_address] = dict(reputation, user_address=user_address)
+            else:
+                uncached[user_address] = key
+        
+        indexed = await _read_reputation_index(list(dict.fromkeys(uncached.values())))
+        for user_address, key in uncached.items():
+            reputation = indexed.get(key)
+            if reputation is not None:
+                _REPUTATION_CACHE.set(key, reputation)
+                scores[user_address] = dict(reputation, user_address=user_address)
+            else:
+                missing.append(user_address)
+        
+        if not missing:
+            return scores
+        
+        contract_id = _get_contract_id('ReputationOracle')
+        
+        if contract_id is None:
+            logger.warning("ReputationOracle contract not deployed")
+            return scores
+        
+        contract_address = contract_id.toString()
+        results = await batch_contract_call([
+            _reputation_call(contract_address, user_address) for user_address in missing
+        ])
+        
+        records = {}
+        for user_address, result in zip(missing, results):
+            if not result.success:
+                logger.warning("getReputationScore call failed for %s: %s", user_address, result.error)
+                continue
+            reputation = _reputation_from_values(user_address, result.values)
+            key = _reputation_key(user_address)
+            _REPUTATION_CACHE.set(key, reputation)
+            records[key] = reputation
+            scores[user_address] = dict(reputation)
+        
+        if records:
+            await _exec(_write_reputation_index, records)
+        
+    except Exception as e:
+        logger.error("Failed to get bulk reputation scores: %s", e)
     
-    return address
+    return scores
 
 
-def get_network_info() -> Dict[str, Any]:
+async def create_governance_proposal(
+    title: str,
+    description: str,
+    targets: List[str] = None,
+    values: List[int] = None,
+    calldatas: List[Union[str, bytes]] = None,
+    ipfs_hash: str = ""
+) -> TransactionResult:
     """
-    Get current network information.
-    
-    Returns:
-        Network configuration dictionary
-    """
-    try:
-        client = get_hedera_client()
-        settings = get_settings()
-        
-        return {
-            'name': settings.hedera_network,
-            'client_network': str(client.getNetworkName()),
-            'operator_account': str(client.getOperatorAccountId()),
-            'mirror_node': settings.hedera_mirror_node_url
-        }
-        
-    except Exception as e:
-        logger.error(f"Failed to get network info: {str(e)}")
-        return {
-            'name': 'unknown',
-            'error': str(e)
-        }
-
-async def register_reputation_oracle(
-    name: str,
-    specializations: List[str]
-) -> TransactionResult:
-    """
-    Register a new reputation oracle.
+    Create a governance proposal.
     
     Args:
-        name: Oracle name
-        specializations: List of oracle specializations
+        title: Proposal title
+        description: Proposal description
+        targets: Target contract addresses
+        values: Values to send with calls
+        calldatas: Call data for each target
+        ipfs_hash: IPFS hash for additional proposal data
         
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        contract_id = _get_contract_id('Governance')
         
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="ReputationOracle contract not deployed"
+                error="Governance contract not deployed"
             )
+        contract_address = contract_id.toString()
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        # Default empty arrays if not provided
+        targets = targets or []
+        values = values or []
+        calldatas = calldatas or []
         
-        # Prepare function parameters for registerOracle
+        # Prepare function parameters for createProposal
         params = ContractFunctionParameters()
-        params.addString(name)
-        params.addStringArray(specializations)
+        params.addString(title)
+        params.addString(description)
+        params.addAddressArray(targets)
+        params.addUint256Array(values)
+        params.addBytesArray(_encode_calldatas(calldatas))
+        params.addString(ipfs_hash)
         
-        # Execute contract function (payable - stake amount should be msg.value)
+        # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("registerOracle", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        transaction.setGas(300000)
+        transaction.setFunction("createProposal", params)
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        # Sign and execute; the paid record query is only made for a successful call
+        response = await _exec(transaction.execute, client)
+        receipt = await _exec(response.getReceipt, client)
+        record = await _exec(response.getRecord, client) if receipt.status == _SUCCESS else None
+        
+        # token_id carries the returned proposal ID
+        return _result(
+            receipt.status,
+            response,
+            contract_address,
+            gas_used=record.gasUsed if record else 0,
+            token_id=_returned_id(record, "proposal") if record else None
+        )
             
     except Exception as e:
-        logger.error(f"Failed to register reputation oracle: {str(e)}")
+        logger.error("Failed to create governance proposal: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def submit_work_evaluation(
-    user: str,
-    skill_token_ids: List[int],
-    work_description: str,
-    work_content: str,
-    overall_score: int,
-    skill_scores: List[int],
-    feedback: str,
-    ipfs_hash: str
+async def cast_governance_vote(
+    proposal_id: int,
+    vote: int,  # 0 = Against, 1 = For, 2 = Abstain
+    reason: str = ""
 ) -> TransactionResult:
     """
-    Submit a work evaluation.
+    Cast a vote on a governance proposal.
     
     Args:
-        user: User address being evaluated
-        skill_token_ids: List of skill token IDs
-        work_description: Description of the work
-        work_content: Content of the work
-        overall_score: Overall evaluation score
-        skill_scores: Individual skill scores
-        feedback: Evaluation feedback
-        ipfs_hash: IPFS hash for evaluation data
+        proposal_id: Proposal ID to vote on
+        vote: Vote type (0=Against, 1=For, 2=Abstain)
+        reason: Optional reason for the vote
         
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        contract_id = _get_contract_id('Governance')
         
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="ReputationOracle contract not deployed"
+                error="Governance contract not deployed"
             )
+        contract_address = contract_id.toString()
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for submitWorkEvaluation
+        # Prepare function parameters for castVote
         params = ContractFunctionParameters()
-        params.addAddress(user)
-        params.addUint256Array(skill_token_ids)
-        params.addString(work_description)
-        params.addString(work_content)
-        params.addUint8(overall_score)
-        params.addUint8Array(skill_scores)
-        params.addString(feedback)
-        params.addString(ipfs_hash)
+        params.addUint256(proposal_id)
+        params.addUint8(vote)
+        params.addString(reason)
         
         # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(300000)
-        transaction.setFunction("submitWorkEvaluation", params)
+        transaction.setGas(200000)
+        transaction.setFunction("castVote", params)
         
         # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            # Get evaluation ID from contract function result
-            record = response.getRecord(client)
-            evaluation_id = None
-            if record and record.contractFunctionResult:
-                try:
-                    evaluation_id = str(record.contractFunctionResult.getUint256(0))
-                except:
-                    evaluation_id = f"eval_{int(datetime.now().timestamp())}"
-            
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=record.gasUsed if record else 0,
-                contract_address=contract_address,
-                token_id=evaluation_id  # Reuse token_id field for evaluation_id
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        response = await _exec(transaction.execute, client)
+        receipt = await _exec(response.getReceipt, client)
+        
+        return _result(
+            receipt.status,
+            response,
+            contract_address,
+            gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0
+        )
             
     except Exception as e:
-        logger.error(f"Failed to submit work evaluation: {str(e)}")
+        logger.error("Failed to cast governance vote: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def resolve_challenge(
-    challenge_id: str,
-    uphold_original: bool,
-    resolution: str
+async def delegate_voting_power(
+    delegatee: str
 ) -> TransactionResult:
     """
-    Resolve a challenge using the ReputationOracle smart contract.
+    Delegate voting power to another address.
     
     Args:
-        challenge_id: ID of the challenge to resolve
-        uphold_original: Whether to uphold the original evaluation
-        resolution: Resolution description
+        delegatee: Address to delegate voting power to
         
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        contract_id = _get_contract_id('Governance')
         
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="ReputationOracle contract not deployed"
+                error="Governance contract not deployed"
             )
+        contract_address = contract_id.toString()
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for resolveChallenge
+        # Prepare function parameters for delegate
         params = ContractFunctionParameters()
-        params.addUint256(int(challenge_id))
-        params.addBool(uphold_original)
-        params.addString(resolution)
+        params.addAddress(delegatee)
         
         # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("resolveChallenge", params)
+        transaction.setGas(_estimate_gas('Governance', 'delegate', 150000))
+        transaction.setFunction("delegate", params)
         
         # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        response = await _exec(transaction.execute, client)
+        receipt = await _exec(response.getReceipt, client)
+        
+        return _result(
+            receipt.status,
+            response,
+            contract_address,
+            gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0,
+            gas_key=('Governance', 'delegate')
+        )
             
     except Exception as e:
-        logger.error(f"Failed to resolve challenge: {str(e)}")
+        # A failed receipt surfaces as ReceiptStatusException naming the status
+        if 'INSUFFICIENT_GAS' in str(e):
+            _reset_gas('Governance', 'delegate')
+        logger.error("Failed to delegate voting power: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def slash_oracle(
-    oracle_address: str,
-    amount: int,
-    reason: str
-) -> TransactionResult:
+async def undelegate_voting_power() -> TransactionResult:
     """
-    Slash an oracle using the ReputationOracle smart contract.
+    Undelegate voting power (remove delegation).
     
-    Args:
-        oracle_address: Address of the oracle to slash
-        amount: Amount to slash
-        reason: Reason for slashing
-        
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
+        contract_id = _get_contract_id('Governance')
         
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
-        
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="ReputationOracle contract not deployed"
+                error="Governance contract not deployed"
             )
+        contract_address = contract_id.toString()
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for slashOracle
-        params = ContractFunctionParameters()
-        params.addAddress(oracle_address)
-        params.addUint256(amount)
-        params.addString(reason)
-        
-        # Execute contract function
+        # Execute contract function (no parameters needed)
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("slashOracle", params)
+        transaction.setGas(_estimate_gas('Governance', 'undelegate', 150000))
+        transaction.setFunction("undelegate")
         
         # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        response = await _exec(transaction.execute, client)
+        receipt = await _exec(response.getReceipt, client)
+        
+        return _result(
+            receipt.status,
+            response,
+            contract_address,
+            gas_used=receipt.gasUsed if hasattr(receipt, 'gasUsed') else 0,
+            gas_key=('Governance', 'undelegate')
+        )
             
     except Exception as e:
-        logger.error(f"Failed to slash oracle: {str(e)}")
+        # A failed receipt surfaces as ReceiptStatusException naming the status
+        if 'INSUFFICIENT_GAS' in str(e):
+            _reset_gas('Governance', 'undelegate')
+        logger.error("Failed to undelegate voting power: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def withdraw_oracle_stake() -> TransactionResult:
+async def create_emergency_proposal(
+    title: str,
+    description: str,
+    targets: List[str],
+    values: List[int],
+    calldatas: List[Union[str, bytes]],
+    ipfs_hash: str,
+    justification: str
+) -> TransactionResult:
     """
-    Withdraw oracle stake using the ReputationOracle smart contract.
+    Create an emergency governance proposal.
     
+    Args:
+        title: Emergency proposal title
+        description: Emergency proposal description
+        targets: Target contract addresses
+        values: Values to send with calls
+        calldatas: Call data for each target
+        ipfs_hash: IPFS hash for additional proposal data
+        justification: Emergency justification
+        
     Returns:
         TransactionResult with success status and details
     """
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        contract_id = _get_contract_id('Governance')
         
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="ReputationOracle contract not deployed"
+                error="Governance contract not deployed"
             )
+        contract_address = contract_id.toString()
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for withdrawOracleStake (no parameters)
+        # Prepare function parameters for createEmergencyProposal
         params = ContractFunctionParameters()
+        params.addString(title)
+        params.addString(description)
+        params.addAddressArray(targets)
+        params.addUint256Array(values)
+        params.addBytesArray(_encode_calldatas(calldatas))
+        params.addString(ipfs_hash)
+        params.addString(justification)
         
         # Execute contract function
         transaction = ContractExecuteTransaction()
         transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("withdrawOracleStake", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        transaction.setGas(300000)
+        transaction.setFunction("createEmergencyProposal", params)
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        # Sign and execute; the paid record query is only made for a successful call
+        response = await _exec(transaction.execute, client)
+        receipt = await _exec(response.getReceipt, client)
+        record = await _exec(response.getRecord, client) if receipt.status == _SUCCESS else None
+        
+        # token_id carries the returned proposal ID
+        return _result(
+            receipt.status,
+            response,
+            contract_address,
+            gas_used=record.gasUsed if record else 0,
+            token_id=_returned_id(record, "emergency_proposal") if record else None
+        )
             
     except Exception as e:
-        logger.error(f"Failed to withdraw oracle stake: {str(e)}")
+        logger.error("Failed to create emergency governance proposal: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def get_oracle_performance(
-    oracle_address: str
-) -> Dict[str, Any]:
+async def _gather_transactions(coros: Iterable[Awaitable[TransactionResult]]) -> List[TransactionResult]:
     """
-    Get oracle performance metrics using the ReputationOracle smart contract.
+    Submit independent transactions concurrently.
     
     Args:
-        oracle_address: Address of the oracle
+        coros: Coroutines each returning a TransactionResult
         
     Returns:
-        Dictionary containing performance metrics
+        One TransactionResult per coroutine, in order; unexpected
+        exceptions are reported as failed results
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "ReputationOracle contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getOraclePerformance
-        params = ContractFunctionParameters()
-        params.addAddress(oracle_address)
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return [
+        TransactionResult(success=False, error=str(result)) if isinstance(result, BaseException) else result
+        for result in results
+    ]
+
+
+async def create_many_proposals(specs: List[Dict[str, Any]]) -> List[TransactionResult]:
+    """
+    Create several governance proposals concurrently.
+    
+    Args:
+        specs: Keyword arguments for create_governance_proposal, one dict per proposal
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getOraclePerformance", params)
+    Returns:
+        List of TransactionResult, in the same order as specs
+    """
+    return await _gather_transactions(create_governance_proposal(**spec) for spec in specs)
+
+
+async def cast_votes_batch(votes: List[Tuple[int, int, str]]) -> List[TransactionResult]:
+    """
+    Cast several governance votes concurrently.
+    
+    Args:
+        votes: (proposal_id, vote, reason) tuples
         
-        # Execute query
-        response = query.execute(client)
+    Returns:
+        List of TransactionResult, in the same order as votes
+    """
+    return await _gather_transactions(
+        cast_governance_vote(proposal_id, vote, reason) for proposal_id, vote, reason in votes
+    )
+
+
+async def delegate_voting_power_batch(delegatees: List[str]) -> List[TransactionResult]:
+    """
+    Submit several delegations concurrently.
+    
+    Args:
+        delegatees: Addresses to delegate voting power to
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                performance = {
-                    "evaluations_completed": result.getUint256(0) if result else 0,
-                    "successful_challenges": result.getUint256(1) if result else 0,
-                    "failed_challenges": result.getUint256(2) if result else 0,
-                    "last_activity": result.getUint256(3) if result else 0
-                }
-                
-                return {
-                    "success": True,
-                    "oracle_address": oracle_address,
-                    "performance": performance
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse oracle performance data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "oracle_address": oracle_address,
-                    "performance": {
-                        "evaluations_completed": 0,
-                        "successful_challenges": 0,
-                        "failed_challenges": 0,
-                        "last_activity": 0
-                    }
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get oracle performance: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    Returns:
+        List of TransactionResult, in the same order as delegatees
+    """
+    return await _gather_transactions(delegate_voting_power(delegatee) for delegatee in delegatees)
 
 
 # =============================================================================
-# ADDITIONAL SKILL TOKEN FUNCTIONS
+# REPUTATION INDEX
 # =============================================================================
 
-async def endorse_skill_token(
-    token_id: str,
-    endorsement_data: str
-) -> TransactionResult:
+# Reputation events mapped to the position of the indexed user topic
+_REPUTATION_EVENT_USER_TOPIC = {
+    "0x" + keccak(b"ReputationScoreUpdated(address,uint256,uint256,string,address)").hex(): 1,
+    "0x" + keccak(b"WorkEvaluationCompleted(uint256,address,uint256[],uint256,string)").hex(): 2,
+}
+# Challenge events; an upheld challenge rewrites a score without a reputation event
+_CHALLENGE_CREATED_TOPIC = "0x" + keccak(b"ChallengeCreated(uint256,uint256,address,uint256)").hex()
+_CHALLENGE_RESOLVED_TOPIC = "0x" + keccak(b"ChallengeResolved(uint256,bool,address)").hex()
+
+# Local store kept fresh by the indexer; None until the indexer starts
+_reputation_index_db: Optional[sqlite3.Connection] = None
+_reputation_indexer_task: Optional[asyncio.Task] = None
+# Serializes index access, which runs on the Hedera executor threads
+_reputation_index_lock = threading.Lock()
+
+# The index is only trusted if a poll succeeded within this many poll intervals
+_REPUTATION_INDEX_STALE_POLLS = 3
+_reputation_index_poll_interval = 0.0
+_reputation_index_polled_at: Optional[float] = None
+# Rows older than this are re-read from the chain even if no event touched them
+_REPUTATION_INDEX_MAX_AGE = 300.0
+
+# Keys per SELECT, below SQLite's host parameter limit
+_REPUTATION_INDEX_CHUNK = 500
+
+
+def _open_reputation_index(path: str) -> sqlite3.Connection:
+    """Open the reputation index database, creating its tables if needed."""
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS reputation (
+            user_address TEXT PRIMARY KEY,
+            overall_score INTEGER NOT NULL,
+            total_evaluations INTEGER NOT NULL,
+            last_updated INTEGER NOT NULL,
+            is_active INTEGER NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS challenge (
+            challenge_id TEXT PRIMARY KEY,
+            evaluation_id TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS index_state (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        """
+    )
+    return db
+
+
+def _reputation_index_fresh() -> bool:
+    """Whether the indexer is running and has polled successfully recently."""
+    if _reputation_index_db is None or _reputation_indexer_task is None or _reputation_indexer_task.done():
+        return False
+    if _reputation_index_polled_at is None:
+        return False
+    
+    max_age = _REPUTATION_INDEX_STALE_POLLS * _reputation_index_poll_interval
+    return time.monotonic() - _reputation_index_polled_at <= max_age
+
+
+def _select_reputation_index(keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Read the indexed reputation records of the given users; blocking."""
+    records: Dict[str, Dict[str, Any]] = {}
+    with _reputation_index_lock:
+        if _reputation_index_db is None:
+            return records
+        
+        oldest = time.time() - _REPUTATION_INDEX_MAX_AGE
+        for start in range(0, len(keys), _REPUTATION_INDEX_CHUNK):
+            chunk = keys[start:start + _REPUTATION_INDEX_CHUNK]
+            rows = _reputation_index_db.execute(
+                "SELECT user_address, overall_score, total_evaluations, last_updated, is_active "
+                f"FROM reputation WHERE user_address IN ({', '.join('?' * len(chunk))}) "
+                "AND updated_at >= ?",
+                (*chunk, oldest)
+            ).fetchall()
+            for row in rows:
+                records[row[0]] = {
+                    'user_address': row[0],
+                    'overall_score': row[1],
+                    'total_evaluations': row[2],
+                    'last_updated': row[3],
+                    'is_active': bool(row[4])
+                }
+    
+    return records
+
+
+async def _read_reputation_index(keys: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Endorse a skill token using the SkillToken smart contract.
+    Read indexed reputation records off the event loop.
+    
+    Records are only trusted while the indexer runs and its last successful
+    poll is recent; otherwise nothing is returned and reads go to the chain.
+    Rows older than ``_REPUTATION_INDEX_MAX_AGE`` are skipped as well, which
+    bounds the damage of a score change the watched events did not report.
     
     Args:
-        token_id: ID of the skill token to endorse
-        endorsement_data: Data describing the endorsement
+        keys: Normalized user addresses
         
     Returns:
-        TransactionResult with success status and details
+        Mapping of key to reputation record for the users found in the index
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="SkillToken contract not deployed"
+    if not keys or not _reputation_index_fresh():
+        return {}
+    
+    records: Dict[str, Dict[str, Any]] = await _exec(_select_reputation_index, keys)
+    return records
+
+
+def _write_reputation_index(records: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """
+    Upsert reputation records into the local index in one transaction; blocking.
+    
+    Args:
+        records: Mapping of key to reputation record; None removes the row
+    """
+    with _reputation_index_lock:
+        if _reputation_index_db is None:
+            return
+        
+        now = time.time()
+        with _reputation_index_db:
+            for key, reputation in records.items():
+                if reputation is None:
+                    _reputation_index_db.execute("DELETE FROM reputation WHERE user_address = ?", (key,))
+                    continue
+                _reputation_index_db.execute(
+                    "INSERT OR REPLACE INTO reputation VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        reputation['overall_score'],
+                        reputation['total_evaluations'],
+                        reputation['last_updated'],
+                        int(reputation['is_active']),
+                        now
+                    )
+                )
+
+
+def _delete_reputation_index(key: str) -> None:
+    """Remove a reputation record from the local index; blocking."""
+    _write_reputation_index({key: None})
+
+
+def _clear_reputation_index() -> None:
+    """Remove every reputation record from the local index; blocking."""
+    with _reputation_index_lock:
+        if _reputation_index_db is None:
+            return
+        
+        with _reputation_index_db:
+            _reputation_index_db.execute("DELETE FROM reputation")
+
+
+def _record_challenges(challenges: Dict[str, str]) -> None:
+    """Remember which evaluation each new challenge targets; blocking."""
+    with _reputation_index_lock:
+        if _reputation_index_db is None:
+            return
+        
+        with _reputation_index_db:
+            _reputation_index_db.executemany(
+                "INSERT OR REPLACE INTO challenge VALUES (?, ?)", challenges.items()
             )
+
+
+def _pop_challenges(challenge_ids: List[str]) -> Dict[str, str]:
+    """Forget resolved challenges, returning the evaluations they targeted; blocking."""
+    evaluations: Dict[str, str] = {}
+    with _reputation_index_lock:
+        if _reputation_index_db is None:
+            return evaluations
+        
+        with _reputation_index_db:
+            for challenge_id in challenge_ids:
+                row = _reputation_index_db.execute(
+                    "SELECT evaluation_id FROM challenge WHERE challenge_id = ?", (challenge_id,)
+                ).fetchone()
+                if row:
+                    evaluations[challenge_id] = row[0]
+                    _reputation_index_db.execute(
+                        "DELETE FROM challenge WHERE challenge_id = ?", (challenge_id,)
+                    )
+    
+    return evaluations
+
+
+def _reputation_index_state(value: Optional[str] = None) -> Optional[str]:
+    """Read the indexer cursor, or store it if ``value`` is given; blocking."""
+    with _reputation_index_lock:
+        if _reputation_index_db is None:
+            return None
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for endorseSkillToken
-        params = ContractFunctionParameters()
-        params.addUint256(int(token_id))
-        params.addString(endorsement_data)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("endorseSkillToken", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        if value is not None:
+            with _reputation_index_db:
+                _reputation_index_db.execute(
+                    "INSERT OR REPLACE INTO index_state VALUES ('reputation_cursor', ?)", (value,)
+                )
+            return value
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to endorse skill token: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
+        row = _reputation_index_db.execute(
+            "SELECT value FROM index_state WHERE key = 'reputation_cursor'"
+        ).fetchone()
+        return row[0] if row else None
+
+
+async def _refresh_reputation_index(user_addresses: List[str]) -> None:
+    """Re-read the given users' scores from the oracle in one batch and re-index them."""
+    contract_id = _get_contract_id('ReputationOracle')
+    if contract_id is None:
+        return
+    
+    contract_address = contract_id.toString()
+    results = await batch_contract_call([
+        _reputation_call(contract_address, user_address) for user_address in user_addresses
+    ])
+    
+    records = {}
+    for user_address, result in zip(user_addresses, results):
+        _REPUTATION_CACHE.pop(user_address)
+        # A failed read drops the row so the next read falls back to the chain
+        records[user_address] = (
+            _reputation_from_values(user_address, result.values) if result.success else None
         )
+    await _exec(_write_reputation_index, records)
 
 
-async def renew_skill_token(
-    token_id: str,
-    new_expiry_date: int
-) -> TransactionResult:
+async def _drop_challenged_users(challenge_ids: List[str]) -> None:
     """
-    Renew a skill token using the SkillToken smart contract.
+    Drop the users whose evaluations were challenged and resolved.
+    
+    A failed challenge reverts the evaluation's score changes without a
+    reputation event, so the user's row is removed and the next read goes to
+    the chain. Challenges opened before the indexer saw them cannot be traced
+    to a user, in which case the whole index is dropped instead.
+    """
+    evaluations = await _exec(_pop_challenges, challenge_ids)
+    results = await asyncio.gather(*(
+        get_work_evaluation(evaluation_id) for evaluation_id in set(evaluations.values())
+    ))
+    
+    users = [result.get('evaluation', {}).get('user') for result in results if result.get('success')]
+    if len(evaluations) < len(challenge_ids) or len(users) < len(results) or not all(users):
+        _REPUTATION_CACHE.clear()
+        await _exec(_clear_reputation_index)
+        return
+    
+    keys = ["0x" + user[-40:].lower() for user in users]
+    for key in keys:
+        _REPUTATION_CACHE.pop(key)
+    await _exec(_write_reputation_index, dict.fromkeys(keys))
+
+
+async def _index_reputation_logs(contract_address: str, cursor: str) -> str:
+    """
+    Index reputation events emitted after ``cursor``.
     
     Args:
-        token_id: ID of the skill token to renew
-        new_expiry_date: New expiry date as Unix timestamp
+        contract_address: ReputationOracle contract ID
+        cursor: Consensus timestamp of the last indexed log
         
     Returns:
-        TransactionResult with success status and details
+        Consensus timestamp of the newest indexed log
+    """
+    mirror_node_url = get_settings().hedera_mirror_node_url.rstrip('/')
+    url: Optional[str] = f"{mirror_node_url}/api/v1/contracts/{contract_address}/results/logs"
+    params: Optional[Dict[str, Any]] = {"timestamp": f"gt:{cursor}", "order": "asc", "limit": 100}
+    touched: Set[str] = set()
+    challenges: Dict[str, str] = {}
+    resolved: List[str] = []
+    
+    while url:
+        response = await _get_http_client().get(url, params=params)
+        response.raise_for_status()
+        body = response.json()
+        
+        for log in body.get('logs', []):
+            cursor = log['timestamp']
+            topics = log.get('topics') or []
+            position = _REPUTATION_EVENT_USER_TOPIC.get(topics[0]) if topics else None
+            if position is not None and len(topics) > position:
+                touched.add("0x" + topics[position][-40:])
+            elif topics and topics[0] == _CHALLENGE_CREATED_TOPIC and len(topics) > 2:
+                challenges[str(int(topics[1], 16))] = str(int(topics[2], 16))
+            elif topics and topics[0] == _CHALLENGE_RESOLVED_TOPIC and len(topics) > 1:
+                resolved.append(str(int(topics[1], 16)))
+        
+        # Follow-up pages carry their own query string
+        next_link = (body.get('links') or {}).get('next')
+        url = f"{mirror_node_url}{next_link}" if next_link else None
+        params = None
+    
+    if touched:
+        await _refresh_reputation_index(sorted(touched))
+    if challenges:
+        await _exec(_record_challenges, challenges)
+    if resolved:
+        await _drop_challenged_users(resolved)
+    
+    await _exec(_reputation_index_state, cursor)
+    return cursor
+
+
+async def _reputation_indexer(poll_interval: float) -> None:
+    """Poll the mirror node for reputation events and keep the local index current."""
+    global _reputation_index_poll_interval, _reputation_index_polled_at
+    
+    contract_id = _get_contract_id('ReputationOracle')
+    if contract_id is None:
+        logger.warning("ReputationOracle contract not deployed, reputation indexer not started")
+        return
+    
+    contract_address = contract_id.toString()
+    # Hedera has instant finality, so a fresh index simply starts from now
+    cursor = await _exec(_reputation_index_state) or f"{time.time():.9f}"
+    _reputation_index_poll_interval = poll_interval
+    _reputation_index_polled_at = None
+    
+    while True:
+        try:
+            cursor = await _index_reputation_logs(contract_address, cursor)
+            _reputation_index_polled_at = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Reputation indexer poll failed: %s", e)
+        await asyncio.sleep(poll_interval)
+
+
+def start_reputation_indexer() -> Optional[asyncio.Task]:
     """
+    Start the background reputation indexer on the running event loop.
+    
+    Returns:
+        The indexer task, or None if the index could not be opened
+    """
+    global _reputation_index_db, _reputation_indexer_task
+    
+    if _reputation_indexer_task is not None and not _reputation_indexer_task.done():
+        return _reputation_indexer_task
+    
+    settings = get_settings()
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="SkillToken contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for renewSkillToken
-        params = ContractFunctionParameters()
-        params.addUint256(int(token_id))
-        params.addUint64(new_expiry_date)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("renewSkillToken", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to renew skill token: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        if _reputation_index_db is None:
+            _reputation_index_db = _open_reputation_index(settings.reputation_index_path)
+    except sqlite3.Error as e:
+        logger.error("Failed to open reputation index: %s", e)
+        return None
+    
+    _reputation_indexer_task = asyncio.create_task(
+        _reputation_indexer(settings.reputation_index_poll_interval)
+    )
+    return _reputation_indexer_task
 
 
-async def revoke_skill_token(
-    token_id: str,
-    reason: str
-) -> TransactionResult:
+async def stop_reputation_indexer() -> None:
+    """Stop the background reputation indexer and close the local index."""
+    global _reputation_index_db, _reputation_indexer_task
+    
+    if _reputation_indexer_task is not None:
+        _reputation_indexer_task.cancel()
+        try:
+            await _reputation_indexer_task
+        except asyncio.CancelledError:
+            pass
+        _reputation_indexer_task = None
+    
+    with _reputation_index_lock:
+        if _reputation_index_db is not None:
+            _reputation_index_db.close()
+            _reputation_index_db = None
+
+
+# =============================================================================
+# CONTRACT DEPLOYMENT AND VERIFICATION
+# =============================================================================
+
+async def check_contract_deployments() -> Dict[str, bool]:
     """
-    Revoke a skill token using the SkillToken smart contract.
+    Check the deployment status of all required contracts.
     
-    Args:
-        token_id: ID of the skill token to revoke
-        reason: Reason for revocation
-        
     Returns:
-        TransactionResult with success status and details
+        Dictionary mapping contract names to deployment status
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+        contracts = get_contract_manager().get('contracts', {})
+        deployment_status = {}
         
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="SkillToken contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for revokeSkillToken
-        params = ContractFunctionParameters()
-        params.addUint256(int(token_id))
-        params.addString(reason)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("revokeSkillToken", params)
+        for contract_name, config in contracts.items():
+            address = config.get('address', '')
+            abi = config.get('abi', [])
+            
+            # Check if contract is deployed and has ABI
+            is_deployed = bool(address and address.startswith('0.0.'))
+            has_abi = len(abi) > 0
+            
+            deployment_status[contract_name] = {
+                'deployed': is_deployed,
+                'address': address,
+                'has_abi': has_abi,
+                'ready': is_deployed and has_abi
+            }
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        return deployment_status
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to revoke skill token: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        logger.error("Failed to check contract deployments: %s", e)
+        return {}
 
 
-async def get_skill_endorsements(
-    token_id: str
-) -> Dict[str, Any]:
+async def verify_contract_functionality() -> Dict[str, Dict[str, Any]]:
     """
-    Get endorsements for a skill token using the SkillToken smart contract.
+    Verify that deployed contracts are functioning correctly.
+    
+    Each contract is probed concurrently, so the overall check takes as long
+    as the slowest probe rather than the sum of all of them.
     
-    Args:
-        token_id: ID of the skill token
-        
     Returns:
-        Dictionary containing endorsement data
+        Dictionary with verification results for each contract
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "SkillToken contract not deployed"
+    async def _verify_one(contract_name: str, config: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        if not config.get('deployed'):
+            return contract_name, {
+                'status': 'not_deployed',
+                'message': 'Contract not deployed'
             }
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        # Try to call a basic view function to verify functionality
+        if contract_name == 'SkillToken':
+            # Try to get total supply or similar
+            result = await get_skill_token_info("1")  # Test with token ID 1
+            return contract_name, {
+                'status': 'functional' if result is not None else 'error',
+                'message': 'Contract responding to queries' if result is not None else 'Query failed'
+            }
         
-        # Prepare function parameters for getSkillEndorsements
-        params = ContractFunctionParameters()
-        params.addUint256(int(token_id))
+        return contract_name, {
+            'status': 'not_tested',
+            'message': 'Verification not implemented for this contract type'
+        }
+    
+    try:
+        contracts = get_contract_manager().get('contracts', {})
+        names = list(contracts)
+        results = await asyncio.gather(
+            *(_verify_one(name, contracts[name]) for name in names),
+            return_exceptions=True
+        )
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getSkillEndorsements", params)
+        verification_results = {}
+        for contract_name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                verification_results[contract_name] = {
+                    'status': 'error',
+                    'message': f'Verification failed: {str(result)}'
+                }
+            else:
+                verification_results[contract_name] = result[1]
         
-        # Execute query
-        response = query.execute(client)
+        return verification_results
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            endorsements = []
-            
-            # Extract endorsement data from result
-            # This will depend on the actual return structure of the contract
-            try:
-                # Assuming the contract returns an array of endorsement structs
-                endorsement_count = result.getUint256(0) if result else 0
-                
-                for i in range(int(endorsement_count)):
-                    endorsement = {
-                        "endorser": result.getAddress(i * 3),
-                        "endorsement_data": result.getString(i * 3 + 1),
-                        "timestamp": result.getUint256(i * 3 + 2)
-                    }
-                    endorsements.append(endorsement)
-                    
-            except Exception as parse_error:
-                logger.warning(f"Could not parse endorsement data: {str(parse_error)}")
-                endorsements = []
-            
-            return {
-                "success": True,
-                "endorsements": endorsements,
-                "token_id": token_id
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
     except Exception as e:
-        logger.error(f"Failed to get skill endorsements: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+        logger.error("Failed to verify contract functionality: %s", e)
+        return {}
 
 
-async def mark_expired_tokens(
-    token_ids: List[str]
-) -> TransactionResult:
+# =============================================================================
+# HEALTH CHECK FUNCTIONS
+# =============================================================================
+
+# Last successful connection check; healthchecks inside the TTL reuse it
+_CONNECTION_CHECK_TTL = 5.0
+_last_connection_ok: Optional[Dict[str, Any]] = None
+_last_connection_ok_at = 0.0
+
+
+async def check_hedera_connection() -> Dict[str, Any]:
     """
-    Mark skill tokens as expired using the SkillToken smart contract.
+    Check Hedera network connection health.
+    
+    A successful result is reused for a few seconds. Once it goes stale the
+    connection is re-checked with a cheap node ping, falling back to a full
+    operator account query only on the first check or when the ping fails.
+    A ping does not re-read the balance, so ``account_balance`` is reported
+    with its own ``balance_checked_at`` time.
     
-    Args:
-        token_ids: List of token IDs to mark as expired
-        
     Returns:
-        TransactionResult with success status and details
+        Dictionary with connection status and details
     """
+    global _last_connection_ok, _last_connection_ok_at
+    
+    if _last_connection_ok is not None and time.monotonic() - _last_connection_ok_at < _CONNECTION_CHECK_TTL:
+        return dict(_last_connection_ok)
+    
     try:
         client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="SkillToken contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for markExpiredTokens
-        params = ContractFunctionParameters()
-        params.addUint256Array([int(token_id) for token_id in token_ids])
+        status = None
         
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(300000)
-        transaction.setFunction("markExpiredTokens", params)
+        if _last_connection_ok is not None:
+            try:
+                node_id = next(iter(client.getNetwork().values()))
+                await _exec(client.ping, node_id)
+                status = dict(_last_connection_ok, timestamp=_utc_now_iso())
+            except Exception as ping_error:
+                logger.warning("Hedera node ping failed, querying operator account: %s", ping_error)
+        
+        if status is None:
+            # Try to get account info to test connection
+            operator_id = client.getOperatorAccountId()
+            account_info = await _exec(AccountInfoQuery().setAccountId(operator_id).execute, client)
+            checked_at = _utc_now_iso()
+            
+            status = {
+                'status': 'connected',
+                'network': str(client.getNetworkName()),
+                'operator_account': str(operator_id),
+                'account_balance': str(account_info.balance),
+                'balance_checked_at': checked_at,
+                'timestamp': checked_at
+            }
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        _last_connection_ok = status
+        _last_connection_ok_at = time.monotonic()
+        return dict(status)
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to mark expired tokens: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        _last_connection_ok = None
+        return {
+            'status': 'disconnected',
+            'error': str(e),
+            'timestamp': _utc_now_iso()
+        }
 
 
 # =============================================================================
-# ADDITIONAL TALENT POOL FUNCTIONS
+# UTILITY FUNCTIONS
 # =============================================================================
 
-async def select_candidate(
-    pool_id: str,
-    candidate_address: str
-) -> TransactionResult:
+@lru_cache(maxsize=2)
+def _format_iso(epoch_seconds: int) -> str:
+    """Format a UTC epoch second as ISO 8601, memoized for same-second callers."""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).isoformat()
+
+
+def _utc_now_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string at second precision."""
+    return _format_iso(time.time_ns() // 1_000_000_000)
+
+
+# Account IDs in shard.realm.num form, optionally checksummed (0.0.123-vfmkw);
+# only shard 0 / realm 0 is in use
+# The account number is a Java long, so at most 19 digits
+_HEDERA_ADDRESS_RE = re.compile(r'0\.0\.[0-9]{1,19}(?:-[a-z]{5})?')
+
+
+def validate_hedera_address(address: str) -> bool:
     """
-    Select a candidate for a job pool using the TalentPool smart contract.
+    Validate Hedera account address format.
+    
+    An optional ``-abcde`` checksum suffix is only format-checked; it is not
+    verified against the ledger ID.
     
     Args:
-        pool_id: ID of the job pool
-        candidate_address: Address of the selected candidate
+        address: Address string to validate
         
     Returns:
-        TransactionResult with success status and details
+        True if valid, False otherwise
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="TalentPool contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for selectCandidate
-        params = ContractFunctionParameters()
-        params.addUint256(int(pool_id))
-        params.addAddress(candidate_address)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("selectCandidate", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to select candidate: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    if not isinstance(address, str):
+        return False
+    
+    return _HEDERA_ADDRESS_RE.fullmatch(address) is not None
 
 
-async def complete_pool(
-    pool_id: str
-) -> TransactionResult:
+def format_hedera_address(address: str) -> str:
     """
-    Complete a job pool using the TalentPool smart contract.
+    Format Hedera address for display.
     
     Args:
-        pool_id: ID of the job pool to complete
+        address: Raw Hedera address
         
     Returns:
-        TransactionResult with success status and details
+        Formatted address string
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="TalentPool contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for completePool
-        params = ContractFunctionParameters()
-        params.addUint256(int(pool_id))
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("completePool", params)
+    if not address:
+        return ""
+    
+    if len(address) > 10:
+        return f"{address[:6]}...{address[-4:]}"
+    
+    return address
+
+
+# Network identity only changes on restart; cache it for status endpoints
+_NETWORK_INFO_CACHE = _TTLCache(maxsize=1, ttl=30.0)
+
+
+def get_network_info() -> Dict[str, Any]:
+    """
+    Get current network information.
+    
+    Returns:
+        Network configuration dictionary
+    """
+    cached = _NETWORK_INFO_CACHE.get('network_info')
+    if cached is not None:
+        return dict(cached)
+    
+    try:
+        client = get_hedera_client()
+        settings = get_settings()
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        network_info = {
+            'name': settings.hedera_network,
+            'client_network': str(client.getNetworkName()),
+            'operator_account': str(client.getOperatorAccountId()),
+            'mirror_node': settings.hedera_mirror_node_url
+        }
+        _NETWORK_INFO_CACHE.set('network_info', network_info)
+        return dict(network_info)
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to complete pool: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
-
+        logger.error("Failed to get network info: %s", e)
+        return {
+            'name': 'unknown',
+            'error': str(e)
+        }
 
-async def close_pool(
-    pool_id: str
+async def register_reputation_oracle(
+    name: str,
+    specializations: List[str]
 ) -> TransactionResult:
     """
-    Close a job pool using the TalentPool smart contract.
+    Register a new reputation oracle.
     
     Args:
-        pool_id: ID of the job pool to close
+        name: Oracle name
+        specializations: List of oracle specializations
         
     Returns:
         TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="TalentPool contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for closePool
-        params = ContractFunctionParameters()
-        params.addUint256(int(pool_id))
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("closePool", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to close pool: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    result, _ = await _execute_contract_call("registerOracle", (name, specializations))
+    return result
 
 
-async def withdraw_application(
-    pool_id: str
+async def submit_work_evaluation(
+    user: str,
+    skill_token_ids: List[int],
+    work_description: str,
+    work_content: str,
+    overall_score: int,
+    skill_scores: List[int],
+    feedback: str,
+    ipfs_hash: str
 ) -> TransactionResult:
     """
-    Withdraw an application from a job pool using the TalentPool smart contract.
+    Submit a work evaluation.
     
     Args:
-        pool_id: ID of the job pool to withdraw from
+        user: User address being evaluated
+        skill_token_ids: List of skill token IDs
+        work_description: Description of the work
+        work_content: Content of the work
+        overall_score: Overall evaluation score
+        skill_scores: Individual skill scores
+        feedback: Evaluation feedback
+        ipfs_hash: IPFS hash for evaluation data
         
     Returns:
         TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+    result, record = await _execute_contract_call("submitWorkEvaluation", (
+        user, skill_token_ids, work_description, work_content,
+        overall_score, skill_scores, feedback, ipfs_hash
+    ))
+    if record is None:
+        return result
+    # Reuse token_id field for evaluation_id
+    return replace(result, token_id=_returned_id(record, "eval"))
+
+
+async def resolve_challenge(
+    challenge_id: str,
+    uphold_original: bool,
+    resolution: str
+) -> TransactionResult:
+    """
+    Resolve a challenge using the ReputationOracle smart contract.
+    
+    Args:
+        challenge_id: ID of the challenge to resolve
+        uphold_original: Whether to uphold the original evaluation
+        resolution: Resolution description
         
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("resolveChallenge", (challenge_id, uphold_original, resolution))
+    return result
+
+
+async def slash_oracle(
+    oracle_address: str,
+    amount: int,
+    reason: str
+) -> TransactionResult:
+    """
+    Slash an oracle using the ReputationOracle smart contract.
+    
+    Args:
+        oracle_address: Address of the oracle to slash
+        amount: Amount to slash
+        reason: Reason for slashing
         
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="TalentPool contract not deployed"
-            )
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("slashOracle", (oracle_address, amount, reason))
+    return result
+
+
+async def withdraw_oracle_stake() -> TransactionResult:
+    """
+    Withdraw oracle stake using the ReputationOracle smart contract.
+    
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("withdrawOracleStake")
+    return result
+
+
+# Short-lived so dashboards polling the same oracle share one chain read
+_ORACLE_PERFORMANCE_CACHE = _TTLCache(maxsize=1024, ttl=3.0)
+
+
+async def get_oracle_performance(
+    oracle_address: str
+) -> Dict[str, Any]:
+    """
+    Get oracle performance metrics using the ReputationOracle smart contract.
+    
+    The read is hedged across the JSON-RPC relay and the mirror node, so one
+    slow endpoint does not stall the request. Concurrent requests for the
+    same oracle share one read, and successful results are reused for a few
+    seconds.
+    
+    Args:
+        oracle_address: Address of the oracle
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+    Returns:
+        Dictionary containing performance metrics
+    """
+    key = _reputation_key(oracle_address)
+    cached = _ORACLE_PERFORMANCE_CACHE.get(key)
+    if cached is None:
+        cached = await _coalesced(
+            ("oracle_performance", key),
+            partial(_fetch_oracle_performance, oracle_address, key)
+        )
+    return dict(cached)
+
+
+async def _fetch_oracle_performance(oracle_address: str, key: str) -> Dict[str, Any]:
+    """Read oracle performance from the chain and cache it on success."""
+    try:
+        contract_address, _ = _resolve_contract('ReputationOracle')
         
-        # Prepare function parameters for withdrawApplication
-        params = ContractFunctionParameters()
-        params.addUint256(int(pool_id))
+        if contract_address is None:
+            return {
+                "success": False,
+                "error": "ReputationOracle contract not deployed"
+            }
         
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("withdrawApplication", params)
+        # getOraclePerformance(address) returns
+        # (evaluationsCompleted, successfulChallenges, failedChallenges, lastActivity)
+        result = await _hedged_contract_call(CallSpec(
+            contract_address=contract_address,
+            function="getOraclePerformance(address)",
+            args=(oracle_address,),
+            output_types=("uint256", "uint256", "uint256", "uint256")
+        ))
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        if not result.success:
+            return {
+                "success": False,
+                "error": f"Query failed: {result.error}"
+            }
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        evaluations_completed, successful_challenges, failed_challenges, last_activity = result.values
+        performance = {
+            "success": True,
+            "oracle_address": oracle_address,
+            "performance": {
+                "evaluations_completed": evaluations_completed,
+                "successful_challenges": successful_challenges,
+                "failed_challenges": failed_challenges,
+                "last_activity": last_activity
+            }
+        }
+        _ORACLE_PERFORMANCE_CACHE.set(key, performance)
+        return performance
             
     except Exception as e:
-        logger.error(f"Failed to withdraw application: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        logger.error("Failed to get oracle performance: %s", e)
+        return {
+            "success": False,
+            "error": str(e)
+        }
 
 
-async def calculate_match_score(
-    pool_id: str,
-    candidate_address: str
-) -> Dict[str, Any]:
+async def get_oracle_performance_batch(
+    oracle_addresses: List[str]
+) -> Dict[str, Dict[str, Any]]:
     """
-    Calculate match score for a candidate in a job pool using the TalentPool smart contract.
+    Get performance metrics for several oracles in one JSON-RPC round-trip.
     
     Args:
-        pool_id: ID of the job pool
-        candidate_address: Address of the candidate
+        oracle_addresses: Addresses of the oracles
         
     Returns:
-        Dictionary containing match score and details
+        Mapping of oracle address to the same dictionary get_oracle_performance returns
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+        contract_address, _ = _resolve_contract('ReputationOracle')
         
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
+        if contract_address is None:
+            error = {"success": False, "error": "ReputationOracle contract not deployed"}
+            return {address: dict(error) for address in oracle_addresses}
         
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "TalentPool contract not deployed"
+        results = await batch_contract_call([
+            CallSpec(
+                contract_address=contract_address,
+                function="getOraclePerformance(address)",
+                args=(address,),
+                output_types=("uint256", "uint256", "uint256", "uint256")
+            )
+            for address in oracle_addresses
+        ])
+        
+        performances: Dict[str, Dict[str, Any]] = {}
+        for address, result in zip(oracle_addresses, results):
+            if not result.success:
+                performances[address] = {"success": False, "error": result.error}
+                continue
+            evaluations_completed, successful_challenges, failed_challenges, last_activity = result.values
+            performances[address] = {
+                "success": True,
+                "oracle_address": address,
+                "performance": {
+                    "evaluations_completed": evaluations_completed,
+                    "successful_challenges": successful_challenges,
+                    "failed_challenges": failed_challenges,
+                    "last_activity": last_activity
+                }
             }
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        return performances
         
-        # Prepare function parameters for calculateMatchScore
-        params = ContractFunctionParameters()
-        params.addUint256(int(pool_id))
-        params.addAddress(candidate_address)
+    except Exception as e:
+        logger.error("Failed to get oracle performance batch: %s", e)
+        return {address: {"success": False, "error": str(e)} for address in oracle_addresses}
+
+
+# =============================================================================
+# ADDITIONAL SKILL TOKEN FUNCTIONS
+# =============================================================================
+
+async def endorse_skill_token(
+    token_id: str,
+    endorsement_data: str
+) -> TransactionResult:
+    """
+    Endorse a skill token using the SkillToken smart contract.
+    
+    Args:
+        token_id: ID of the skill token to endorse
+        endorsement_data: Data describing the endorsement
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("calculateMatchScore", params)
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("endorseSkillToken", (token_id, endorsement_data))
+    return result
+
+
+_SKILL_TOKEN_ENDORSED_TOPIC = keccak(b"SkillTokenEndorsed(uint256,address,string)")
+
+
+def _endorsement_from_record(
+    record: TransactionRecord,
+    endorsement_data: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the endorsement written by a transaction from its SkillTokenEndorsed log.
+    
+    Args:
+        record: Record of a successful endorseSkillToken transaction
+        endorsement_data: Data that was endorsed
         
-        # Execute query
-        response = query.execute(client)
+    Returns:
+        Endorsement in the shape get_skill_endorsements returns, or None if no log matched
+    """
+    function_result = record.contractFunctionResult
+    if not function_result:
+        return None
+    
+    for log in function_result.logs:
+        topics = [bytes(b & 0xFF for b in topic.toByteArray()) for topic in log.topics]
+        if len(topics) < 3 or topics[0] != _SKILL_TOKEN_ENDORSED_TOPIC:
+            continue
+        return {
+            "endorser": abi_decode(("address",), topics[2])[0],
+            "endorsement_data": endorsement_data,
+            "timestamp": record.consensusTimestamp.getEpochSecond()
+        }
+    
+    return None
+
+
+async def endorse_and_fetch(
+    token_id: str,
+    endorsement_data: str
+) -> Tuple[TransactionResult, Dict[str, Any]]:
+    """
+    Endorse a skill token and return its updated endorsement list.
+    
+    The current endorsements are read while the endorsement reaches consensus,
+    and the new one is appended from the transaction's SkillTokenEndorsed log,
+    so callers need no follow-up get_skill_endorsements query.
+    
+    Args:
+        token_id: ID of the skill token to endorse
+        endorsement_data: Data describing the endorsement
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                match_score = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "pool_id": pool_id,
-                    "candidate_address": candidate_address,
-                    "match_score": match_score
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse match score data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "pool_id": pool_id,
-                    "candidate_address": candidate_address,
-                    "match_score": 0
-                }
-        else:
+    Returns:
+        Tuple of the endorsement TransactionResult and the endorsement dictionary
+    """
+    (result, record), endorsements = await asyncio.gather(
+        _execute_contract_call("endorseSkillToken", (token_id, endorsement_data)),
+        get_skill_endorsements(token_id)
+    )
+    
+    if not result.success or not endorsements["success"]:
+        return result, endorsements
+    
+    endorsement = _endorsement_from_record(record, endorsement_data) if record else None
+    if endorsement is None:
+        return result, await get_skill_endorsements(token_id)
+    
+    # The read may already have observed the new endorsement
+    existing = endorsements["endorsements"]
+    if not existing or existing[-1] != endorsement:
+        existing.append(endorsement)
+    
+    return result, endorsements
+
+
+async def renew_skill_token(
+    token_id: str,
+    new_expiry_date: int
+) -> TransactionResult:
+    """
+    Renew a skill token using the SkillToken smart contract.
+    
+    Args:
+        token_id: ID of the skill token to renew
+        new_expiry_date: New expiry date as Unix timestamp
+        
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("renewSkillToken", (token_id, new_expiry_date))
+    return result
+
+
+async def revoke_skill_token(
+    token_id: str,
+    reason: str
+) -> TransactionResult:
+    """
+    Revoke a skill token using the SkillToken smart contract.
+    
+    Args:
+        token_id: ID of the skill token to revoke
+        reason: Reason for revocation
+        
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("revokeSkillToken", (token_id, reason))
+    return result
+
+
+def _endorsements_call(contract_address: str, token_id: str) -> CallSpec:
+    """Build the getSkillEndorsements call for a token."""
+    # getSkillEndorsements(uint256) returns SkillEndorsement[]
+    # (address endorser, string endorsementData, uint64 timestamp, bool isActive)
+    return CallSpec(
+        contract_address=contract_address,
+        function="getSkillEndorsements(uint256)",
+        args=(int(token_id),),
+        output_types=("(address,string,uint64,bool)[]",)
+    )
+
+
+def _endorsements_from_values(values: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+    """Shape the decoded SkillEndorsement[] return value as endorsement dictionaries."""
+    return [
+        {
+            "endorser": endorser,
+            "endorsement_data": endorsement_data,
+            "timestamp": timestamp
+        }
+        for endorser, endorsement_data, timestamp, _ in values[0]
+    ]
+
+
+async def get_skill_endorsements(
+    token_id: str
+) -> Dict[str, Any]:
+    """
+    Get endorsements for a skill token using the SkillToken smart contract.
+    
+    The read is hedged across the JSON-RPC relay and the mirror node, so one
+    slow endpoint does not stall the request.
+    
+    Args:
+        token_id: ID of the skill token
+        
+    Returns:
+        Dictionary containing endorsement data
+    """
+    try:
+        contract_address, _ = _resolve_contract('SkillToken')
+        
+        if contract_address is None:
+            return {
+                "success": False,
+                "error": "SkillToken contract not deployed"
+            }
+        
+        result = await _hedged_contract_call(_endorsements_call(contract_address, token_id))
+        
+        if not result.success:
             return {
                 "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
+                "error": f"Query failed: {result.error}"
             }
+        
+        return {
+            "success": True,
+            "endorsements": _endorsements_from_values(result.values),
+            "token_id": token_id
+        }
             
     except Exception as e:
-        logger.error(f"Failed to calculate match score: {str(e)}")
+        logger.error("Failed to get skill endorsements: %s", e)
         return {
             "success": False,
             "error": str(e)
         }
 
 
-# =============================================================================
-# ADDITIONAL GOVERNANCE FUNCTIONS
-# =============================================================================
-
-async def queue_proposal(
-    proposal_id: str
-) -> TransactionResult:
+async def get_skill_endorsements_batch(
+    token_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
     """
-    Queue a governance proposal for execution using the Governance smart contract.
+    Get endorsements for several skill tokens in one JSON-RPC round-trip.
     
     Args:
-        proposal_id: ID of the proposal to queue
+        token_ids: IDs of the skill tokens
         
     Returns:
-        TransactionResult with success status and details
+        Mapping of token ID to the same dictionary get_skill_endorsements returns
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="Governance contract not deployed"
-            )
+        contract_address, _ = _resolve_contract('SkillToken')
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        if contract_address is None:
+            error = {"success": False, "error": "SkillToken contract not deployed"}
+            return {token_id: dict(error) for token_id in token_ids}
         
-        # Prepare function parameters for queueProposal
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
+        results = await batch_contract_call([
+            _endorsements_call(contract_address, token_id)
+            for token_id in token_ids
+        ])
         
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("queueProposal", params)
+        endorsements_by_token: Dict[str, Dict[str, Any]] = {}
+        for token_id, result in zip(token_ids, results):
+            if not result.success:
+                endorsements_by_token[token_id] = {"success": False, "error": result.error}
+                continue
+            endorsements_by_token[token_id] = {
+                "success": True,
+                "endorsements": _endorsements_from_values(result.values),
+                "token_id": token_id
+            }
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        return endorsements_by_token
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
     except Exception as e:
-        logger.error(f"Failed to queue proposal: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+        logger.error("Failed to get skill endorsements batch: %s", e)
+        return {token_id: {"success": False, "error": str(e)} for token_id in token_ids}
 
 
-async def execute_proposal(
-    proposal_id: str
+# Tokens per markExpiredTokens call, sized to stay within the gas limit
+_EXPIRY_CHUNK_SIZE = 50
+_EXPIRY_CONCURRENCY = 4
+
+
+async def mark_expired_tokens(
+    token_ids: List[str]
 ) -> TransactionResult:
     """
-    Execute a governance proposal using the Governance smart contract.
+    Mark skill tokens as expired using the SkillToken smart contract.
+    
+    Large sweeps are split into chunks of ``_EXPIRY_CHUNK_SIZE`` tokens so
+    each call fits its gas limit; up to ``_EXPIRY_CONCURRENCY`` chunks are
+    submitted at a time.
     
     Args:
-        proposal_id: ID of the proposal to execute
+        token_ids: List of token IDs to mark as expired
         
     Returns:
-        TransactionResult with success status and details
+        TransactionResult aggregated over all chunks; transaction_id lists the
+        comma-separated chunk transactions
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+        contract_address, contract_id = _resolve_contract('SkillToken')
         
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
+        if contract_id is None:
             return TransactionResult(
                 success=False,
-                error="Governance contract not deployed"
+                error="SkillToken contract not deployed"
             )
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for executeProposal
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
+        ids = list(map(int, token_ids))
+        semaphore = asyncio.Semaphore(_EXPIRY_CONCURRENCY)
         
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(300000)
-        transaction.setFunction("executeProposal", params)
+        async def _submit_chunk(chunk: List[int]) -> TransactionResult:
+            async with semaphore:
+                result, _ = await _execute_contract_call("markExpiredTokens", (chunk,))
+                return result
         
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
+        results = await _gather_transactions(
+            _submit_chunk(ids[start:start + _EXPIRY_CHUNK_SIZE])
+            for start in range(0, len(ids), _EXPIRY_CHUNK_SIZE)
+        )
         
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
+        return _combine_results(results, contract_address)
             
     except Exception as e:
-        logger.error(f"Failed to execute proposal: {str(e)}")
+        logger.error("Failed to mark expired tokens: %s", e)
         return TransactionResult(
             success=False,
             error=str(e)
         )
 
 
-async def cancel_proposal(
-    proposal_id: str
+# =============================================================================
+# ADDITIONAL TALENT POOL FUNCTIONS
+# =============================================================================
+
+async def select_candidate(
+    pool_id: str,
+    candidate_address: str
 ) -> TransactionResult:
     """
-    Cancel a governance proposal using the Governance smart contract.
+    Select a candidate for a job pool using the TalentPool smart contract.
     
     Args:
-        proposal_id: ID of the proposal to cancel
+        pool_id: ID of the job pool
+        candidate_address: Address of the selected candidate
         
     Returns:
         TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="Governance contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for cancelProposal
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("cancelProposal", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to cancel proposal: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    result, _ = await _execute_contract_call("selectCandidate", (pool_id, candidate_address))
+    if result.success:
+        invalidate_pool_cache(pool_id)
+    return result
 
 
-async def cast_vote_with_signature(
-    proposal_id: str,
-    vote: int,
-    reason: str,
-    signature: str
+async def complete_pool(
+    pool_id: str
 ) -> TransactionResult:
     """
-    Cast a vote on a governance proposal with signature using the Governance smart contract.
+    Complete a job pool using the TalentPool smart contract.
     
     Args:
-        proposal_id: ID of the proposal to vote on
-        vote: Vote type (0=Against, 1=For, 2=Abstain)
-        reason: Optional reason for the vote
-        signature: Signature for the vote
+        pool_id: ID of the job pool to complete
         
     Returns:
         TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="Governance contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for castVoteWithSignature
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
-        params.addUint8(vote)
-        params.addString(reason)
-        params.addBytes(bytes.fromhex(signature.replace('0x', '')))
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(250000)
-        transaction.setFunction("castVoteWithSignature", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to cast vote with signature: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    result, _ = await _execute_contract_call("completePool", (pool_id,))
+    if result.success:
+        invalidate_pool_cache(pool_id)
+    return result
 
 
-async def batch_execute_proposals(
-    proposal_ids: List[str]
+async def close_pool(
+    pool_id: str
 ) -> TransactionResult:
     """
-    Batch execute multiple governance proposals using the Governance smart contract.
+    Close a job pool using the TalentPool smart contract.
     
     Args:
-        proposal_ids: List of proposal IDs to execute
+        pool_id: ID of the job pool to close
         
     Returns:
         TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="Governance contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for batchExecuteProposals
-        params = ContractFunctionParameters()
-        params.addUint256Array([int(proposal_id) for proposal_id in proposal_ids])
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(500000)  # Higher gas for batch operation
-        transaction.setFunction("batchExecuteProposals", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to batch execute proposals: {str(e)}")
-        return TransactionResult(
-            success=False,
-            error=str(e)
-        )
+    result, _ = await _execute_contract_call("closePool", (pool_id,))
+    if result.success:
+        invalidate_pool_cache(pool_id)
+    return result
 
 
-# =============================================================================
-# ADDITIONAL REPUTATION ORACLE FUNCTIONS
-# =============================================================================
-
-async def get_category_score(
-    user_address: str,
-    category: str
-) -> Dict[str, Any]:
+async def withdraw_application(
+    pool_id: str
+) -> TransactionResult:
     """
-    Get category-specific reputation score using the ReputationOracle smart contract.
+    Withdraw an application from a job pool using the TalentPool smart contract.
     
     Args:
-        user_address: User's address
-        category: Skill category
+        pool_id: ID of the job pool to withdraw from
         
     Returns:
-        Dictionary containing category score
+        TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "ReputationOracle contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getCategoryScore
-        params = ContractFunctionParameters()
-        params.addAddress(user_address)
-        params.addString(category)
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getCategoryScore", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                category_score = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "user_address": user_address,
-                    "category": category,
-                    "score": category_score
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse category score data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "user_address": user_address,
-                    "category": category,
-                    "score": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get category score: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    result, _ = await _execute_contract_call("withdrawApplication", (pool_id,))
+    if result.success:
+        invalidate_pool_cache(pool_id)
+    return result
 
 
-async def get_work_evaluation(
-    evaluation_id: str
+# Match scores only move when the pool or the candidate's skills change
+_MATCH_SCORE_CACHE = _TTLCache(maxsize=10_000, ttl=60.0)
+
+
+async def calculate_match_score(
+    pool_id: str,
+    candidate_address: str
 ) -> Dict[str, Any]:
     """
-    Get work evaluation details using the ReputationOracle smart contract.
+    Calculate match score for a candidate in a job pool using the TalentPool smart contract.
     
     Args:
-        evaluation_id: ID of the evaluation
+        pool_id: ID of the job pool
+        candidate_address: Address of the candidate
         
     Returns:
-        Dictionary containing evaluation details
+        Dictionary containing match score and details
     """
+    cache_key = (str(pool_id), _reputation_key(candidate_address))
+    match_score = _MATCH_SCORE_CACHE.get(cache_key)
+    if match_score is not None:
+        return {
+            "success": True,
+            "pool_id": pool_id,
+            "candidate_address": candidate_address,
+            "match_score": match_score
+        }
+    
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        client = _client_pool.acquire()
+        contract_address, contract_id = _resolve_contract('TalentPool')
         
-        if not contract_address:
+        if contract_id is None:
             return {
                 "success": False,
-                "error": "ReputationOracle contract not deployed"
+                "error": "TalentPool contract not deployed"
             }
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getWorkEvaluation
+        # Prepare function parameters for calculateMatchScore
         params = ContractFunctionParameters()
-        params.addUint256(int(evaluation_id))
+        params.addUint256(int(pool_id))
+        params.addAddress(candidate_address)
         
         # Execute contract query
         query = ContractCallQuery()
         query.setContractId(contract_id)
         query.setGas(100000)
-        query.setFunction("getWorkEvaluation", params)
+        query.setFunction("calculateMatchScore", params)
         
         # Execute query
-        response = query.execute(client)
+        response = await _exec(query.execute, client)
         
-        if response.getStatus() == Status.Success:
+        status = response.getStatus()
+        if status == _SUCCESS:
             # Parse the response data
             result = response.getContractFunctionResult()
             
             try:
-                evaluation = {
-                    "user": result.getAddress(0) if result else "",
-                    "skill_token_ids": [result.getUint256(1)] if result else [],  # Simplified for single token
-                    "overall_score": result.getUint256(2) if result else 0,
-                    "feedback": result.getString(3) if result else "",
-                    "evaluated_by": result.getAddress(4) if result else "",
-                    "timestamp": result.getUint64(5) if result else 0,
-                    "ipfs_hash": result.getString(6) if result else ""
-                }
+                match_score = _uint256_words(result, 1)[0] if result else 0
+                _MATCH_SCORE_CACHE.set(cache_key, match_score)
                 
                 return {
                     "success": True,
-                    "evaluation_id": evaluation_id,
-                    "evaluation": evaluation
+                    "pool_id": pool_id,
+                    "candidate_address": candidate_address,
+                    "match_score": match_score
                 }
                 
             except Exception as parse_error:
-                logger.warning(f"Could not parse work evaluation data: {str(parse_error)}")
+                logger.warning("Could not parse match score data: %s", parse_error)
                 return {
                     "success": True,
-                    "evaluation_id": evaluation_id,
-                    "evaluation": {
-                        "user": "",
-                        "skill_token_ids": [],
-                        "overall_score": 0,
-                        "feedback": "",
-                        "evaluated_by": "",
-                        "timestamp": 0,
-                        "ipfs_hash": ""
-                    }
+                    "pool_id": pool_id,
+                    "candidate_address": candidate_address,
+                    "match_score": 0
                 }
         else:
             return {
                 "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
+                "error": f"Query failed with status: {status}"
             }
             
     except Exception as e:
-        logger.error(f"Failed to get work evaluation: {str(e)}")
+        logger.error("Failed to calculate match score: %s", e)
         return {
             "success": False,
             "error": str(e)
         }
 
 
-async def get_user_evaluations(
-    user_address: str
-) -> Dict[str, Any]:
+async def calculate_match_scores(
+    pool_id: str,
+    candidate_addresses: List[str]
+) -> List[Dict[str, Any]]:
     """
-    Get all evaluations for a user using the ReputationOracle smart contract.
+    Calculate match scores for several candidates in a job pool.
+    
+    Cached scores are reused; the rest are read in one JSON-RPC round-trip.
     
     Args:
-        user_address: User's address
+        pool_id: ID of the job pool
+        candidate_addresses: Addresses of the candidates
         
     Returns:
-        Dictionary containing user evaluations
+        One dictionary per candidate, in order, shaped like calculate_match_score's
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
+        scores: Dict[str, Any] = {}
+        missing = []
+        for candidate in candidate_addresses:
+            score = _MATCH_SCORE_CACHE.get((str(pool_id), _reputation_key(candidate)))
+            if score is None:
+                missing.append(candidate)
+            else:
+                scores[candidate] = score
+        
+        errors: Dict[str, str] = {}
+        if missing:
+            contract_address, _ = _resolve_contract('TalentPool')
+            
+            if contract_address is None:
+                return [
+                    {"success": False, "error": "TalentPool contract not deployed"}
+                    for _ in candidate_addresses
+                ]
+            
+            results = await batch_contract_call([
+                CallSpec(
+                    contract_address=contract_address,
+                    function="calculateMatchScore(uint256,address)",
+                    args=(int(pool_id), candidate),
+                    output_types=("uint256",)
+                )
+                for candidate in missing
+            ])
+            
+            for candidate, result in zip(missing, results):
+                if result.success:
+                    scores[candidate] = result.values[0]
+                    _MATCH_SCORE_CACHE.set((str(pool_id), _reputation_key(candidate)), result.values[0])
+                else:
+                    errors[candidate] = result.error or "Query failed"
         
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "ReputationOracle contract not deployed"
+        return [
+            {"success": False, "error": errors[candidate]} if candidate in errors
+            else {
+                "success": True,
+                "pool_id": pool_id,
+                "candidate_address": candidate,
+                "match_score": scores[candidate]
             }
+            for candidate in candidate_addresses
+        ]
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getUserEvaluations
-        params = ContractFunctionParameters()
-        params.addAddress(user_address)
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getUserEvaluations", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                # This is a simplified implementation - actual contract may return different structure
-                evaluations = []
-                # For now, return empty list as the actual structure depends on contract implementation
-                
-                return {
-                    "success": True,
-                    "user_address": user_address,
-                    "evaluations": evaluations
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse user evaluations data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "user_address": user_address,
-                    "evaluations": []
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
     except Exception as e:
-        logger.error(f"Failed to get user evaluations: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+        logger.error("Failed to calculate match scores: %s", e)
+        return [{"success": False, "error": str(e)} for _ in candidate_addresses]
 
 
-async def get_global_stats() -> Dict[str, Any]:
+# =============================================================================
+# ADDITIONAL GOVERNANCE FUNCTIONS
+# =============================================================================
+
+async def queue_proposal(
+    proposal_id: str
+) -> TransactionResult:
     """
-    Get global reputation statistics using the ReputationOracle smart contract.
+    Queue a governance proposal for execution using the Governance smart contract.
     
+    Args:
+        proposal_id: ID of the proposal to queue
+        
     Returns:
-        Dictionary containing global stats
+        TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "ReputationOracle contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getGlobalStats (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getGlobalStats", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                stats = {
-                    "total_evaluations": result.getUint256(0) if result else 0,
-                    "total_challenges": result.getUint256(1) if result else 0,
-                    "total_oracle_stake": result.getUint256(2) if result else 0,
-                    "active_oracle_count": result.getUint256(3) if result else 0
-                }
-                
-                return {
-                    "success": True,
-                    "stats": stats
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse global stats data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "stats": {
-                        "total_evaluations": 0,
-                        "total_challenges": 0,
-                        "total_oracle_stake": 0,
-                        "active_oracle_count": 0
-                    }
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get global stats: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    result, _ = await _execute_contract_call("queueProposal", (proposal_id,))
+    return result
 
 
-async def update_oracle_status(
-    oracle_address: str,
-    is_active: bool,
-    reason: str
+# Proposals this process has executed; execution is final, so a repeat can only
+# revert on chain. Exact and insertion-ordered, oldest dropped past the cap.
+_EXECUTED_PROPOSALS: Dict[str, None] = {}
+_EXECUTED_PROPOSALS_MAX = 100_000
+
+
+async def execute_proposal(
+    proposal_id: str
 ) -> TransactionResult:
     """
-    Update oracle status using the ReputationOracle smart contract.
+    Execute a governance proposal using the Governance smart contract.
+    
+    A repeat within 10 seconds returns the first execution's result; later
+    repeats are rejected locally, since execution is final.
     
     Args:
-        oracle_address: Address of the oracle
-        is_active: Whether the oracle should be active
-        reason: Reason for status change
+        proposal_id: ID of the proposal to execute
         
     Returns:
         TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get ReputationOracle contract info
-        oracle_config = contract_config.get('contracts', {}).get('ReputationOracle', {})
-        contract_address = oracle_config.get('address')
-        
-        if not contract_address:
-            return TransactionResult(
-                success=False,
-                error="ReputationOracle contract not deployed"
-            )
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for updateOracleStatus
-        params = ContractFunctionParameters()
-        params.addAddress(oracle_address)
-        params.addBool(is_active)
-        params.addString(reason)
-        
-        # Execute contract function
-        transaction = ContractExecuteTransaction()
-        transaction.setContractId(contract_id)
-        transaction.setGas(200000)
-        transaction.setFunction("updateOracleStatus", params)
-        
-        # Sign and execute
-        response = transaction.execute(client)
-        receipt = response.getReceipt(client)
-        
-        if receipt.status == Status.Success:
-            return TransactionResult(
-                success=True,
-                transaction_id=response.transactionId.toString(),
-                gas_used=response.getRecord(client).gasUsed if response.getRecord(client) else 0,
-                contract_address=contract_address
-            )
-        else:
-            return TransactionResult(
-                success=False,
-                error=f"Transaction failed with status: {receipt.status}"
-            )
-            
-    except Exception as e:
-        logger.error(f"Failed to update oracle status: {str(e)}")
+    key = _write_key("executeProposal", (proposal_id,))
+    recent: Optional[Tuple[TransactionResult, Optional[TransactionRecord]]] = _RECENT_WRITES.get(key)
+    if recent is not None:
+        return recent[0]
+    
+    if str(proposal_id) in _EXECUTED_PROPOSALS:
         return TransactionResult(
             success=False,
-            error=str(e)
+            error=f"Proposal {proposal_id} has already been executed"
         )
+    
+    result, _ = await _execute_contract_call("executeProposal", (proposal_id,))
+    if result.success:
+        invalidate_governance_cache()
+        _EXECUTED_PROPOSALS[str(proposal_id)] = None
+        if len(_EXECUTED_PROPOSALS) > _EXECUTED_PROPOSALS_MAX:
+            del _EXECUTED_PROPOSALS[next(iter(_EXECUTED_PROPOSALS))]
+    return result
 
 
-async def get_tokens_by_category(
-    category: str
-) -> Dict[str, Any]:
+async def cancel_proposal(
+    proposal_id: str
+) -> TransactionResult:
     """
-    Get all skill tokens in a specific category using the SkillToken smart contract.
+    Cancel a governance proposal using the Governance smart contract.
     
     Args:
-        category: Skill category to search for
+        proposal_id: ID of the proposal to cancel
         
     Returns:
-        Dictionary containing tokens in the category
+        TransactionResult with success status and details
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "SkillToken contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getTokensByCategory
-        params = ContractFunctionParameters()
-        params.addString(category)
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getTokensByCategory", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            tokens = []
-            
-            try:
-                # This is a simplified implementation - actual contract may return different structure
-                # For now, return empty list as the actual structure depends on contract implementation
-                
-                return {
-                    "success": True,
-                    "category": category,
-                    "tokens": tokens
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse category tokens data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "category": category,
-                    "tokens": []
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get tokens by category: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    result, _ = await _execute_contract_call("cancelProposal", (proposal_id,))
+    return result
 
 
-async def get_total_skills_by_category(
-    category: str
-) -> Dict[str, Any]:
+# r || s || v
+_SIGNATURE_LENGTH = 65
+
+
+def _decode_sig(signature: Union[str, bytes, bytearray]) -> bytes:
     """
-    Get total number of skills in a category using the SkillToken smart contract.
+    Decode a vote signature to raw bytes, accepting hex with or without 0x.
+    
+    Raises:
+        ValueError: If the signature is not valid hex or not 65 bytes long
+    """
+    if isinstance(signature, str):
+        decoded = bytes.fromhex(signature.removeprefix('0x'))
+    else:
+        decoded = bytes(signature)
+    if len(decoded) != _SIGNATURE_LENGTH:
+        raise ValueError(f"Signature must be {_SIGNATURE_LENGTH} bytes, got {len(decoded)}")
+    return decoded
+
+
+async def cast_vote_with_signature(
+    proposal_id: str,
+    vote: int,
+    reason: str,
+    signature: Union[str, bytes, bytearray]
+) -> TransactionResult:
+    """
+    Cast a vote on a governance proposal with signature using the Governance smart contract.
     
     Args:
-        category: Skill category to count
+        proposal_id: ID of the proposal to vote on
+        vote: Vote type (0=Against, 1=For, 2=Abstain)
+        reason: Optional reason for the vote
+        signature: 65-byte vote signature, as bytes or hex
         
     Returns:
-        Dictionary containing total count
+        TransactionResult with success status and details
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get SkillToken contract info
-        skill_token_config = contract_config.get('contracts', {}).get('SkillToken', {})
-        contract_address = skill_token_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "SkillToken contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getTotalSkillsByCategory
-        params = ContractFunctionParameters()
-        params.addString(category)
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getTotalSkillsByCategory", params)
-        
-        # Execute query
-        response = query.execute(client)
+        signature_bytes = _decode_sig(signature)
+    except ValueError as e:
+        return TransactionResult(
+            success=False,
+            error=f"Invalid signature: {e}"
+        )
+    
+    result, _ = await _execute_contract_call("castVoteWithSignature", (proposal_id, vote, reason, signature_bytes))
+    return result
+
+
+async def batch_execute_proposals(
+    proposal_ids: List[Union[int, str]]
+) -> TransactionResult:
+    """
+    Batch execute multiple governance proposals using the Governance smart contract.
+    
+    batchExecuteProposals reverts as a whole if any one execution reverts;
+    in that case the proposals are executed individually so the others
+    still go through.
+    
+    Args:
+        proposal_ids: List of proposal IDs to execute; duplicates are dropped
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                total_count = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "category": category,
-                    "total_count": total_count
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse total skills data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "category": category,
-                    "total_count": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get total skills by category: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    Returns:
+        TransactionResult with success status and details
+    """
+    try:
+        ids = list(dict.fromkeys(
+            proposal_id if type(proposal_id) is int else int(proposal_id)
+            for proposal_id in proposal_ids
+        ))
+    except (TypeError, ValueError) as e:
+        logger.error("Failed to batch execute proposals: %s", e)
+        return TransactionResult(
+            success=False,
+            error=str(e)
+        )
+    
+    result, _ = await _execute_contract_call("batchExecuteProposals", (ids,))
+    if result.success:
+        invalidate_governance_cache()
+    if result.success or result.error == "Governance contract not deployed" or len(ids) < 2:
+        return result
+    
+    logger.warning("Batch execution of %d proposals failed (%s); executing individually", len(ids), result.error)
+    return await _fallback_batch_execute(ids)
+
+
+async def _fallback_batch_execute(proposal_ids: List[int]) -> TransactionResult:
+    """Execute proposals as concurrent independent transactions and combine the results."""
+    results = await _gather_transactions(execute_proposal(str(proposal_id)) for proposal_id in proposal_ids)
+    return _combine_results(results, _resolve_contract('Governance')[0])
 
 
 # =============================================================================
-# ADDITIONAL GOVERNANCE FUNCTIONS
+# ADDITIONAL REPUTATION ORACLE FUNCTIONS
 # =============================================================================
 
-async def get_proposal_status(
-    proposal_id: str
-) -> Dict[str, Any]:
+# Shared parameters for zero-argument calls; never add to it
+_EMPTY_PARAMS = ContractFunctionParameters()
+
+
+def _contract_query(
+    contract_id: ContractId,
+    function_name: str,
+    params: Optional[ContractFunctionParameters] = None,
+    gas: int = 100000
+) -> ContractCallQuery:
     """
-    Get proposal status using the Governance smart contract.
+    Build a ContractCallQuery in one chained expression.
+    
+    Queries are built per call: the SDK records the node and payment on a
+    query when it executes, so an executed query cannot be reused as a template.
     
     Args:
-        proposal_id: ID of the proposal
+        contract_id: Contract to query
+        function_name: Contract function to call
+        params: Function parameters; none if omitted
+        gas: Gas limit for the query
         
     Returns:
-        Dictionary containing proposal status
+        Unexecuted ContractCallQuery
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getProposalStatus
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getProposalStatus", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                status = result.getUint8(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "status": status
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse proposal status data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "status": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get proposal status: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return (
+        ContractCallQuery()
+        .setContractId(contract_id)
+        .setGas(gas)
+        .setFunction(function_name, params if params is not None else _EMPTY_PARAMS)
+    )
 
 
-async def get_vote_receipt(
-    proposal_id: str,
-    voter: str
+# getUserEvaluations and getTokensByCategory results are not decoded yet (the
+# structure depends on the contract implementation); until they are, these
+# readers answer with an empty list without querying the chain
+EVALUATIONS_PARSING_ENABLED = False
+CATEGORY_TOKENS_PARSING_ENABLED = False
+
+
+def _query_and_parse(
+    query: ContractCallQuery,
+    client: Client,
+    parser: Callable[[Any], Dict[str, Any]]
+) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    Execute a query and parse its result, both on the calling SDK worker thread.
+    
+    Returns:
+        (None, parsed fields) on success, or (status, None) if the query failed
+    """
+    response = query.execute(client)
+    status = response.getStatus()
+    if status != _SUCCESS:
+        return status, None
+    return None, parser(response.getContractFunctionResult())
+
+
+@lru_cache(maxsize=4096)
+def _read_params(param_spec: Tuple[Tuple[str, Any], ...]) -> ContractFunctionParameters:
+    """
+    Encode (and memoize) the parameters of a read.
+    
+    Encoded parameters are only read when a query is built, so the same few
+    proposals, users and categories polled repeatedly share one instance
+    instead of crossing into the JVM to re-encode on every call.
+    """
+    if not param_spec:
+        return _EMPTY_PARAMS
+    params = ContractFunctionParameters()
+    for param_type, value in param_spec:
+        if param_type == "address":
+            value = _to_evm_address(value)
+        elif param_type in _INT_PARAM_TYPES:
+            value = int(value)
+        getattr(params, _PARAM_ADDERS[param_type])(value)
+    return params
+
+
+# Failures of polled reads repeat the same few responses, so they are built
+# once; callers get a plain dict copy and never see the shared view.
+@lru_cache(maxsize=None)
+def _err_not_deployed(contract_name: str) -> Mapping[str, Any]:
+    """Response for a read against a contract that is not deployed."""
+    return MappingProxyType({"success": False, "error": f"{contract_name} contract not deployed"})
+
+
+@lru_cache(maxsize=256)
+def _err_status(status: str) -> Mapping[str, Any]:
+    """Response for a query that completed with a non-SUCCESS status."""
+    return MappingProxyType({"success": False, "error": f"Query failed with status: {status}"})
+
+
+async def _call_read(
+    contract_name: str,
+    function_name: str,
+    param_spec: Tuple[Tuple[str, Any], ...],
+    parser: Callable[[Any], Dict[str, Any]],
+    description: str,
+    gas: int = 100000
 ) -> Dict[str, Any]:
     """
-    Get vote receipt for a voter on a proposal using the Governance smart contract.
+    Run a read-only ContractCallQuery and shape its result.
     
     Args:
-        proposal_id: ID of the proposal
-        voter: Address of the voter
+        contract_name: Contract to query, e.g. "ReputationOracle"
+        function_name: Contract function to call
+        param_spec: (Solidity type, value) for each parameter; addresses may
+            be Hedera IDs and integer IDs may be strings
+        parser: Maps the function result to the response fields besides "success"
+        description: What the read does, for the failure log line
+        gas: Gas limit for the query
         
     Returns:
-        Dictionary containing vote receipt
+        Dictionary with "success" and the parsed fields, or "error"
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
+        client = _client_pool.acquire()
+        _, contract_id = _resolve_contract(contract_name)
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        if contract_id is None:
+            return dict(_err_not_deployed(contract_name))
         
-        # Prepare function parameters for getVoteReceipt
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
-        params.addAddress(voter)
+        query = _contract_query(contract_id, function_name, _read_params(param_spec), gas)
+        failed_status, parsed = await _exec(_query_and_parse, query, client, parser)
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getVoteReceipt", params)
+        if failed_status is not None:
+            return dict(_err_status(str(failed_status)))
         
-        # Execute query
-        response = query.execute(client)
+        return {"success": True, **parsed}
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                # This is a simplified implementation - actual contract may return different structure
-                vote_receipt = {
-                    "has_voted": True,  # Placeholder
-                    "vote": 0,  # Placeholder
-                    "weight": 0  # Placeholder
-                }
-                
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "voter": voter,
-                    "receipt": vote_receipt
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse vote receipt data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "voter": voter,
-                    "receipt": {
-                        "has_voted": False,
-                        "vote": 0,
-                        "weight": 0
-                    }
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
     except Exception as e:
-        logger.error(f"Failed to get vote receipt: {str(e)}")
+        logger.error("Failed to %s: %s", description, e)
         return {
             "success": False,
             "error": str(e)
         }
 
 
-async def get_quorum() -> Dict[str, Any]:
+def _result_bytes(result: Any) -> bytes:
+    """Copy the raw ABI-encoded bytes of a function result out of the Java binding."""
+    return bytes(b & 0xFF for b in result.asBytes().toByteArray())
+
+
+def _uint256_words(result: Any, count: int) -> List[int]:
     """
-    Get quorum requirement using the Governance smart contract.
+    Decode the first ``count`` uint256 words of a function result in one pass.
     
-    Returns:
-        Dictionary containing quorum information
+    Reads the raw ABI bytes once instead of making a getUint256 call through
+    the Java binding per word.
+    """
+    raw = _result_bytes(result)
+    if len(raw) < count * 32:
+        raise ValueError(f"Expected {count} words, got {len(raw)} bytes")
+    return [int.from_bytes(raw[i * 32:(i + 1) * 32], 'big') for i in range(count)]
+
+
+def _word_value(result: Any, output_type: str, description: str) -> Union[bool, int]:
+    """
+    Decode a single-word (uint or bool) function result from its raw ABI bytes.
+    
+    Returns 0 (False for bool) if the result cannot be parsed.
     """
+    default = False if output_type == "bool" else 0
+    if result is None:
+        return default
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getQuorum (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getQuorum", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                quorum = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "quorum": quorum
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse quorum data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "quorum": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
+        word = _uint256_words(result, 1)[0]
+    except Exception as parse_error:
+        logger.warning("Could not parse %s data: %s", description, parse_error)
+        return default
+    return bool(word) if output_type == "bool" else word
+
+
+def _uint256_or_zero(result: Any, description: str) -> int:
+    """Read the first uint256 of a function result, or 0 if it cannot be parsed."""
+    return _word_value(result, "uint256", description)
+
+
+async def _mirror_read(
+    contract_address: str,
+    function_name: str,
+    param_spec: Tuple[Tuple[str, Any], ...],
+    output_types: Tuple[str, ...]
+) -> CallResult:
+    """Run a ``_call_read``-style read through the mirror node's contracts/call API."""
+    try:
+        call = CallSpec(
+            contract_address=contract_address,
+            function=f"{function_name}({','.join(param_type for param_type, _ in param_spec)})",
+            args=tuple(
+                int(value) if param_type in _INT_PARAM_TYPES else value
+                for param_type, value in param_spec
+            ),
+            output_types=output_types
+        )
+        return await _mirror_contract_call(call)
     except Exception as e:
-        logger.error(f"Failed to get quorum: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+        return CallResult(success=False, error=str(e))
 
 
-async def get_voting_delay() -> Dict[str, Any]:
+@lru_cache(maxsize=64)
+def _zero_values(output_types: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Zero value (False for bools) of each return type, built once per signature."""
+    return tuple(False if output_type == "bool" else 0 for output_type in output_types)
+
+
+def _static_values(result: Any, output_types: Tuple[str, ...], description: str) -> Tuple[Any, ...]:
     """
-    Get voting delay using the Governance smart contract.
+    Decode a function result of static types from its raw ABI bytes.
     
-    Returns:
-        Dictionary containing voting delay information
+    Returns zeros (False for bools) if the result cannot be parsed.
+    """
+    if result is not None:
+        try:
+            return tuple(abi_decode(list(output_types), _result_bytes(result)))
+        except Exception as parse_error:
+            logger.warning("Could not parse %s data: %s", description, parse_error)
+    return _zero_values(output_types)
+
+
+async def _view_read(
+    contract_name: str,
+    function_name: str,
+    param_spec: Tuple[Tuple[str, Any], ...],
+    output_types: Tuple[str, ...],
+    value_name: str,
+    build: Callable[[Tuple[Any, ...]], Dict[str, Any]],
+    description: str
+) -> Dict[str, Any]:
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
+    Run a view read through the mirror node, falling back to a ContractCallQuery.
+    
+    The mirror node's contracts/call API is free and skips consensus nodes.
+    Both paths decode the same ABI words, so ``build`` sees the same values
+    whichever answered.
+    
+    Args:
+        contract_name: Contract to query, e.g. "TalentPool"
+        function_name: Contract function to call
+        param_spec: Parameters, as accepted by ``_call_read``
+        output_types: Static Solidity return types, struct fields flattened
+        value_name: Name of the returned data, for the parse warning
+        build: Maps the returned values to the response fields besides "success"
+        description: What the read does, for the failure log line
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getVotingDelay (no parameters)
-        params = ContractFunctionParameters()
+    Returns:
+        Dictionary with "success" and the built fields, or "error"
+    """
+    contract_address, _ = _resolve_contract(contract_name)
+    if contract_address is not None:
+        result = await _mirror_read(contract_address, function_name, param_spec, output_types)
+        if result.success:
+            return {"success": True, **build(result.values)}
+        logger.debug("Mirror read of %s failed, using a contract query: %s", function_name, result.error)
+    
+    return await _call_read(
+        contract_name, function_name, param_spec,
+        lambda result: build(_static_values(result, output_types, value_name)),
+        description
+    )
+
+
+async def get_category_score(
+    user_address: str,
+    category: str
+) -> Dict[str, Any]:
+    """
+    Get category-specific reputation score using the ReputationOracle smart contract.
+    
+    Args:
+        user_address: User's address
+        category: Skill category
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getVotingDelay", params)
+    Returns:
+        Dictionary containing category score
+    """
+    return await _call_read(
+        'ReputationOracle', "getCategoryScore",
+        (("address", user_address), ("string", category)),
+        lambda result: {
+            "user_address": user_address,
+            "category": category,
+            "score": _uint256_or_zero(result, "category score")
+        },
+        "get category score"
+    )
+
+
+_EVALUATION_KEYS = (
+    "user", "skill_token_ids", "overall_score", "feedback", "evaluated_by", "timestamp", "ipfs_hash"
+)
+_EMPTY_EVALUATION = MappingProxyType({
+    "user": "",
+    "skill_token_ids": [],
+    "overall_score": 0,
+    "feedback": "",
+    "evaluated_by": "",
+    "timestamp": 0,
+    "ipfs_hash": ""
+})
+
+
+def _evaluation_from_result(result: Any) -> Dict[str, Any]:
+    """Map a getWorkEvaluation result to an evaluation dict, or the empty one if unparseable."""
+    if result is None:
+        return {**_EMPTY_EVALUATION, "skill_token_ids": []}
+    try:
+        values = (
+            result.getAddress(0),
+            [result.getUint256(1)],  # Simplified for single token
+            result.getUint256(2),
+            result.getString(3),
+            result.getAddress(4),
+            result.getUint64(5),
+            result.getString(6)
+        )
+    except Exception as parse_error:
+        logger.warning("Could not parse work evaluation data: %s", parse_error)
+        return {**_EMPTY_EVALUATION, "skill_token_ids": []}
+    return dict(zip(_EVALUATION_KEYS, values))
+
+
+async def get_work_evaluation(
+    evaluation_id: str
+) -> Dict[str, Any]:
+    """
+    Get work evaluation details using the ReputationOracle smart contract.
+    
+    Args:
+        evaluation_id: ID of the evaluation
         
-        # Execute query
-        response = query.execute(client)
+    Returns:
+        Dictionary containing evaluation details
+    """
+    return await _call_read(
+        'ReputationOracle', "getWorkEvaluation",
+        (("uint256", evaluation_id),),
+        lambda result: {
+            "evaluation_id": evaluation_id,
+            "evaluation": _evaluation_from_result(result)
+        },
+        "get work evaluation"
+    )
+
+
+async def get_user_evaluations(
+    user_address: str
+) -> Dict[str, Any]:
+    """
+    Get all evaluations for a user using the ReputationOracle smart contract.
+    
+    Args:
+        user_address: User's address
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                voting_delay = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "voting_delay": voting_delay
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse voting delay data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "voting_delay": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get voting delay: {str(e)}")
+    Returns:
+        Dictionary containing user evaluations
+    """
+    # The evaluation list is not decoded yet, so skip the query whose result
+    # would be discarded
+    if not EVALUATIONS_PARSING_ENABLED:
         return {
-            "success": False,
-            "error": str(e)
+            "success": True,
+            "user_address": user_address,
+            "evaluations": []
         }
+    
+    return await _call_read(
+        'ReputationOracle', "getUserEvaluations",
+        (("address", user_address),),
+        lambda result: {
+            "user_address": user_address,
+            "evaluations": []
+        },
+        "get user evaluations"
+    )
 
 
-async def get_voting_period() -> Dict[str, Any]:
+# Global and per-category aggregates only move when evaluations or new
+# tokens land, but dashboards poll them several times a second
+_STATS_CACHE = _TTLCache(maxsize=1024, ttl=5.0)
+
+
+def invalidate_stats_cache() -> None:
+    """Drop cached global reputation stats and per-category skill totals."""
+    _STATS_CACHE.clear()
+
+
+async def get_global_stats() -> Dict[str, Any]:
     """
-    Get voting period using the Governance smart contract.
+    Get global reputation statistics using the ReputationOracle smart contract.
+    
+    Results are reused for a few seconds; concurrent requests share one read.
     
     Returns:
-        Dictionary containing voting period information
+        Dictionary containing global stats
     """
+    return await _cached_read(_STATS_CACHE, ("global_stats", ""), _fetch_global_stats)
+
+
+_GLOBAL_STATS_KEYS = ("total_evaluations", "total_challenges", "total_oracle_stake", "active_oracle_count")
+_EMPTY_GLOBAL_STATS = MappingProxyType(dict.fromkeys(_GLOBAL_STATS_KEYS, 0))
+
+
+def _global_stats_from_result(result: Any) -> Dict[str, Any]:
+    """Map a getGlobalStats result to a stats dict, or all zeros if unparseable."""
+    if result is None:
+        return dict(_EMPTY_GLOBAL_STATS)
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+        values = _uint256_words(result, len(_GLOBAL_STATS_KEYS))
+    except Exception as parse_error:
+        logger.warning("Could not parse global stats data: %s", parse_error)
+        return dict(_EMPTY_GLOBAL_STATS)
+    return dict(zip(_GLOBAL_STATS_KEYS, values))
+
+
+async def _fetch_global_stats() -> Dict[str, Any]:
+    """Read global reputation statistics from the chain."""
+    return await _call_read(
+        'ReputationOracle', "getGlobalStats", (),
+        lambda result: {"stats": _global_stats_from_result(result)},
+        "get global stats"
+    )
+
+
+async def update_oracle_status(
+    oracle_address: str,
+    is_active: bool,
+    reason: str
+) -> TransactionResult:
+    """
+    Update oracle status using the ReputationOracle smart contract.
+    
+    Args:
+        oracle_address: Address of the oracle
+        is_active: Whether the oracle should be active
+        reason: Reason for status change
         
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
+    Returns:
+        TransactionResult with success status and details
+    """
+    result, _ = await _execute_contract_call("updateOracleStatus", (oracle_address, is_active, reason))
+    if result.success:
+        invalidate_stats_cache()
+    return result
+
+
+async def update_oracle_status_batch(
+    updates: List[Tuple[str, bool, str]]
+) -> TransactionResult:
+    """
+    Update the status of several oracles in one ReputationOracle transaction.
+    
+    Args:
+        updates: (oracle address, is active, reason) for each oracle
         
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
+    Returns:
+        TransactionResult with success status and details
+    """
+    if not updates:
+        return TransactionResult(
+            success=False,
+            error="No oracle status updates given"
+        )
+    
+    oracles, statuses, reasons = (list(column) for column in zip(*updates))
+    result, _ = await _execute_contract_call("updateOracleStatusBatch", (oracles, statuses, reasons))
+    if result.success:
+        invalidate_stats_cache()
+    return result
+
+
+async def get_tokens_by_category(
+    category: str
+) -> Dict[str, Any]:
+    """
+    Get all skill tokens in a specific category using the SkillToken smart contract.
+    
+    Args:
+        category: Skill category to search for
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+    Returns:
+        Dictionary containing tokens in the category
+    """
+    # The token list is not decoded yet, so skip the query whose result would
+    # be discarded
+    if not CATEGORY_TOKENS_PARSING_ENABLED:
+        return {
+            "success": True,
+            "category": category,
+            "tokens": []
+        }
+    
+    return await _call_read(
+        'SkillToken', "getTokensByCategory",
+        (("string", category),),
+        lambda result: {
+            "category": category,
+            "tokens": []
+        },
+        "get tokens by category"
+    )
+
+
+async def get_total_skills_by_category(
+    category: str
+) -> Dict[str, Any]:
+    """
+    Get total number of skills in a category using the SkillToken smart contract.
+    
+    Results are reused for a few seconds; concurrent requests share one read.
+    
+    Args:
+        category: Skill category to count
         
-        # Prepare function parameters for getVotingPeriod (no parameters)
-        params = ContractFunctionParameters()
+    Returns:
+        Dictionary containing total count
+    """
+    return await _cached_read(
+        _STATS_CACHE,
+        ("total_skills_by_category", category),
+        partial(_fetch_total_skills_by_category, category)
+    )
+
+
+async def _fetch_total_skills_by_category(category: str) -> Dict[str, Any]:
+    """Read the number of skills in a category from the chain."""
+    return await _call_read(
+        'SkillToken', "getTotalSkillsByCategory",
+        (("string", category),),
+        lambda result: {
+            "category": category,
+            "total_count": _uint256_or_zero(result, "total skills")
+        },
+        "get total skills by category"
+    )
+
+
+async def get_category_scores_batch(
+    user_address: str,
+    categories: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get a user's reputation score in several categories in one JSON-RPC round-trip.
+    
+    Args:
+        user_address: User's address
+        categories: Skill categories
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getVotingPeriod", params)
+    Returns:
+        Mapping of category to the same dictionary get_category_score returns
+    """
+    try:
+        contract_address, _ = _resolve_contract('ReputationOracle')
         
-        # Execute query
-        response = query.execute(client)
+        if contract_address is None:
+            error = {"success": False, "error": "ReputationOracle contract not deployed"}
+            return {category: dict(error) for category in categories}
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                voting_period = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "voting_period": voting_period
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse voting period data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "voting_period": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
+        results = await batch_contract_call([
+            CallSpec(
+                contract_address=contract_address,
+                function="getCategoryScore(address,string)",
+                args=(user_address, category),
+                output_types=("uint256",)
+            )
+            for category in categories
+        ])
+        
+        scores = {}
+        for category, result in zip(categories, results):
+            if not result.success:
+                scores[category] = {"success": False, "error": result.error}
+                continue
+            scores[category] = {
+                "success": True,
+                "user_address": user_address,
+                "category": category,
+                "score": result.values[0]
             }
-            
+        
+        return scores
+        
     except Exception as e:
-        logger.error(f"Failed to get voting period: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+        logger.error("Failed to get category scores batch: %s", e)
+        return {category: {"success": False, "error": str(e)} for category in categories}
 
 
-async def get_proposal_threshold() -> Dict[str, Any]:
+async def get_total_skills_by_categories(
+    categories: List[str]
+) -> Dict[str, Dict[str, Any]]:
     """
-    Get proposal threshold using the Governance smart contract.
+    Get the number of skills in several categories in one JSON-RPC round-trip.
     
+    Args:
+        categories: Skill categories to count
+        
     Returns:
-        Dictionary containing proposal threshold information
+        Mapping of category to the same dictionary get_total_skills_by_category returns
     """
     try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
+        contract_address, _ = _resolve_contract('SkillToken')
         
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
+        if contract_address is None:
+            error = {"success": False, "error": "SkillToken contract not deployed"}
+            return {category: dict(error) for category in categories}
         
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
+        results = await batch_contract_call([
+            CallSpec(
+                contract_address=contract_address,
+                function="getTotalSkillsByCategory(string)",
+                args=(category,),
+                output_types=("uint256",),
+                data=_encode_category_call("getTotalSkillsByCategory(string)", category)
+            )
+            for category in categories
+        ])
+        
+        totals = {}
+        for category, result in zip(categories, results):
+            if not result.success:
+                totals[category] = {"success": False, "error": result.error}
+                continue
+            totals[category] = {
+                "success": True,
+                "category": category,
+                "total_count": result.values[0]
             }
         
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
+        return totals
         
-        # Prepare function parameters for getProposalThreshold (no parameters)
-        params = ContractFunctionParameters()
+    except Exception as e:
+        logger.error("Failed to get total skills by categories: %s", e)
+        return {category: {"success": False, "error": str(e)} for category in categories}
+
+
+async def get_reputation_dashboard(
+    user_address: str,
+    categories: List[str]
+) -> Dict[str, Any]:
+    """
+    Get the global stats, a user's evaluations and their category scores together.
+    
+    The three reads are independent, so they run concurrently and the
+    dashboard costs the slowest read rather than the sum of all of them.
+    
+    Args:
+        user_address: User's address
+        categories: Skill categories to score
         
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getProposalThreshold", params)
+    Returns:
+        Dictionary with the get_global_stats, get_user_evaluations and
+        get_category_scores_batch results
+    """
+    global_stats, evaluations, category_scores = await asyncio.gather(
+        get_global_stats(),
+        get_user_evaluations(user_address),
+        get_category_scores_batch(user_address, categories)
+    )
+    
+    return {
+        "success": global_stats.get("success", False) and evaluations.get("success", False),
+        "user_address": user_address,
+        "global_stats": global_stats,
+        "evaluations": evaluations,
+        "category_scores": category_scores
+    }
+
+
+# =============================================================================
+# ADDITIONAL GOVERNANCE FUNCTIONS
+# =============================================================================
+
+class _TokenBucket:
+    """
+    Token bucket rate limiter: ``rate`` tokens per second, up to ``burst`` saved.
+    
+    Not locked; all callers run on the event loop thread.
+    """
+    
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+    
+    def try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds until one is."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+_GOVERNANCE_BURST = 20
+_governance_bucket: Optional[_TokenBucket] = None
+
+
+def _governance_rate_limit() -> _TokenBucket:
+    """Token bucket shared by the governance getters, sized by ``HEDERA_GOV_QPS``."""
+    global _governance_bucket
+    if _governance_bucket is None:
+        _governance_bucket = _TokenBucket(max(0.1, get_settings().hedera_governance_qps), _GOVERNANCE_BURST)
+    return _governance_bucket
+
+
+def _rate_limited(retry_after: float) -> Dict[str, Any]:
+    """Build the response for a governance read refused by the rate limiter."""
+    return {
+        "success": False,
+        "error": "rate_limited",
+        "retry_after_ms": int(retry_after * 1000) + 1
+    }
+
+
+async def _governance_read(
+    function_name: str,
+    param_spec: Tuple[Tuple[str, Any], ...],
+    parser: Callable[[Any], Dict[str, Any]],
+    description: str
+) -> Dict[str, Any]:
+    """
+    Run a Governance read through ``_call_read`` under the governance rate limit.
+    
+    Args:
+        function_name: Governance function to call
+        param_spec: Parameters, as accepted by ``_call_read``
+        parser: Maps the function result to the response fields besides "success"
+        description: What the read does, for the failure log line
         
-        # Execute query
-        response = query.execute(client)
+    Returns:
+        Dictionary with "success" and the parsed fields, or "error"
+    """
+    retry_after = _governance_rate_limit().try_acquire()
+    if retry_after:
+        return _rate_limited(retry_after)
+    return await _call_read('Governance', function_name, param_spec, parser, description)
+
+
+# How long a governance read waits on the mirror node before also querying a consensus node
+_GOVERNANCE_HEDGE_DELAY = 0.25
+
+
+async def _governance_value_read(
+    function_name: str,
+    param_spec: Tuple[Tuple[str, Any], ...],
+    output_type: str,
+    value_name: str,
+    build: Callable[[Any], Dict[str, Any]],
+    description: str,
+    rate_limit: bool = True
+) -> Dict[str, Any]:
+    """
+    Read a single-value Governance getter, hedged across mirror and consensus nodes.
+    
+    The mirror node's contracts/call API is free and skips consensus nodes,
+    so it is tried first; if it has not answered within
+    ``_GOVERNANCE_HEDGE_DELAY`` (or fails) a ContractCallQuery is raced
+    against it and the first success wins.
+    
+    Args:
+        function_name: Governance function to call
+        param_spec: Parameters, as accepted by ``_call_read``
+        output_type: Solidity return type: "bool", "uint8" or "uint256"
+        value_name: Name of the value, for the parse warning
+        build: Maps the returned value to the response fields besides "success"
+        description: What the read does, for the failure log line
+        rate_limit: Whether to take a governance rate limit token; False when
+            the caller already took one for the request
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                proposal_threshold = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "proposal_threshold": proposal_threshold
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse proposal threshold data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "proposal_threshold": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
+    Returns:
+        Dictionary with "success" and the built fields, or "error"
+    """
+    if rate_limit:
+        retry_after = _governance_rate_limit().try_acquire()
+        if retry_after:
+            return _rate_limited(retry_after)
+    
+    contract_address, _ = _resolve_contract('Governance')
+    if contract_address is None:
+        return dict(_err_not_deployed('Governance'))
+    
+    async def _consensus_read() -> CallResult:
+        response = await _call_read(
+            'Governance', function_name, param_spec,
+            lambda result: {"value": _word_value(result, output_type, value_name)},
+            description
+        )
+        if not response.get("success"):
+            return CallResult(success=False, error=response.get("error"))
+        return CallResult(success=True, values=(response["value"],))
+    
+    result = await _hedged([
+        ("mirror", lambda: _mirror_read(contract_address, function_name, param_spec, (output_type,))),
+        ("consensus", _consensus_read),
+    ], delay=_GOVERNANCE_HEDGE_DELAY, pinned=True)
+    
+    if not result.success:
+        return {"success": False, "error": result.error}
+    return {"success": True, **build(result.values[0])}
+
+
+async def get_proposal_status(
+    proposal_id: str
+) -> Dict[str, Any]:
+    """
+    Get proposal status using the Governance smart contract.
+    
+    Args:
+        proposal_id: ID of the proposal
+        
+    Returns:
+        Dictionary containing proposal status
+    """
+    return await _proposal_status_read(proposal_id)
+
+
+async def _proposal_status_read(proposal_id: str, rate_limit: bool = True) -> Dict[str, Any]:
+    """Read one proposal's status; see get_proposal_status."""
+    return await _governance_value_read(
+        "getProposalStatus",
+        (("uint256", proposal_id),),
+        "uint8", "proposal status",
+        lambda status: {
+            "proposal_id": proposal_id,
+            "status": status
+        },
+        "get proposal status",
+        rate_limit=rate_limit
+    )
+
+
+async def get_proposal_statuses(
+    proposal_ids: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Get the status of several proposals in one JSON-RPC round-trip.
+    
+    Proposals whose batched read fails are retried individually and
+    concurrently, capped by ``HEDERA_MAX_CONCURRENT_QUERIES``. The retries are
+    covered by the single rate limit token this call takes.
+    
+    Args:
+        proposal_ids: IDs of the proposals
+        
+    Returns:
+        One get_proposal_status-shaped dictionary per proposal, in order
+    """
+    if not proposal_ids:
+        return []
+    
+    retry_after = _governance_rate_limit().try_acquire()
+    if retry_after:
+        return [_rate_limited(retry_after) for _ in proposal_ids]
+    
+    contract_address, _ = _resolve_contract('Governance')
+    if contract_address is None:
+        return [dict(_err_not_deployed('Governance')) for _ in proposal_ids]
+    
+    # Malformed IDs are left to get_proposal_status, which reports them
+    numeric_ids = [proposal_id for proposal_id in proposal_ids if str(proposal_id).isdigit()]
+    results = await batch_contract_call([
+        CallSpec(
+            contract_address=contract_address,
+            function="getProposalStatus(uint256)",
+            args=(int(proposal_id),),
+            output_types=("uint8",)
+        )
+        for proposal_id in numeric_ids
+    ])
+    by_id = dict(zip(numeric_ids, results))
+    
+    statuses: Dict[int, Dict[str, Any]] = {}
+    retries: List[int] = []
+    for index, proposal_id in enumerate(proposal_ids):
+        result = by_id.get(proposal_id)
+        if result is not None and result.success:
+            statuses[index] = {
+                "success": True,
+                "proposal_id": proposal_id,
+                "status": result.values[0]
             }
-            
-    except Exception as e:
-        logger.error(f"Failed to get proposal threshold: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+        else:
+            retries.append(index)
+    
+    if retries:
+        limit = _governance_query_limit()
+        
+        async def _retry(proposal_id: str) -> Dict[str, Any]:
+            async with limit:
+                return await _proposal_status_read(proposal_id, rate_limit=False)
+        
+        retried = await asyncio.gather(*(_retry(proposal_ids[index]) for index in retries))
+        for index, status in zip(retries, retried):
+            statuses[index] = status
+    
+    return [statuses[index] for index in range(len(proposal_ids))]
+
+
+# getVoteReceipt(uint256,address) returns the VoteReceipt struct
+_VOTE_RECEIPT_TUPLE = "(bool,uint8,uint256,string)"
+
+
+def _vote_receipt_from_result(result: Any) -> Dict[str, Any]:
+    """
+    Decode a getVoteReceipt result in one pass over its raw ABI bytes.
+    
+    The struct holds a string, so it is encoded behind an offset word and is
+    decoded with eth_abi rather than read field by field through the SDK.
+    """
+    receipt = {"has_voted": False, "vote": 0, "weight": 0, "reason": ""}
+    if result is None:
+        return receipt
+    try:
+        has_voted, vote, weight, reason = abi_decode([_VOTE_RECEIPT_TUPLE], _result_bytes(result))[0]
+    except Exception as parse_error:
+        logger.warning("Could not parse vote receipt data: %s", parse_error)
+        return receipt
+    return {"has_voted": has_voted, "vote": vote, "weight": weight, "reason": reason}
+
+
+async def get_vote_receipt(
+    proposal_id: str,
+    voter: str
+) -> Dict[str, Any]:
+    """
+    Get vote receipt for a voter on a proposal using the Governance smart contract.
+    
+    Args:
+        proposal_id: ID of the proposal
+        voter: Address of the voter
+        
+    Returns:
+        Dictionary containing vote receipt
+    """
+    return await _governance_read(
+        "getVoteReceipt",
+        (("uint256", proposal_id), ("address", voter)),
+        lambda result: {
+            "proposal_id": proposal_id,
+            "voter": voter,
+            "receipt": _vote_receipt_from_result(result)
+        },
+        "get vote receipt"
+    )
+
+
+# Governance parameters only change through a governance proposal
+_GOVERNANCE_PARAMS_CACHE = _TTLCache(maxsize=8, ttl=300.0)
+
+
+def invalidate_governance_cache() -> None:
+    """Drop cached governance parameters, e.g. after a proposal executes."""
+    _GOVERNANCE_PARAMS_CACHE.clear()
+
+
+async def get_quorum() -> Dict[str, Any]:
+    """
+    Get quorum requirement using the Governance smart contract.
+    
+    Results are reused for a few minutes; concurrent requests share one read.
+    
+    Returns:
+        Dictionary containing quorum information
+    """
+    return await _cached_read(_GOVERNANCE_PARAMS_CACHE, ("governance_param", "quorum"), _fetch_quorum)
+
+
+async def _fetch_quorum() -> Dict[str, Any]:
+    """Read the quorum from the chain."""
+    return await _governance_value_read(
+        "getQuorum", (), "uint256", "quorum",
+        lambda value: {"quorum": value},
+        "get quorum"
+    )
+
+
+async def get_voting_delay() -> Dict[str, Any]:
+    """
+    Get voting delay using the Governance smart contract.
+    
+    Results are reused for a few minutes; concurrent requests share one read.
+    
+    Returns:
+        Dictionary containing voting delay information
+    """
+    return await _cached_read(_GOVERNANCE_PARAMS_CACHE, ("governance_param", "voting_delay"), _fetch_voting_delay)
+
+
+async def _fetch_voting_delay() -> Dict[str, Any]:
+    """Read the voting delay from the chain."""
+    return await _governance_value_read(
+        "getVotingDelay", (), "uint256", "voting delay",
+        lambda value: {"voting_delay": value},
+        "get voting delay"
+    )
+
+
+async def get_voting_period() -> Dict[str, Any]:
+    """
+    Get voting period using the Governance smart contract.
+    
+    Results are reused for a few minutes; concurrent requests share one read.
+    
+    Returns:
+        Dictionary containing voting period information
+    """
+    return await _cached_read(_GOVERNANCE_PARAMS_CACHE, ("governance_param", "voting_period"), _fetch_voting_period)
+
+
+async def _fetch_voting_period() -> Dict[str, Any]:
+    """Read the voting period from the chain."""
+    return await _governance_value_read(
+        "getVotingPeriod", (), "uint256", "voting period",
+        lambda value: {"voting_period": value},
+        "get voting period"
+    )
+
+
+async def get_proposal_threshold() -> Dict[str, Any]:
+    """
+    Get proposal threshold using the Governance smart contract.
+    
+    Results are reused for a few minutes; concurrent requests share one read.
+    
+    Returns:
+        Dictionary containing proposal threshold information
+    """
+    return await _cached_read(_GOVERNANCE_PARAMS_CACHE, ("governance_param", "proposal_threshold"), _fetch_proposal_threshold)
+
+
+async def _fetch_proposal_threshold() -> Dict[str, Any]:
+    """Read the proposal threshold from the chain."""
+    return await _governance_value_read(
+        "getProposalThreshold", (), "uint256", "proposal threshold",
+        lambda value: {"proposal_threshold": value},
+        "get proposal threshold"
+    )
 
 
 async def get_all_proposals() -> Dict[str, Any]:
@@ -4224,67 +5594,13 @@ async def get_all_proposals() -> Dict[str, Any]:
     Returns:
         Dictionary containing all proposals
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getAllProposals (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getAllProposals", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                # This is a simplified implementation - actual contract may return different structure
-                proposals = []
-                # For now, return empty list as the actual structure depends on contract implementation
-                
-                return {
-                    "success": True,
-                    "proposals": proposals
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse all proposals data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "proposals": []
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get all proposals: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    # The proposal list is not decoded yet; the actual structure depends on
+    # the contract implementation (iter_proposals fetches full proposals)
+    return await _governance_read(
+        "getAllProposals", (),
+        lambda result: {"proposals": []},
+        "get all proposals"
+    )
 
 
 async def get_active_proposals() -> Dict[str, Any]:
@@ -4294,67 +5610,96 @@ async def get_active_proposals() -> Dict[str, Any]:
     Returns:
         Dictionary containing active proposals
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getActiveProposals (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getActiveProposals", params)
-        
-        # Execute query
-        response = query.execute(client)
+    # The proposal list is not decoded yet; the actual structure depends on
+    # the contract implementation (iter_proposals fetches full proposals)
+    return await _governance_read(
+        "getActiveProposals", (),
+        lambda result: {"active_proposals": []},
+        "get active proposals"
+    )
+
+
+# getProposal(uint256) returns the Proposal struct
+_PROPOSAL_TUPLE = (
+    "(uint256,address,string,string,address[],uint256[],bytes[],"
+    "uint256,uint256,uint8,uint256,uint256,uint256,bool,string)"
+)
+
+
+def _proposal_from_values(values: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Map a decoded Proposal struct to a proposal dictionary."""
+    (proposal_id, proposer, title, description, targets, call_values, calldatas,
+     start_time, end_time, status, for_votes, against_votes, abstain_votes,
+     executed, ipfs_hash) = values[0]
+    return {
+        "proposal_id": proposal_id,
+        "proposer": proposer,
+        "title": title,
+        "description": description,
+        "targets": list(targets),
+        "values": list(call_values),
+        "calldatas": ["0x" + calldata.hex() for calldata in calldatas],
+        "start_time": start_time,
+        "end_time": end_time,
+        "status": status,
+        "for_votes": for_votes,
+        "against_votes": against_votes,
+        "abstain_votes": abstain_votes,
+        "executed": executed,
+        "ipfs_hash": ipfs_hash
+    }
+
+
+async def iter_proposals(
+    page_size: int = 50,
+    active_only: bool = False
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Fetch proposal details page by page.
+    
+    The ID list is read once; each page of ``page_size`` proposals is then
+    read in one JSON-RPC batch, so no single call grows with the number of
+    proposals. Pages are fetched concurrently under the governance query
+    limit and yielded as they complete, not in ID order.
+    
+    Args:
+        page_size: Proposals per page
+        active_only: Only fetch proposals the contract reports as active
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                # This is a simplified implementation - actual contract may return different structure
-                active_proposals = []
-                # For now, return empty list as the actual structure depends on contract implementation
-                
-                return {
-                    "success": True,
-                    "active_proposals": active_proposals
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse active proposals data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "active_proposals": []
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get active proposals: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    Yields:
+        Lists of proposal dictionaries; proposals whose read failed are skipped
+    """
+    contract_address, _ = _resolve_contract('Governance')
+    if contract_address is None:
+        return
+    
+    getter = "getActiveProposals()" if active_only else "getAllProposals()"
+    ids_result = await _hedged_contract_call(
+        CallSpec(contract_address=contract_address, function=getter, output_types=("uint256[]",))
+    )
+    if not ids_result.success:
+        logger.error("Failed to list proposals: %s", ids_result.error)
+        return
+    
+    ids = list(ids_result.values[0])
+    limit = _governance_query_limit()
+    
+    async def _fetch_page(page_ids: List[int]) -> List[Dict[str, Any]]:
+        async with limit:
+            results = await batch_contract_call([
+                CallSpec(
+                    contract_address=contract_address,
+                    function="getProposal(uint256)",
+                    args=(proposal_id,),
+                    output_types=(_PROPOSAL_TUPLE,)
+                )
+                for proposal_id in page_ids
+            ])
+        return [_proposal_from_values(result.values) for result in results if result.success]
+    
+    pages = [_fetch_page(ids[start:start + page_size]) for start in range(0, len(ids), max(1, page_size))]
+    for page in asyncio.as_completed(pages):
+        yield await page
 
 
 async def can_execute(
@@ -4369,68 +5714,16 @@ async def can_execute(
     Returns:
         Dictionary containing execution status
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for canExecute
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("canExecute", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                can_execute = result.getBool(0) if result else False
-                
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "can_execute": can_execute
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse can execute data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "can_execute": False
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to check if proposal can execute: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return await _governance_value_read(
+        "canExecute",
+        (("uint256", proposal_id),),
+        "bool", "can execute",
+        lambda value: {
+            "proposal_id": proposal_id,
+            "can_execute": value
+        },
+        "check if proposal can execute"
+    )
 
 
 async def has_voted(
@@ -4447,67 +5740,159 @@ async def has_voted(
     Returns:
         Dictionary containing voting status
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get Governance contract info
-        governance_config = contract_config.get('contracts', {}).get('Governance', {})
-        contract_address = governance_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "Governance contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for hasVoted
-        params = ContractFunctionParameters()
-        params.addUint256(int(proposal_id))
-        params.addAddress(voter)
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("hasVoted", params)
-        
-        # Execute query
-        response = query.execute(client)
+    return await _governance_value_read(
+        "hasVoted",
+        (("uint256", proposal_id), ("address", voter)),
+        "bool", "has voted",
+        lambda value: {
+            "proposal_id": proposal_id,
+            "voter": voter,
+            "has_voted": value
+        },
+        "check if voter has voted"
+    )
+
+
+_governance_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _governance_query_limit() -> asyncio.Semaphore:
+    """Semaphore capping concurrent governance reads issued by gather_governance."""
+    global _governance_semaphore
+    if _governance_semaphore is None:
+        _governance_semaphore = asyncio.Semaphore(max(1, get_settings().hedera_max_concurrent_queries))
+    return _governance_semaphore
+
+
+async def gather_governance(
+    proposal_id: str,
+    voter: str
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the independent governance getters for a proposal concurrently.
+    
+    At most ``HEDERA_MAX_CONCURRENT_QUERIES`` reads are in flight at once, so
+    fan-out from many callers does not get throttled by the network.
+    
+    Args:
+        proposal_id: ID of the proposal
+        voter: Address of the voter to check
+        
+    Returns:
+        Mapping of getter name to the dictionary that getter returns
+    """
+    limit = _governance_query_limit()
+    
+    async def _limited(coro: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        async with limit:
+            return await coro
+    
+    getters = {
+        "quorum": get_quorum(),
+        "voting_delay": get_voting_delay(),
+        "voting_period": get_voting_period(),
+        "proposal_threshold": get_proposal_threshold(),
+        "proposal_status": get_proposal_status(proposal_id),
+        "can_execute": can_execute(proposal_id),
+        "has_voted": has_voted(proposal_id, voter),
+    }
+    results = await asyncio.gather(*(_limited(coro) for coro in getters.values()))
+    return dict(zip(getters, results))
+
+
+# Fields of get_governance_snapshot, with the getter and return type behind each
+# Governance parameters, shared with get_quorum and friends through _GOVERNANCE_PARAMS_CACHE
+_GOVERNANCE_PARAM_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("quorum", "getQuorum()", "uint256"),
+    ("voting_delay", "getVotingDelay()", "uint256"),
+    ("voting_period", "getVotingPeriod()", "uint256"),
+    ("proposal_threshold", "getProposalThreshold()", "uint256"),
+)
+# Per-proposal fields, read on every snapshot
+_GOVERNANCE_PROPOSAL_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("status", "getProposalStatus(uint256)", "uint8"),
+    ("can_execute", "canExecute(uint256)", "bool"),
+    ("has_voted", "hasVoted(uint256,address)", "bool"),
+)
+
+
+async def get_governance_snapshot(
+    proposal_id: str,
+    voter: str
+) -> Dict[str, Any]:
+    """
+    Get the governance parameters and a proposal's state in one JSON-RPC round-trip.
+    
+    Covers what a proposal page needs from get_quorum, get_voting_delay,
+    get_voting_period, get_proposal_threshold, get_proposal_status,
+    can_execute and has_voted. The call takes one governance rate limit
+    token; parameters still in the governance parameter cache are served
+    from it, so usually only the per-proposal fields are read.
+    
+    Args:
+        proposal_id: ID of the proposal
+        voter: Address of the voter to check
+        
+    Returns:
+        Dictionary containing one entry per field; fields whose read failed
+        are None and listed under "errors"
+    """
+    retry_after = _governance_rate_limit().try_acquire()
+    if retry_after:
+        return _rate_limited(retry_after)
+    
+    try:
+        contract_address, _ = _resolve_contract('Governance')
+        
+        if contract_address is None:
+            return dict(_err_not_deployed('Governance'))
+        
+        snapshot: Dict[str, Any] = {
+            "success": True,
+            "proposal_id": proposal_id,
+            "voter": voter
+        }
+        missing_params = []
+        for param in _GOVERNANCE_PARAM_FIELDS:
+            cached = _GOVERNANCE_PARAMS_CACHE.get(("governance_param", param[0]))
+            if cached is None:
+                missing_params.append(param)
+            else:
+                snapshot[param[0]] = cached[param[0]]
+        fields = missing_params + list(_GOVERNANCE_PROPOSAL_FIELDS)
+        
+        args_by_arity = ((), (int(proposal_id),), (int(proposal_id), voter))
+        results = await batch_contract_call([
+            CallSpec(
+                contract_address=contract_address,
+                function=signature,
+                args=args_by_arity[len(_signature_types(signature))],
+                output_types=(output_type,)
+            )
+            for _, signature, output_type in fields
+        ])
+        
+        errors: Dict[str, Optional[str]] = {}
+        for index, ((field, _, _), result) in enumerate(zip(fields, results)):
+            if not result.success:
+                snapshot[field] = None
+                errors[field] = result.error
+                continue
+            snapshot[field] = result.values[0]
+            if index < len(missing_params):
+                # Same shape as get_quorum and friends cache
+                _GOVERNANCE_PARAMS_CACHE.set(
+                    ("governance_param", field), {"success": True, field: result.values[0]}
+                )
+        
+        if errors:
+            snapshot["errors"] = errors
+            snapshot["success"] = len(errors) < len(_GOVERNANCE_PARAM_FIELDS + _GOVERNANCE_PROPOSAL_FIELDS)
+        
+        return snapshot
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                has_voted = result.getBool(0) if result else False
-                
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "voter": voter,
-                    "has_voted": has_voted
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse has voted data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "proposal_id": proposal_id,
-                    "voter": voter,
-                    "has_voted": False
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
     except Exception as e:
-        logger.error(f"Failed to check if voter has voted: {str(e)}")
+        logger.error("Failed to get governance snapshot: %s", e)
         return {
             "success": False,
             "error": str(e)
@@ -4518,300 +5903,202 @@ async def has_voted(
 # ADDITIONAL TALENT POOL FUNCTIONS
 # =============================================================================
 
+# Fields of the PoolMetrics struct and of getGlobalStats, in ABI order
+_POOL_METRICS_KEYS = ("total_staked", "average_match_score", "completion_rate", "average_time_to_fill")
+_POOL_STATS_KEYS = ("total_pools", "total_applications", "total_matches", "total_staked")
+
+# Pool metrics and the global application and match totals move with every
+# application or match; pool writes invalidate both, so the TTLs only bound
+# staleness from writes made by other processes
+_POOL_METRICS_CACHE = _TTLCache(maxsize=1024, ttl=5.0)
+_POOL_STATS_CACHE = _TTLCache(maxsize=8, ttl=60.0)
+
+
+def invalidate_pool_cache(pool_id: Optional[Union[int, str]] = None) -> None:
+    """
+    Drop cached TalentPool reads, e.g. after a pool write.
+    
+    Global stats and counts are always dropped; metrics only for ``pool_id``,
+    or for every pool if it is None.
+    """
+    _POOL_STATS_CACHE.clear()
+    if pool_id is None:
+        _POOL_METRICS_CACHE.clear()
+    else:
+        _POOL_METRICS_CACHE.pop(("pool_metrics", str(pool_id)))
+        _POOL_METRICS_CACHE.pop(("dashboard_snapshot", str(pool_id)))
+
+
 async def get_pool_metrics(
     pool_id: str
 ) -> Dict[str, Any]:
     """
     Get pool metrics using the TalentPool smart contract.
     
+    Results are reused for a few seconds; concurrent requests share one read.
+    
     Args:
         pool_id: ID of the job pool
         
     Returns:
         Dictionary containing pool metrics
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "TalentPool contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getPoolMetrics
-        params = ContractFunctionParameters()
-        params.addUint256(int(pool_id))
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getPoolMetrics", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                # This is a simplified implementation - actual contract may return different structure
-                metrics = {
-                    "total_applications": 0,  # Placeholder
-                    "match_score_average": 0,  # Placeholder
-                    "completion_rate": 0  # Placeholder
-                }
-                
-                return {
-                    "success": True,
-                    "pool_id": pool_id,
-                    "metrics": metrics
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse pool metrics data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "pool_id": pool_id,
-                    "metrics": {
-                        "total_applications": 0,
-                        "match_score_average": 0,
-                        "completion_rate": 0
-                    }
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get pool metrics: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return await _cached_read(
+        _POOL_METRICS_CACHE, ("pool_metrics", str(pool_id)),
+        lambda: _fetch_pool_metrics(pool_id)
+    )
+
+
+async def _fetch_pool_metrics(pool_id: str) -> Dict[str, Any]:
+    """Read a pool's metrics from the chain."""
+    return await _view_read(
+        'TalentPool', "getPoolMetrics", (("uint256", pool_id),),
+        ("uint256",) * len(_POOL_METRICS_KEYS), "pool metrics",
+        lambda values: {
+            "pool_id": pool_id,
+            "metrics": dict(zip(_POOL_METRICS_KEYS, values))
+        },
+        "get pool metrics"
+    )
 
 
 async def get_talent_pool_global_stats() -> Dict[str, Any]:
     """
     Get global talent pool statistics using the TalentPool smart contract.
     
+    Results are reused for a minute; concurrent requests share one read.
+    
     Returns:
         Dictionary containing global stats
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "TalentPool contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getGlobalStats (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getGlobalStats", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                stats = {
-                    "total_pools": result.getUint256(0) if result else 0,
-                    "total_applications": result.getUint256(1) if result else 0,
-                    "total_matches": result.getUint256(2) if result else 0,
-                    "total_staked": result.getUint256(3) if result else 0
-                }
-                
-                return {
-                    "success": True,
-                    "stats": stats
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse global stats data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "stats": {
-                        "total_pools": 0,
-                        "total_applications": 0,
-                        "total_matches": 0,
-                        "total_staked": 0
-                    }
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get global stats: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return await _cached_read(_POOL_STATS_CACHE, ("pool_stats", "talent_pool_global_stats"), _fetch_talent_pool_global_stats)
+
+
+async def _fetch_talent_pool_global_stats() -> Dict[str, Any]:
+    """Read global talent pool statistics from the chain."""
+    return await _view_read(
+        'TalentPool', "getGlobalStats", (),
+        ("uint256",) * len(_POOL_STATS_KEYS), "global stats",
+        lambda values: {"stats": dict(zip(_POOL_STATS_KEYS, values))},
+        "get global stats"
+    )
 
 
 async def get_active_pools_count() -> Dict[str, Any]:
     """
     Get active pools count using the TalentPool smart contract.
     
+    Results are reused for a minute; concurrent requests share one read.
+    
     Returns:
         Dictionary containing active pools count
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "TalentPool contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getActivePoolsCount (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getActivePoolsCount", params)
-        
-        # Execute query
-        response = query.execute(client)
-        
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                active_count = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "active_pools_count": active_count
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse active pools count data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "active_pools_count": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get active pools count: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return await _cached_read(_POOL_STATS_CACHE, ("pool_stats", "active_pools_count"), _fetch_active_pools_count)
+
+
+async def _fetch_active_pools_count() -> Dict[str, Any]:
+    """Read the active pools count from the chain."""
+    return await _view_read(
+        'TalentPool', "getActivePoolsCount", (), ("uint256",), "active pools count",
+        lambda values: {"active_pools_count": values[0]},
+        "get active pools count"
+    )
 
 
 async def get_total_pools_count() -> Dict[str, Any]:
     """
     Get total pools count using the TalentPool smart contract.
     
+    Results are reused for a minute; concurrent requests share one read.
+    
     Returns:
         Dictionary containing total pools count
     """
-    try:
-        client = get_hedera_client()
-        contract_config = get_contract_manager()
-        
-        # Get TalentPool contract info
-        pool_config = contract_config.get('contracts', {}).get('TalentPool', {})
-        contract_address = pool_config.get('address')
-        
-        if not contract_address:
-            return {
-                "success": False,
-                "error": "TalentPool contract not deployed"
-            }
-        
-        # Create contract ID
-        contract_id = ContractId.fromString(contract_address)
-        
-        # Prepare function parameters for getTotalPoolsCount (no parameters)
-        params = ContractFunctionParameters()
-        
-        # Execute contract query
-        query = ContractCallQuery()
-        query.setContractId(contract_id)
-        query.setGas(100000)
-        query.setFunction("getTotalPoolsCount", params)
+    return await _cached_read(_POOL_STATS_CACHE, ("pool_stats", "total_pools_count"), _fetch_total_pools_count)
+
+
+async def _fetch_total_pools_count() -> Dict[str, Any]:
+    """Read the total pools count from the chain."""
+    return await _view_read(
+        'TalentPool', "getTotalPoolsCount", (), ("uint256",), "total pools count",
+        lambda values: {"total_pools_count": values[0]},
+        "get total pools count"
+    )
+
+
+_DASHBOARD_COUNT_KEYS = ("active_pools_count", "total_pools_count")
+
+
+def _dashboard_from_result(result: Any) -> Dict[str, Any]:
+    """Map a getDashboardSnapshot result to metrics, stats and counts, or all zeros if unparseable."""
+    count = len(_POOL_METRICS_KEYS) + len(_POOL_STATS_KEYS) + len(_DASHBOARD_COUNT_KEYS)
+    values = [0] * count
+    if result is not None:
+        try:
+            values = _uint256_words(result, count)
+        except Exception as parse_error:
+            logger.warning("Could not parse dashboard snapshot data: %s", parse_error)
+    words = iter(values)
+    return {
+        "metrics": {key: next(words) for key in _POOL_METRICS_KEYS},
+        "stats": {key: next(words) for key in _POOL_STATS_KEYS},
+        **{key: next(words) for key in _DASHBOARD_COUNT_KEYS}
+    }
+
+
+async def get_dashboard_snapshot(
+    pool_id: str
+) -> Dict[str, Any]:
+    """
+    Get a pool's metrics, the global pool stats and the pool counts in one query.
+    
+    Reads TalentPool.getDashboardSnapshot, so a single-pool dashboard costs
+    one round trip instead of four. Results are reused for a few seconds.
+    
+    Args:
+        pool_id: ID of the job pool
         
-        # Execute query
-        response = query.execute(client)
+    Returns:
+        Dictionary containing "metrics", "stats", "active_pools_count" and
+        "total_pools_count"
+    """
+    return await _cached_read(
+        _POOL_METRICS_CACHE, ("dashboard_snapshot", str(pool_id)),
+        lambda: _call_read(
+            'TalentPool', "getDashboardSnapshot", (("uint256", pool_id),),
+            lambda result: {"pool_id": pool_id, **_dashboard_from_result(result)},
+            "get dashboard snapshot"
+        )
+    )
+
+
+async def get_talent_pool_snapshot(
+    pool_ids: List[str]
+) -> Dict[str, Any]:
+    """
+    Get the global pool stats, pool counts and several pools' metrics together.
+    
+    The reads are independent, so they run concurrently and the snapshot
+    costs the slowest read rather than the sum of all of them.
+    
+    Args:
+        pool_ids: IDs of the job pools to include metrics for
         
-        if response.getStatus() == Status.Success:
-            # Parse the response data
-            result = response.getContractFunctionResult()
-            
-            try:
-                total_count = result.getUint256(0) if result else 0
-                
-                return {
-                    "success": True,
-                    "total_pools_count": total_count
-                }
-                
-            except Exception as parse_error:
-                logger.warning(f"Could not parse total pools count data: {str(parse_error)}")
-                return {
-                    "success": True,
-                    "total_pools_count": 0
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Query failed with status: {response.getStatus()}"
-            }
-            
-    except Exception as e:
-        logger.error(f"Failed to get total pools count: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    Returns:
+        Dictionary with the get_talent_pool_global_stats, get_active_pools_count
+        and get_total_pools_count results, and get_pool_metrics per pool ID
+    """
+    global_stats, active_count, total_count, *metrics = await asyncio.gather(
+        get_talent_pool_global_stats(),
+        get_active_pools_count(),
+        get_total_pools_count(),
+        *(get_pool_metrics(pool_id) for pool_id in pool_ids)
+    )
+    
+    return {
+        "success": global_stats.get("success", False),
+        "global_stats": global_stats,
+        "active_pools_count": active_count,
+        "total_pools_count": total_count,
+        "pool_metrics": dict(zip(pool_ids, metrics))
+    }
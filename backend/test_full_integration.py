@@ -10,17 +10,27 @@ import asyncio
 import sys
 import os
 import json
+from functools import lru_cache
 
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.config import get_contract_config, get_contract_address
+from app.config import get_contract_config, get_contract_addresses
 from app.utils.hedera import initialize_hedera_client, get_hedera_client
 from app.services.governance import get_governance_service
 from app.services.reputation import get_reputation_service
 from app.services.skill import get_skill_service
 from app.services.pool import get_pool_service
 
+@lru_cache(maxsize=16)
+def _load_abi(contract_name):
+    """Load and parse a contract's ABI once; missing ABIs load as empty."""
+    abi_file_path = os.path.join(os.path.dirname(__file__), '..', 'contracts', 'abis', f"{contract_name}.json")
+    if not os.path.exists(abi_file_path):
+        return []
+    with open(abi_file_path, 'r') as abi_file:
+        return json.load(abi_file)
+
 async def test_contract_configuration():
     """Test contract configuration loading."""
     print("🔍 Testing Contract Configuration...")
@@ -47,11 +57,7 @@ async def test_contract_configuration():
                 contract_name = contract_mapping[deploy_name]
                 
                 # Load ABI for this contract
-                abi_file_path = os.path.join(os.path.dirname(__file__), '..', 'contracts', 'abis', f"{contract_name}.json")
-                abi = []
-                if os.path.exists(abi_file_path):
-                    with open(abi_file_path, 'r') as abi_file:
-                        abi = json.load(abi_file)
+                abi = _load_abi(contract_name)
                 
                 # Convert contract address format if needed
                 contract_address = contract_info.get('contractAddress', '')
@@ -110,9 +116,9 @@ async def test_contract_addresses():
     
     try:
         contracts = ['SkillToken', 'TalentPool', 'Governance', 'ReputationOracle']
+        addresses = get_contract_addresses(contracts)
         
-        for contract_name in contracts:
-            address = get_contract_address(contract_name)
+        for contract_name, address in addresses.items():
             if address:
                 print(f"✅ {contract_name}: {address}")
             else:
@@ -151,6 +157,33 @@ async def test_service_initialization():
         print(f"❌ Service initialization test failed: {str(e)}")
         return False
 
+# Functions each contract must expose
+KEY_FUNCTIONS = {
+    'Governance': ['createProposal', 'castVote', 'delegate'],
+    'ReputationOracle': ['registerOracle', 'submitEvaluation'],
+    'SkillToken': ['mintSkillToken', 'updateSkillLevel'],
+    'TalentPool': ['createJobPool', 'applyToPool'],
+}
+
+def _check_contract(contract_name, config):
+    """Scan one contract's ABI for its key functions and return the report lines."""
+    if not (config.get('deployed') and config.get('abi')):
+        return [f"❌ {contract_name}: Not ready (deployed: {config.get('deployed')}, has_abi: {len(config.get('abi', [])) > 0})"]
+    
+    # Contract is deployed and has ABI
+    abi_functions = [item for item in config.get('abi', []) if item.get('type') == 'function']
+    lines = [f"✅ {contract_name}: {len(abi_functions)} functions available"]
+    
+    # Check for key functions
+    function_names = frozenset(func['name'] for func in abi_functions if 'name' in func)
+    for key_func in KEY_FUNCTIONS.get(contract_name, []):
+        if key_func in function_names:
+            lines.append(f"   ✅ {key_func} function available")
+        else:
+            lines.append(f"   ❌ {key_func} function missing")
+    
+    return lines
+
 async def test_contract_functionality():
     """Test basic contract functionality."""
     print("\n🔍 Testing Contract Functionality...")
@@ -160,33 +193,13 @@ async def test_contract_functionality():
         contract_config = get_contract_config()
         contracts = contract_config.get('contracts', {})
         
-        for contract_name, config in contracts.items():
-            if config.get('deployed') and config.get('abi'):
-                # Contract is deployed and has ABI
-                abi_functions = [item for item in config.get('abi', []) if item.get('type') == 'function']
-                print(f"✅ {contract_name}: {len(abi_functions)} functions available")
-                
-                # Check for key functions
-                function_names = [func.get('name', '') for func in abi_functions]
-                
-                if contract_name == 'Governance':
-                    key_functions = ['createProposal', 'castVote', 'delegate']
-                elif contract_name == 'ReputationOracle':
-                    key_functions = ['registerOracle', 'submitEvaluation']
-                elif contract_name == 'SkillToken':
-                    key_functions = ['mintSkillToken', 'updateSkillLevel']
-                elif contract_name == 'TalentPool':
-                    key_functions = ['createJobPool', 'applyToPool']
-                else:
-                    key_functions = []
-                
-                for key_func in key_functions:
-                    if key_func in function_names:
-                        print(f"   ✅ {key_func} function available")
-                    else:
-                        print(f"   ❌ {key_func} function missing")
-            else:
-                print(f"❌ {contract_name}: Not ready (deployed: {config.get('deployed')}, has_abi: {len(config.get('abi', [])) > 0})")
+        # Scan the ABIs concurrently, then report them in contract order
+        reports = await asyncio.gather(*[
+            asyncio.to_thread(_check_contract, contract_name, config)
+            for contract_name, config in contracts.items()
+        ])
+        for lines in reports:
+            print("\n".join(lines))
         
         return True
         
@@ -232,22 +245,41 @@ async def test_authentication_system():
         print(f"❌ Authentication system test failed: {str(e)}")
         return False
 
+# Each test and the tests it depends on, in reporting order
+TESTS = {
+    test_contract_configuration: [],
+    test_hedera_client: [test_contract_configuration],
+    test_contract_addresses: [test_contract_configuration],
+    test_service_initialization: [test_hedera_client],
+    test_contract_functionality: [test_contract_configuration, test_contract_addresses],
+    test_api_endpoints: [],
+    test_authentication_system: [],
+}
+
+async def run_dag(tests):
+    """Run tests layer by layer: each layer holds the tests whose dependencies have all run, and runs concurrently."""
+    results = {}
+    remaining = dict(tests)
+    
+    while remaining:
+        layer = [test for test, depends_on in remaining.items() if all(dep in results for dep in depends_on)]
+        if not layer:
+            raise ValueError(f"Circular test dependencies: {[test.__name__ for test in remaining]}")
+        
+        layer_results = await asyncio.gather(*(test() for test in layer), return_exceptions=True)
+        for test, result in zip(layer, layer_results):
+            results[test] = result
+            del remaining[test]
+    
+    return results
+
 async def main():
     """Run all integration tests."""
     print("🚀 TalentChain Pro Full Integration Test")
     print("=" * 60)
     
-    tests = [
-        test_contract_configuration(),
-        test_hedera_client(),
-        test_contract_addresses(),
-        test_service_initialization(),
-        test_contract_functionality(),
-        test_api_endpoints(),
-        test_authentication_system(),
-    ]
-    
-    results = await asyncio.gather(*tests, return_exceptions=True)
+    results_by_test = await run_dag(TESTS)
+    results = [results_by_test[test] for test in TESTS]
     
     print("\n" + "=" * 60)
     print("📊 Test Results:")
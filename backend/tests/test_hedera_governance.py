@@ -0,0 +1,359 @@
+"""
+Tests for the Hedera governance reads
+
+This module covers the governance read path in app.utils.hedera: its rate
+limit and the batched, paginated and cached reads built on top of the
+single-value getters. The Hedera SDK is mocked throughout.
+"""
+
+import sys
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+try:
+    import hedera  # noqa: F401
+except ImportError:
+    # The SDK drives a JVM; every call into it is mocked below
+    sys.modules["hedera"] = MagicMock()
+
+import app.utils.hedera as h
+from app.config import Settings
+from app.utils.hedera import CallResult
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state(monkeypatch):
+    """Start each test with fresh read limits and no shared or cached reads."""
+    monkeypatch.setattr(h, "_governance_bucket", None)
+    monkeypatch.setattr(h, "_governance_semaphore", None)
+    h._INFLIGHT.clear()
+    h._GOVERNANCE_PARAMS_CACHE.clear()
+    yield
+    h._INFLIGHT.clear()
+    h._GOVERNANCE_PARAMS_CACHE.clear()
+
+
+class TestGovernanceRateLimit:
+    """Test the token bucket that sheds governance reads under load."""
+    
+    def test_bucket_allows_burst_then_waits(self):
+        """Test that a full bucket serves its burst and then reports the wait."""
+        with patch.object(h.time, "monotonic", return_value=100.0):
+            bucket = h._TokenBucket(rate=2.0, burst=3)
+            
+            assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+            assert bucket.try_acquire() == pytest.approx(0.5)
+    
+    def test_bucket_refills_over_time(self):
+        """Test that tokens accrue at the rate, capped at the burst."""
+        with patch.object(h.time, "monotonic", return_value=100.0) as now:
+            bucket = h._TokenBucket(rate=2.0, burst=2)
+            bucket.try_acquire()
+            bucket.try_acquire()
+            
+            now.return_value = 100.5
+            assert bucket.try_acquire() == 0.0
+            assert bucket.try_acquire() > 0
+            
+            now.return_value = 200.0
+            assert bucket.try_acquire() == bucket.try_acquire() == 0.0
+            assert bucket.try_acquire() > 0
+    
+    @pytest.mark.asyncio
+    async def test_limited_read_is_shed_with_retry_hint(self, monkeypatch):
+        """Test that a read without a token is refused before reaching the network."""
+        bucket = MagicMock()
+        bucket.try_acquire.return_value = 0.25
+        monkeypatch.setattr(h, "_governance_bucket", bucket)
+        
+        with patch.object(h, "_call_read", AsyncMock()) as call_read:
+            result = await h.get_vote_receipt("5", "0.0.1234")
+        
+        assert result == {"success": False, "error": "rate_limited", "retry_after_ms": 251}
+        call_read.assert_not_awaited()
+    
+    def test_bucket_is_sized_from_settings(self):
+        """Test that the shared bucket takes its rate from the configured QPS."""
+        settings = MagicMock(hedera_governance_qps=5.0)
+        
+        with patch.object(h, "get_settings", return_value=settings):
+            bucket = h._governance_rate_limit()
+        
+        assert bucket.rate == 5.0
+        assert bucket.burst == h._GOVERNANCE_BURST
+        assert h._governance_rate_limit() is bucket
+    
+    @pytest.mark.parametrize("variable", ["HEDERA_GOV_QPS", "HEDERA_GOVERNANCE_QPS"])
+    def test_qps_is_read_from_environment(self, monkeypatch, variable):
+        """Test that the QPS setting is read from either environment variable."""
+        monkeypatch.setenv(variable, "7.5")
+        
+        assert Settings().hedera_governance_qps == 7.5
+
+
+@pytest.fixture
+def governance():
+    """Mock a deployed Governance contract."""
+    with patch.object(h, "_resolve_contract", return_value=("0.0.1003", MagicMock())):
+        yield
+
+
+class TestProposalStatuses:
+    """Test batched proposal status reads."""
+    
+    @pytest.mark.asyncio
+    async def test_statuses_are_read_in_one_batch(self, governance):
+        """Test that all statuses come from one batch, in order."""
+        results = [CallResult(success=True, values=(1,)), CallResult(success=True, values=(4,))]
+        
+        with patch.object(h, "batch_contract_call", AsyncMock(return_value=results)) as batch, \
+             patch.object(h, "_proposal_status_read", AsyncMock()) as single:
+            statuses = await h.get_proposal_statuses(["7", "8"])
+        
+        assert statuses == [
+            {"success": True, "proposal_id": "7", "status": 1},
+            {"success": True, "proposal_id": "8", "status": 4},
+        ]
+        assert [call.args for call in batch.await_args.args[0]] == [(7,), (8,)]
+        single.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_failed_and_malformed_ids_are_read_individually(self, governance):
+        """Test that failed batch entries and malformed IDs fall back to single reads."""
+        results = [
+            CallResult(success=True, values=(1,)),
+            CallResult(success=False, error="timeout"),
+        ]
+        
+        async def _single(proposal_id, rate_limit=True):
+            assert rate_limit is False
+            if proposal_id == "abc":
+                return {"success": False, "error": "invalid literal for int()"}
+            return {"success": True, "proposal_id": proposal_id, "status": 2}
+        
+        with patch.object(h, "batch_contract_call", AsyncMock(return_value=results)) as batch, \
+             patch.object(h, "_proposal_status_read", side_effect=_single) as single:
+            statuses = await h.get_proposal_statuses(["7", "abc", "8"])
+        
+        assert [call.args for call in batch.await_args.args[0]] == [(7,), (8,)]
+        assert [call.args[0] for call in single.call_args_list] == ["abc", "8"]
+        assert statuses == [
+            {"success": True, "proposal_id": "7", "status": 1},
+            {"success": False, "error": "invalid literal for int()"},
+            {"success": True, "proposal_id": "8", "status": 2},
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_batch_takes_one_rate_limit_token(self, governance, monkeypatch):
+        """Test that a shed batch is reported per proposal without any read."""
+        bucket = MagicMock()
+        bucket.try_acquire.return_value = 1.0
+        monkeypatch.setattr(h, "_governance_bucket", bucket)
+        
+        with patch.object(h, "batch_contract_call", AsyncMock()) as batch:
+            statuses = await h.get_proposal_statuses(["7", "8"])
+        
+        assert [status["error"] for status in statuses] == ["rate_limited", "rate_limited"]
+        bucket.try_acquire.assert_called_once()
+        batch.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_undeployed_contract(self):
+        """Test that every proposal fails when Governance is not deployed."""
+        with patch.object(h, "_resolve_contract", return_value=(None, None)):
+            statuses = await h.get_proposal_statuses(["7", "8"])
+        
+        assert [status["success"] for status in statuses] == [False, False]
+    
+    @pytest.mark.asyncio
+    async def test_no_proposals(self):
+        """Test that an empty request takes no token and makes no read."""
+        with patch.object(h, "_governance_rate_limit") as limit:
+            assert await h.get_proposal_statuses([]) == []
+        
+        limit.assert_not_called()
+
+
+class TestIterProposals:
+    """Test paginated proposal fetching."""
+    
+    @staticmethod
+    async def _batch(calls):
+        """Answer each getProposal call with its ID, failing proposal 4."""
+        return [
+            CallResult(success=False, error="reverted") if call.args[0] == 4
+            else CallResult(success=True, values=(call.args[0],))
+            for call in calls
+        ]
+    
+    @staticmethod
+    async def _collect(pages):
+        """Gather every page yielded by iter_proposals."""
+        return [page async for page in pages]
+    
+    @pytest.mark.asyncio
+    async def test_proposals_are_fetched_in_pages(self, governance):
+        """Test that each page is one batch and failed proposals are skipped."""
+        ids = CallResult(success=True, values=([1, 2, 3, 4, 5],))
+        
+        with patch.object(h, "_hedged_contract_call", AsyncMock(return_value=ids)) as list_ids, \
+             patch.object(h, "batch_contract_call", side_effect=self._batch) as batch, \
+             patch.object(h, "_proposal_from_values", side_effect=lambda values: {"id": values[0]}):
+            pages = await self._collect(h.iter_proposals(page_size=2))
+        
+        assert list_ids.await_args.args[0].function == "getAllProposals()"
+        assert sorted(len(call.args[0]) for call in batch.call_args_list) == [1, 2, 2]
+        assert sorted(proposal["id"] for page in pages for proposal in page) == [1, 2, 3, 5]
+    
+    @pytest.mark.asyncio
+    async def test_active_only_lists_active_proposals(self, governance):
+        """Test that active_only reads the active proposal IDs."""
+        ids = CallResult(success=True, values=([],))
+        
+        with patch.object(h, "_hedged_contract_call", AsyncMock(return_value=ids)) as list_ids, \
+             patch.object(h, "batch_contract_call", AsyncMock()) as batch:
+            pages = await self._collect(h.iter_proposals(active_only=True))
+        
+        assert pages == []
+        assert list_ids.await_args.args[0].function == "getActiveProposals()"
+        batch.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_failed_id_list_yields_nothing(self, governance):
+        """Test that nothing is yielded when the ID list cannot be read."""
+        failed = CallResult(success=False, error="502")
+        
+        with patch.object(h, "_hedged_contract_call", AsyncMock(return_value=failed)), \
+             patch.object(h, "batch_contract_call", AsyncMock()) as batch:
+            assert await self._collect(h.iter_proposals()) == []
+        
+        batch.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_undeployed_contract_yields_nothing(self):
+        """Test that nothing is yielded when Governance is not deployed."""
+        with patch.object(h, "_resolve_contract", return_value=(None, None)), \
+             patch.object(h, "_hedged_contract_call", AsyncMock()) as list_ids:
+            assert await self._collect(h.iter_proposals()) == []
+        
+        list_ids.assert_not_awaited()
+
+
+class TestGovernanceSnapshot:
+    """Test the single round-trip governance snapshot for proposal pages."""
+    
+    VOTER = "0x" + "cc" * 20
+    VALUES = {
+        "getQuorum()": 400,
+        "getVotingDelay()": 10,
+        "getVotingPeriod()": 100,
+        "getProposalThreshold()": 5,
+        "getProposalStatus(uint256)": 1,
+        "canExecute(uint256)": False,
+        "hasVoted(uint256,address)": True,
+    }
+    
+    @classmethod
+    async def _batch(cls, calls):
+        """Answer each call with its value from VALUES."""
+        return [CallResult(success=True, values=(cls.VALUES[call.function],)) for call in calls]
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_reads_every_field_in_one_batch(self, governance):
+        """Test that a cold snapshot reads parameters and proposal state in one batch."""
+        with patch.object(h, "batch_contract_call", side_effect=self._batch) as batch:
+            snapshot = await h.get_governance_snapshot("9", self.VOTER)
+        
+        assert snapshot == {
+            "success": True,
+            "proposal_id": "9",
+            "voter": self.VOTER,
+            "quorum": 400,
+            "voting_delay": 10,
+            "voting_period": 100,
+            "proposal_threshold": 5,
+            "status": 1,
+            "can_execute": False,
+            "has_voted": True
+        }
+        batch.assert_called_once()
+        args = {call.function: call.args for call in batch.call_args.args[0]}
+        assert args["getQuorum()"] == ()
+        assert args["canExecute(uint256)"] == (9,)
+        assert args["hasVoted(uint256,address)"] == (9, self.VOTER)
+    
+    @pytest.mark.asyncio
+    async def test_cached_parameters_are_not_read_again(self, governance):
+        """Test that a warm snapshot only reads the per-proposal fields."""
+        with patch.object(h, "batch_contract_call", side_effect=self._batch) as batch:
+            await h.get_governance_snapshot("9", self.VOTER)
+            snapshot = await h.get_governance_snapshot("10", self.VOTER)
+        
+        functions = [call.function for call in batch.call_args.args[0]]
+        assert functions == [
+            "getProposalStatus(uint256)", "canExecute(uint256)", "hasVoted(uint256,address)"
+        ]
+        assert snapshot["quorum"] == 400
+        assert snapshot["proposal_id"] == "10"
+    
+    @pytest.mark.asyncio
+    async def test_parameters_share_the_getter_cache(self, governance):
+        """Test that parameters cached by get_quorum are reused and vice versa."""
+        cached = {"success": True, "quorum": 321}
+        h._GOVERNANCE_PARAMS_CACHE.set(("governance_param", "quorum"), cached)
+        
+        with patch.object(h, "batch_contract_call", side_effect=self._batch) as batch:
+            snapshot = await h.get_governance_snapshot("9", self.VOTER)
+            quorum = await h.get_quorum()
+        
+        assert snapshot["quorum"] == 321
+        assert "getQuorum()" not in [call.function for call in batch.call_args.args[0]]
+        assert quorum == cached
+        assert h._GOVERNANCE_PARAMS_CACHE.get(("governance_param", "voting_period")) == {
+            "success": True,
+            "voting_period": 100
+        }
+    
+    @pytest.mark.asyncio
+    async def test_failed_fields_are_reported_and_not_cached(self, governance):
+        """Test that failed fields are None, listed under errors and retried next time."""
+        async def _batch(calls):
+            return [
+                CallResult(success=False, error="timeout") if call.function == "getQuorum()"
+                else CallResult(success=True, values=(self.VALUES[call.function],))
+                for call in calls
+            ]
+        
+        with patch.object(h, "batch_contract_call", side_effect=_batch):
+            snapshot = await h.get_governance_snapshot("9", self.VOTER)
+        
+        assert snapshot["success"] is True
+        assert snapshot["quorum"] is None
+        assert snapshot["errors"] == {"quorum": "timeout"}
+        assert h._GOVERNANCE_PARAMS_CACHE.get(("governance_param", "quorum")) is None
+    
+    @pytest.mark.asyncio
+    async def test_all_fields_failing_fails_snapshot(self, governance):
+        """Test that the snapshot fails when no field could be read."""
+        async def _batch(calls):
+            return [CallResult(success=False, error="502") for _ in calls]
+        
+        with patch.object(h, "batch_contract_call", side_effect=_batch):
+            snapshot = await h.get_governance_snapshot("9", self.VOTER)
+        
+        assert snapshot["success"] is False
+        assert len(snapshot["errors"]) == 7
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_is_rate_limited(self, governance, monkeypatch):
+        """Test that a snapshot without a rate limit token reads nothing."""
+        bucket = MagicMock()
+        bucket.try_acquire.return_value = 0.5
+        monkeypatch.setattr(h, "_governance_bucket", bucket)
+        
+        with patch.object(h, "batch_contract_call", AsyncMock()) as batch:
+            snapshot = await h.get_governance_snapshot("9", self.VOTER)
+        
+        assert snapshot["error"] == "rate_limited"
+        assert snapshot["retry_after_ms"] == 501
+        batch.assert_not_awaited()
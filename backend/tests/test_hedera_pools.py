@@ -0,0 +1,191 @@
+"""
+Tests for the Hedera TalentPool reads
+
+This module covers the caching of TalentPool metrics, stats and counts in
+app.utils.hedera, its invalidation on pool writes, and the single-query
+dashboard snapshot. The Hedera SDK is mocked throughout.
+"""
+
+import sys
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+try:
+    import hedera  # noqa: F401
+except ImportError:
+    # The SDK drives a JVM; every call into it is mocked below
+    sys.modules["hedera"] = MagicMock()
+
+from eth_abi import encode as abi_encode
+
+import app.utils.hedera as h
+from app.utils.hedera import TransactionResult
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state():
+    """Clear the pool caches and shared reads around each test."""
+    h._POOL_METRICS_CACHE.clear()
+    h._POOL_STATS_CACHE.clear()
+    h._INFLIGHT.clear()
+    h._RECENT_WRITES.clear()
+    yield
+    h._POOL_METRICS_CACHE.clear()
+    h._POOL_STATS_CACHE.clear()
+    h._INFLIGHT.clear()
+    h._RECENT_WRITES.clear()
+
+
+def _java_result(raw: bytes) -> MagicMock:
+    """Mock a ContractFunctionResult whose asBytes() holds ``raw`` as signed Java bytes."""
+    result = MagicMock()
+    result.asBytes.return_value.toByteArray.return_value = [b - 256 if b > 127 else b for b in raw]
+    return result
+
+
+def _metrics(pool_id, total_staked=1000):
+    """Build a get_pool_metrics response."""
+    return {
+        "success": True,
+        "pool_id": pool_id,
+        "metrics": dict.fromkeys(h._POOL_METRICS_KEYS, 0) | {"total_staked": total_staked}
+    }
+
+
+class TestPoolCache:
+    """Test the TTL cache in front of TalentPool reads and its invalidation."""
+    
+    @pytest.mark.asyncio
+    async def test_metrics_are_reused(self):
+        """Test that repeated metrics reads share one chain read and return copies."""
+        with patch.object(h, "_fetch_pool_metrics", AsyncMock(side_effect=_metrics)) as fetch:
+            first = await h.get_pool_metrics("7")
+            first["metrics"]["total_staked"] = 0
+            second = await h.get_pool_metrics("7")
+        
+        fetch.assert_awaited_once_with("7")
+        assert second == _metrics("7")
+    
+    @pytest.mark.asyncio
+    async def test_failed_read_is_not_cached(self):
+        """Test that a failed read is retried on the next call."""
+        fetch = AsyncMock(side_effect=[{"success": False, "error": "timeout"}, _metrics("7")])
+        
+        with patch.object(h, "_fetch_pool_metrics", fetch):
+            assert (await h.get_pool_metrics("7"))["success"] is False
+            assert (await h.get_pool_metrics("7"))["success"] is True
+        
+        assert fetch.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_invalidating_a_pool_keeps_other_pools(self):
+        """Test that invalidating one pool drops its metrics and the global stats only."""
+        fetch_stats = AsyncMock(return_value={"success": True, "stats": {}})
+        
+        with patch.object(h, "_fetch_pool_metrics", AsyncMock(side_effect=_metrics)) as fetch, \
+             patch.object(h, "_fetch_talent_pool_global_stats", fetch_stats):
+            await h.get_pool_metrics("7")
+            await h.get_pool_metrics("8")
+            await h.get_talent_pool_global_stats()
+            
+            h.invalidate_pool_cache(7)
+            
+            await h.get_pool_metrics("7")
+            await h.get_pool_metrics("8")
+            await h.get_talent_pool_global_stats()
+        
+        assert [call.args[0] for call in fetch.await_args_list] == ["7", "8", "7"]
+        assert fetch_stats.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_invalidating_everything(self):
+        """Test that invalidating without a pool ID drops every pool's metrics."""
+        with patch.object(h, "_fetch_pool_metrics", AsyncMock(side_effect=_metrics)) as fetch:
+            await h.get_pool_metrics("7")
+            await h.get_pool_metrics("8")
+            
+            h.invalidate_pool_cache()
+            
+            await h.get_pool_metrics("7")
+            await h.get_pool_metrics("8")
+        
+        assert fetch.await_count == 4
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("success, invalidated", [(True, True), (False, False)])
+    async def test_pool_write_invalidates_its_pool(self, success, invalidated):
+        """Test that only a successful pool write invalidates the pool's cached reads."""
+        outcome = (TransactionResult(success=success), None)
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=outcome)), \
+             patch.object(h, "invalidate_pool_cache") as invalidate:
+            await h.select_candidate("7", "0x" + "ab" * 20)
+        
+        assert invalidate.called is invalidated
+        if invalidated:
+            invalidate.assert_called_once_with("7")
+
+
+class TestDashboardSnapshot:
+    """Test the single-query TalentPool dashboard snapshot."""
+    
+    WORDS = [1000, 80, 50, 3600, 12, 40, 9, 5000, 4, 12]
+    
+    @classmethod
+    def _read(cls, words=None):
+        """Mock _call_read to answer getDashboardSnapshot with ``words``."""
+        raw = abi_encode(["uint256"] * 10, cls.WORDS if words is None else words)
+        
+        async def _call_read(contract_name, function_name, param_spec, parser, description):
+            return {"success": True, **parser(_java_result(raw))}
+        
+        return patch.object(h, "_call_read", side_effect=_call_read)
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_decodes_every_section(self):
+        """Test that one query fills the metrics, stats and both counts."""
+        with self._read() as call_read:
+            snapshot = await h.get_dashboard_snapshot("7")
+        
+        assert snapshot == {
+            "success": True,
+            "pool_id": "7",
+            "metrics": {
+                "total_staked": 1000,
+                "average_match_score": 80,
+                "completion_rate": 50,
+                "average_time_to_fill": 3600
+            },
+            "stats": {
+                "total_pools": 12,
+                "total_applications": 40,
+                "total_matches": 9,
+                "total_staked": 5000
+            },
+            "active_pools_count": 4,
+            "total_pools_count": 12
+        }
+        call_read.assert_called_once()
+        contract_name, function_name, param_spec = call_read.call_args.args[:3]
+        assert (contract_name, function_name) == ("TalentPool", "getDashboardSnapshot")
+        assert param_spec == (("uint256", "7"),)
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_is_cached_until_the_pool_changes(self):
+        """Test that the snapshot is reused and dropped when its pool is invalidated."""
+        with self._read() as call_read:
+            await h.get_dashboard_snapshot("7")
+            await h.get_dashboard_snapshot("7")
+            h.invalidate_pool_cache("7")
+            await h.get_dashboard_snapshot("7")
+        
+        assert call_read.call_count == 2
+    
+    def test_unparseable_result_decodes_to_zeros(self):
+        """Test that a missing or short result yields zeroed sections."""
+        for result in (None, _java_result(b"\x00" * 64)):
+            dashboard = h._dashboard_from_result(result)
+            
+            assert dashboard["metrics"] == dict.fromkeys(h._POOL_METRICS_KEYS, 0)
+            assert dashboard["stats"] == dict.fromkeys(h._POOL_STATS_KEYS, 0)
+            assert dashboard["active_pools_count"] == dashboard["total_pools_count"] == 0
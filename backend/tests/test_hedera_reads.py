@@ -0,0 +1,491 @@
+"""
+Tests for the Hedera contract read path
+
+This module covers how app.utils.hedera shares, hedges, batches and decodes
+contract reads. The Hedera SDK and the HTTP client are mocked throughout.
+"""
+
+import sys
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+try:
+    import hedera  # noqa: F401
+except ImportError:
+    # The SDK drives a JVM; every call into it is mocked below
+    sys.modules["hedera"] = MagicMock()
+
+from eth_abi import encode as abi_encode
+from eth_hash.auto import keccak
+
+import app.utils.hedera as h
+from app.utils.hedera import CallResult, CallSpec
+
+
+def _java_result(raw: bytes) -> MagicMock:
+    """Mock a ContractFunctionResult whose asBytes() holds ``raw`` as signed Java bytes."""
+    result = MagicMock()
+    result.asBytes.return_value.toByteArray.return_value = [b - 256 if b > 127 else b for b in raw]
+    return result
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state():
+    """Clear the module-level read caches and statistics around each test."""
+    h._INFLIGHT.clear()
+    h._HEDGE_WINS.clear()
+    h._ORACLE_PERFORMANCE_CACHE.clear()
+    h._MATCH_SCORE_CACHE.clear()
+    yield
+    h._INFLIGHT.clear()
+    h._HEDGE_WINS.clear()
+    h._ORACLE_PERFORMANCE_CACHE.clear()
+    h._MATCH_SCORE_CACHE.clear()
+
+
+class TestCoalescing:
+    """Test that concurrent identical reads share one request."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_read(self):
+        """Test that concurrent callers with the same key run the factory once."""
+        calls = 0
+        release = asyncio.Event()
+        
+        async def _read():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"success": True}
+        
+        first = asyncio.create_task(h._coalesced(("read", "1"), _read))
+        second = asyncio.create_task(h._coalesced(("read", "1"), _read))
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await first == await second == {"success": True}
+        assert calls == 1
+        assert ("read", "1") not in h._INFLIGHT
+    
+    @pytest.mark.asyncio
+    async def test_distinct_keys_run_separately(self):
+        """Test that callers with different keys do not share a read."""
+        factory = AsyncMock(return_value={"success": True})
+        
+        await asyncio.gather(
+            h._coalesced(("read", "1"), factory),
+            h._coalesced(("read", "2"), factory)
+        )
+        
+        assert factory.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_read(self):
+        """Test that cancelling one caller leaves the shared read running for the others."""
+        release = asyncio.Event()
+        
+        async def _read():
+            await release.wait()
+            return {"success": True}
+        
+        first = asyncio.create_task(h._coalesced(("read", "1"), _read))
+        second = asyncio.create_task(h._coalesced(("read", "1"), _read))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        
+        assert await second == {"success": True}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_oracle_performance_reads_share_one_call(self):
+        """Test that concurrent reads for one oracle share a call and fill the cache."""
+        release = asyncio.Event()
+        oracle = "0x" + "ab" * 20
+        
+        async def _call(spec):
+            await release.wait()
+            return CallResult(success=True, values=(5, 1, 0, 1700000000))
+        
+        with patch.object(h, "_resolve_contract", return_value=("0.0.1004", MagicMock())), \
+             patch.object(h, "_hedged_contract_call", side_effect=_call) as call:
+            first = asyncio.create_task(h.get_oracle_performance(oracle))
+            second = asyncio.create_task(h.get_oracle_performance(oracle))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+            cached = await h.get_oracle_performance(oracle)
+        
+        assert call.call_count == 1
+        assert results[0] == results[1] == cached
+        assert cached["performance"]["evaluations_completed"] == 5
+        assert results[0] is not results[1]
+
+
+class TestHedgedReads:
+    """Test hedged reads across read providers."""
+    
+    @staticmethod
+    def _provider(result, delay=0.0, started=None, name=None):
+        """Build a provider factory that answers ``result`` after ``delay`` seconds."""
+        async def _call():
+            if started is not None:
+                started.append(name)
+            await asyncio.sleep(delay)
+            return result
+        return lambda: _call()
+    
+    @pytest.mark.asyncio
+    async def test_fast_first_provider_wins_alone(self):
+        """Test that a provider answering within the delay never starts the next one."""
+        started = []
+        winner = CallResult(success=True, values=(1,))
+        other = CallResult(success=True, values=(2,))
+        
+        result = await h._hedged([
+            ("mirror", self._provider(winner, started=started, name="mirror")),
+            ("relay", self._provider(other, started=started, name="relay")),
+        ], delay=0.05)
+        
+        assert result is winner
+        assert started == ["mirror"]
+    
+    @pytest.mark.asyncio
+    async def test_slow_provider_is_hedged(self):
+        """Test that a slow provider is raced by the next one after the delay."""
+        started = []
+        slow = CallResult(success=True, values=(1,))
+        fast = CallResult(success=True, values=(2,))
+        
+        result = await h._hedged([
+            ("mirror", self._provider(slow, 1.0, started, "mirror")),
+            ("relay", self._provider(fast, started=started, name="relay")),
+        ], delay=0.01)
+        
+        assert result is fast
+        assert started == ["mirror", "relay"]
+    
+    @pytest.mark.asyncio
+    async def test_failure_falls_through_to_next_provider(self):
+        """Test that a failed provider does not end the race."""
+        fallback = CallResult(success=True, values=(2,))
+        
+        result = await h._hedged([
+            ("mirror", self._provider(CallResult(success=False, error="502"))),
+            ("relay", self._provider(fallback)),
+        ], delay=0.05)
+        
+        assert result is fallback
+    
+    @pytest.mark.asyncio
+    async def test_all_failures_return_last_error(self):
+        """Test that the last failure is returned when no provider succeeds."""
+        async def _raise():
+            raise RuntimeError("relay down")
+        
+        result = await h._hedged([
+            ("mirror", self._provider(CallResult(success=False, error="502"))),
+            ("relay", _raise),
+        ], delay=0.01)
+        
+        assert result.success is False
+        assert result.error in ("502", "relay down")
+    
+    @pytest.mark.asyncio
+    async def test_recent_winner_goes_first(self):
+        """Test that unpinned races start with the recent best provider."""
+        h._HEDGE_WINS[("mirror", "relay")] = {"relay": 3.0}
+        started = []
+        
+        await h._hedged([
+            ("mirror", self._provider(CallResult(success=True), started=started, name="mirror")),
+            ("relay", self._provider(CallResult(success=True), started=started, name="relay")),
+        ], delay=0.05)
+        
+        assert started == ["relay"]
+    
+    @pytest.mark.asyncio
+    async def test_pinned_order_is_kept(self):
+        """Test that pinned races keep the caller's order and record no wins."""
+        h._HEDGE_WINS[("mirror", "consensus")] = {"consensus": 100.0}
+        started = []
+        answer = CallResult(success=True)
+        
+        await h._hedged([
+            ("mirror", self._provider(answer, started=started, name="mirror")),
+            ("consensus", self._provider(answer, started=started, name="consensus")),
+        ], delay=0.05, pinned=True)
+        
+        assert started == ["mirror"]
+        assert h._HEDGE_WINS[("mirror", "consensus")] == {"consensus": 100.0}
+    
+    @pytest.mark.asyncio
+    async def test_wins_decay(self):
+        """Test that older wins lose weight as new races are won."""
+        h._HEDGE_WINS[("mirror", "relay")] = {"relay": 1.0}
+        
+        await h._hedged([
+            ("mirror", self._provider(CallResult(success=True))),
+            ("relay", self._provider(CallResult(success=False, error="502"))),
+        ], delay=0.05)
+        
+        wins = h._HEDGE_WINS[("mirror", "relay")]
+        assert wins["relay"] == pytest.approx(h._HEDGE_DECAY)
+        assert wins["mirror"] == 1.0
+
+
+class TestRawWordDecoders:
+    """Test decoding of contract results straight from their raw ABI bytes."""
+    
+    def test_uint256_words(self):
+        """Test that leading uint256 words are decoded in order."""
+        result = _java_result(abi_encode(["uint256", "uint256", "uint256"], [1, 2 ** 255, 3]))
+        
+        assert h._uint256_words(result, 2) == [1, 2 ** 255]
+    
+    def test_uint256_words_too_short(self):
+        """Test that a result shorter than the requested words is rejected."""
+        with pytest.raises(ValueError):
+            h._uint256_words(_java_result(b"\x00" * 40), 2)
+    
+    def test_global_stats(self):
+        """Test that getGlobalStats decodes into its named fields."""
+        result = _java_result(abi_encode(["uint256"] * 4, [10, 2, 3000, 7]))
+        
+        assert h._global_stats_from_result(result) == {
+            "total_evaluations": 10,
+            "total_challenges": 2,
+            "total_oracle_stake": 3000,
+            "active_oracle_count": 7
+        }
+    
+    def test_global_stats_unparseable(self):
+        """Test that a malformed getGlobalStats result decodes to zeros."""
+        stats = h._global_stats_from_result(_java_result(b"\x00" * 64))
+        
+        assert stats == dict.fromkeys(h._GLOBAL_STATS_KEYS, 0)
+    
+    def test_word_value_uint_and_bool(self):
+        """Test that one-word results decode as uint or bool."""
+        quorum = _java_result(abi_encode(["uint256"], [42]))
+        can_execute = _java_result(abi_encode(["bool"], [True]))
+        
+        assert h._word_value(quorum, "uint256", "quorum") == 42
+        assert h._word_value(can_execute, "bool", "can execute") is True
+    
+    def test_word_value_defaults(self):
+        """Test that missing or malformed results decode to zero values."""
+        assert h._word_value(None, "uint256", "quorum") == 0
+        assert h._word_value(None, "bool", "has voted") is False
+        assert h._word_value(_java_result(b"\x01"), "bool", "has voted") is False
+        assert h._uint256_or_zero(_java_result(b""), "category score") == 0
+    
+    def test_vote_receipt(self):
+        """Test that a vote receipt struct, including its string, is decoded."""
+        raw = abi_encode([h._VOTE_RECEIPT_TUPLE], [(True, 1, 500, "Supports growth")])
+        
+        assert h._vote_receipt_from_result(_java_result(raw)) == {
+            "has_voted": True,
+            "vote": 1,
+            "weight": 500,
+            "reason": "Supports growth"
+        }
+    
+    def test_vote_receipt_unparseable(self):
+        """Test that a missing or malformed vote receipt decodes to an empty receipt."""
+        empty = {"has_voted": False, "vote": 0, "weight": 0, "reason": ""}
+        
+        assert h._vote_receipt_from_result(None) == empty
+        assert h._vote_receipt_from_result(_java_result(b"\x00" * 16)) == empty
+
+
+class TestBatchContractCall:
+    """Test ABI encoding and batched eth_call reads through the JSON-RPC relay."""
+    
+    USER = "0x" + "ab" * 20
+    
+    @staticmethod
+    def _relay(replies):
+        """Patch the HTTP client so the relay answers ``replies``."""
+        response = MagicMock()
+        response.json.return_value = replies
+        client = MagicMock()
+        client.post = AsyncMock(return_value=response)
+        return client, patch.object(h, "_get_http_client", return_value=client)
+    
+    @staticmethod
+    def _word(value):
+        """ABI-encode one uint256 as an eth_call result."""
+        return "0x" + abi_encode(["uint256"], [value]).hex()
+    
+    def test_word_arguments_match_abi_encoding(self):
+        """Test that packed single-word arguments match eth_abi's encoding."""
+        signature = "getVote(uint256,address,bool)"
+        
+        encoded = h._encode_call(signature, ("7", self.USER, True))
+        
+        expected = abi_encode(["uint256", "address", "bool"], [7, self.USER, True])
+        assert encoded == keccak(signature.encode())[:4] + expected
+    
+    def test_hedera_id_is_encoded_as_long_zero_address(self):
+        """Test that a Hedera ID argument is encoded as its long-zero EVM address."""
+        encoded = h._encode_call("getReputationScore(address)", ("0.0.1234",))
+        
+        assert encoded[4:] == abi_encode(["address"], ["0x" + "00" * 18 + "04d2"])
+    
+    def test_dynamic_arguments_use_abi_encoding(self):
+        """Test that string arguments are encoded through eth_abi."""
+        signature = "getCategoryScore(address,string)"
+        
+        encoded = h._encode_call(signature, (self.USER, "frontend"))
+        
+        expected = abi_encode(["address", "string"], [self.USER, "frontend"])
+        assert encoded == keccak(signature.encode())[:4] + expected
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch_makes_no_request(self):
+        """Test that an empty batch returns without calling the relay."""
+        client, http = self._relay([])
+        
+        with http:
+            assert await h.batch_contract_call([]) == []
+        
+        client.post.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_replies_are_matched_to_calls_by_id(self):
+        """Test that out-of-order replies, errors and gaps map back to their calls."""
+        calls = [
+            CallSpec("0.0.1001", "totalSupply()", output_types=("uint256",)),
+            CallSpec("0.0.1001", "balanceOf(address)", (self.USER,), ("uint256",)),
+            CallSpec("0.0.1002", "totalSupply()", output_types=("uint256",)),
+            CallSpec("0.0.1002", "paused()", output_types=("bool",)),
+        ]
+        client, http = self._relay([
+            {"jsonrpc": "2.0", "id": 1, "result": self._word(5)},
+            {"jsonrpc": "2.0", "id": 0, "result": self._word(100)},
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "execution reverted"}},
+        ])
+        
+        with http, patch.object(h, "_json_rpc_url", return_value="https://relay.test/api"):
+            results = await h.batch_contract_call(calls)
+        
+        assert results[0] == CallResult(success=True, values=(100,))
+        assert results[1] == CallResult(success=True, values=(5,))
+        assert results[2] == CallResult(success=False, error="execution reverted")
+        assert results[3].success is False
+        payload = client.post.await_args.kwargs["json"]
+        assert [request["id"] for request in payload] == [0, 1, 2, 3]
+        assert payload[1]["params"][0] == {
+            "to": "0x" + "00" * 18 + "03e9",
+            "data": "0x" + h._encode_call("balanceOf(address)", (self.USER,)).hex()
+        }
+    
+    @pytest.mark.asyncio
+    async def test_undecodable_result_fails_its_call(self):
+        """Test that a result that does not match the output types fails only that call."""
+        calls = [
+            CallSpec("0.0.1001", "totalSupply()", output_types=("uint256",)),
+            CallSpec("0.0.1001", "name()", output_types=("string",)),
+        ]
+        _, http = self._relay([
+            {"jsonrpc": "2.0", "id": 0, "result": self._word(100)},
+            {"jsonrpc": "2.0", "id": 1, "result": "0x"},
+        ])
+        
+        with http, patch.object(h, "_json_rpc_url", return_value="https://relay.test/api"):
+            results = await h.batch_contract_call(calls)
+        
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error.startswith("Could not decode result")
+    
+    @pytest.mark.asyncio
+    async def test_transport_failure_fails_every_call(self):
+        """Test that a failed round-trip fails every call in the batch."""
+        client, http = self._relay([])
+        client.post.side_effect = h.httpx.ConnectError("relay unreachable")
+        calls = [CallSpec("0.0.1001", "totalSupply()", output_types=("uint256",))] * 2
+        
+        with http, patch.object(h, "_json_rpc_url", return_value="https://relay.test/api"):
+            results = await h.batch_contract_call(calls)
+        
+        assert results == [CallResult(success=False, error="relay unreachable")] * 2
+
+
+class TestMatchScores:
+    """Test batched, cached candidate match scoring."""
+    
+    ALICE = "0x" + "aa" * 20
+    BOB = "0x" + "bb" * 20
+    
+    @pytest.fixture
+    def talent_pool(self):
+        """Mock a deployed TalentPool contract."""
+        with patch.object(h, "_resolve_contract", return_value=("0.0.1001", MagicMock())):
+            yield
+    
+    @pytest.mark.asyncio
+    async def test_scores_are_read_in_one_batch(self, talent_pool):
+        """Test that uncached scores are read in one batch and returned in order."""
+        results = [CallResult(success=True, values=(80,)), CallResult(success=True, values=(65,))]
+        
+        with patch.object(h, "batch_contract_call", AsyncMock(return_value=results)) as batch:
+            scores = await h.calculate_match_scores("3", [self.ALICE, self.BOB])
+        
+        assert [score["match_score"] for score in scores] == [80, 65]
+        assert scores[0] == {
+            "success": True,
+            "pool_id": "3",
+            "candidate_address": self.ALICE,
+            "match_score": 80
+        }
+        calls = batch.await_args.args[0]
+        assert [call.args for call in calls] == [(3, self.ALICE), (3, self.BOB)]
+    
+    @pytest.mark.asyncio
+    async def test_cached_scores_are_not_read_again(self, talent_pool):
+        """Test that only candidates without a cached score are read."""
+        first = [CallResult(success=True, values=(80,))]
+        second = [CallResult(success=True, values=(65,))]
+        batch = AsyncMock(side_effect=[first, second])
+        
+        with patch.object(h, "batch_contract_call", batch):
+            await h.calculate_match_scores("3", [self.ALICE])
+            scores = await h.calculate_match_scores("3", [self.ALICE, self.BOB])
+        
+        assert [score["match_score"] for score in scores] == [80, 65]
+        assert [call.args for call in batch.await_args.args[0]] == [(3, self.BOB)]
+    
+    @pytest.mark.asyncio
+    async def test_fully_cached_batch_makes_no_call(self, talent_pool):
+        """Test that a batch of cached scores needs no read."""
+        h._MATCH_SCORE_CACHE.set(("3", self.ALICE), 80)
+        
+        with patch.object(h, "batch_contract_call", AsyncMock()) as batch:
+            scores = await h.calculate_match_scores("3", [self.ALICE])
+        
+        assert scores[0]["match_score"] == 80
+        batch.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_failed_score_is_reported_and_not_cached(self, talent_pool):
+        """Test that a failed read fails only its candidate and is retried next time."""
+        results = [CallResult(success=True, values=(80,)), CallResult(success=False)]
+        
+        with patch.object(h, "batch_contract_call", AsyncMock(return_value=results)):
+            scores = await h.calculate_match_scores("3", [self.ALICE, self.BOB])
+        
+        assert scores[0]["success"] is True
+        assert scores[1] == {"success": False, "error": "Query failed"}
+        assert h._MATCH_SCORE_CACHE.get(("3", self.BOB)) is None
+    
+    @pytest.mark.asyncio
+    async def test_undeployed_contract(self):
+        """Test that every candidate fails when TalentPool is not deployed."""
+        with patch.object(h, "_resolve_contract", return_value=(None, None)):
+            scores = await h.calculate_match_scores("3", [self.ALICE, self.BOB])
+        
+        assert scores == [{"success": False, "error": "TalentPool contract not deployed"}] * 2
@@ -0,0 +1,179 @@
+"""
+Tests for the local reputation index
+
+This module covers the SQLite store that serves reputation reads in
+app.utils.hedera: its staleness checks, row expiry, challenge handling and
+the indexer's polling loop. The Hedera SDK and the HTTP client are mocked.
+"""
+
+import sys
+import time
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+try:
+    import hedera  # noqa: F401
+except ImportError:
+    # The SDK drives a JVM; every call into it is mocked below
+    sys.modules["hedera"] = MagicMock()
+
+import app.utils.hedera as h
+
+
+class TestReputationIndex:
+    """Test the local reputation index and its staleness checks."""
+    
+    @pytest.fixture
+    def index(self, monkeypatch):
+        """Open an in-memory index with a running, freshly polled indexer."""
+        db = h._open_reputation_index(":memory:")
+        task = MagicMock()
+        task.done.return_value = False
+        monkeypatch.setattr(h, "_reputation_index_db", db)
+        monkeypatch.setattr(h, "_reputation_indexer_task", task)
+        monkeypatch.setattr(h, "_reputation_index_poll_interval", 5.0)
+        monkeypatch.setattr(h, "_reputation_index_polled_at", time.monotonic())
+        yield task
+        db.close()
+    
+    @pytest.fixture
+    def reputation(self):
+        """Sample indexed reputation record."""
+        return {
+            "user_address": "0xabc",
+            "overall_score": 87,
+            "total_evaluations": 4,
+            "last_updated": 1700000000,
+            "is_active": True
+        }
+    
+    @pytest.mark.asyncio
+    async def test_read_returns_written_records(self, index, reputation):
+        """Test that records written to the index are read back."""
+        h._write_reputation_index({"0xabc": reputation})
+        
+        records = await h._read_reputation_index(["0xabc", "0xdef"])
+        
+        assert records == {"0xabc": reputation}
+    
+    @pytest.mark.asyncio
+    async def test_none_removes_record(self, index, reputation):
+        """Test that writing None for a key deletes its row."""
+        h._write_reputation_index({"0xabc": reputation})
+        h._write_reputation_index({"0xabc": None})
+        
+        assert await h._read_reputation_index(["0xabc"]) == {}
+    
+    @pytest.mark.asyncio
+    async def test_stale_index_is_ignored(self, index, reputation, monkeypatch):
+        """Test that the index is bypassed once the last good poll is too old."""
+        h._write_reputation_index({"0xabc": reputation})
+        max_age = h._REPUTATION_INDEX_STALE_POLLS * 5.0
+        monkeypatch.setattr(h, "_reputation_index_polled_at", time.monotonic() - max_age - 1)
+        
+        assert await h._read_reputation_index(["0xabc"]) == {}
+    
+    @pytest.mark.asyncio
+    async def test_unpolled_index_is_ignored(self, index, reputation, monkeypatch):
+        """Test that the index is bypassed until the first poll succeeds."""
+        h._write_reputation_index({"0xabc": reputation})
+        monkeypatch.setattr(h, "_reputation_index_polled_at", None)
+        
+        assert await h._read_reputation_index(["0xabc"]) == {}
+    
+    @pytest.mark.asyncio
+    async def test_stopped_indexer_is_ignored(self, index, reputation):
+        """Test that the index is bypassed once the indexer task has finished."""
+        h._write_reputation_index({"0xabc": reputation})
+        index.done.return_value = True
+        
+        assert await h._read_reputation_index(["0xabc"]) == {}
+    
+    @pytest.mark.asyncio
+    async def test_expired_row_is_ignored(self, index, reputation):
+        """Test that rows older than the maximum age fall back to the chain."""
+        written_at = time.time() - h._REPUTATION_INDEX_MAX_AGE - 1
+        with patch.object(h.time, "time", return_value=written_at):
+            h._write_reputation_index({"0xabc": reputation})
+        
+        assert await h._read_reputation_index(["0xabc"]) == {}
+    
+    @pytest.mark.asyncio
+    async def test_resolved_challenge_drops_user(self, index, reputation):
+        """Test that resolving a challenge removes the evaluated user's row."""
+        user = "0x" + "ab" * 20
+        h._write_reputation_index({user: dict(reputation, user_address=user), "0xdef": reputation})
+        logs = [
+            {"timestamp": "1.1", "topics": [h._CHALLENGE_CREATED_TOPIC, hex(7), hex(42), "0x0"]},
+            {"timestamp": "1.2", "topics": [h._CHALLENGE_RESOLVED_TOPIC, hex(7), "0x0"]},
+        ]
+        evaluation = {"success": True, "evaluation": {"user": "ab" * 20}}
+        
+        with self._mirror_logs(logs), \
+             patch.object(h, "get_work_evaluation", AsyncMock(return_value=evaluation)) as get_evaluation:
+            cursor = await h._index_reputation_logs("0.0.1001", "1.0")
+        
+        assert cursor == "1.2"
+        get_evaluation.assert_awaited_once_with("42")
+        assert set(await h._read_reputation_index([user, "0xdef"])) == {"0xdef"}
+    
+    @pytest.mark.asyncio
+    async def test_untracked_challenge_clears_index(self, index, reputation):
+        """Test that a challenge opened before indexing drops every row."""
+        h._write_reputation_index({"0xabc": reputation, "0xdef": reputation})
+        logs = [{"timestamp": "1.1", "topics": [h._CHALLENGE_RESOLVED_TOPIC, hex(9), "0x0"]}]
+        
+        with self._mirror_logs(logs):
+            await h._index_reputation_logs("0.0.1001", "1.0")
+        
+        assert await h._read_reputation_index(["0xabc", "0xdef"]) == {}
+    
+    @staticmethod
+    def _mirror_logs(logs):
+        """Serve ``logs`` as a single mirror node page."""
+        response = MagicMock()
+        response.json.return_value = {"logs": logs, "links": {"next": None}}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        return patch.object(h, "_get_http_client", return_value=client)
+    
+    @pytest.mark.asyncio
+    async def test_bulk_read_spans_select_chunks(self, index, reputation):
+        """Test that reads larger than one SELECT chunk return every record."""
+        keys = [f"0x{i:040x}" for i in range(h._REPUTATION_INDEX_CHUNK + 5)]
+        h._write_reputation_index({key: dict(reputation, user_address=key) for key in keys})
+        
+        records = await h._read_reputation_index(keys)
+        
+        assert len(records) == len(keys)
+    
+    @pytest.mark.asyncio
+    async def test_indexer_records_only_successful_polls(self, index, monkeypatch):
+        """Test that a failing poll leaves the index untrusted and a good one refreshes it."""
+        monkeypatch.setattr(h, "_reputation_index_polled_at", None)
+        polls = []
+        
+        async def _poll(contract_address, cursor):
+            polls.append(cursor)
+            if len(polls) == 1:
+                raise RuntimeError("mirror node unavailable")
+            return "1700000001.000000000"
+        
+        with patch.object(h, "_get_contract_id", return_value=MagicMock()), \
+             patch.object(h, "_index_reputation_logs", side_effect=_poll):
+            task = asyncio.create_task(h._reputation_indexer(0.01))
+            try:
+                while len(polls) < 2:
+                    await asyncio.sleep(0.01)
+                    if len(polls) == 1:
+                        assert h._reputation_index_polled_at is None
+                await asyncio.sleep(0.01)
+            finally:
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+        
+        assert h._reputation_index_polled_at is not None
+        # The failed poll did not advance the cursor
+        assert polls[0] == polls[1]
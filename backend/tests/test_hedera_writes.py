@@ -0,0 +1,766 @@
+"""
+Tests for the Hedera contract write path
+
+This module covers how app.utils.hedera resolves contracts and builds,
+sizes, submits and dedupes contract writes, and the batch helpers built on
+top of them. The Hedera SDK is mocked throughout.
+"""
+
+import sys
+import time
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+try:
+    import hedera  # noqa: F401
+except ImportError:
+    # The SDK drives a JVM; every call into it is mocked below
+    sys.modules["hedera"] = MagicMock()
+
+import app.utils.hedera as h
+from app.utils.hedera import TransactionResult
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state():
+    """Clear the module-level write caches and statistics around each test."""
+    h._GAS_SAMPLES.clear()
+    h._RECENT_WRITES.clear()
+    h._INFLIGHT.clear()
+    yield
+    h._GAS_SAMPLES.clear()
+    h._RECENT_WRITES.clear()
+    h._INFLIGHT.clear()
+
+
+class TestWriteDispatch:
+    """Test the table-driven write dispatcher."""
+    
+    @pytest.fixture
+    def sdk(self):
+        """Mock contract resolution and the SDK transaction classes."""
+        with patch.object(h, "_resolve_contract", return_value=("0.0.1001", MagicMock())), \
+             patch.object(h, "ContractFunctionParameters") as params_cls, \
+             patch.object(h, "ContractExecuteTransaction") as transaction_cls:
+            yield params_cls.return_value, transaction_cls.return_value
+    
+    def test_build_coerces_and_adds_arguments(self, sdk):
+        """Test that arguments are added in order with IDs coerced to int."""
+        params, transaction = sdk
+        
+        address, built = h._build_contract_call("selectCandidate", ("7", "0xabc"))
+        
+        assert address == "0.0.1001"
+        assert built is transaction
+        params.addUint256.assert_called_once_with(7)
+        params.addAddress.assert_called_once_with("0xabc")
+        transaction.setFunction.assert_called_once_with("selectCandidate", params)
+    
+    def test_build_undeployed_contract(self):
+        """Test that an undeployed contract yields no transaction."""
+        with patch.object(h, "_resolve_contract", return_value=(None, None)):
+            assert h._build_contract_call("completePool", (1,)) == (None, None)
+    
+    def test_param_plan_adders(self):
+        """Test that each parameter maps to its adder and integer coercion."""
+        adders, _ = h._param_plan("selectCandidate")
+        
+        assert adders == (("addUint256", True), ("addAddress", False))
+    
+    def test_param_plan_is_resolved_once(self):
+        """Test that a function's parameter plan is cached after the first lookup."""
+        assert h._param_plan("completePool") is h._param_plan("completePool")
+    
+    def test_estimate_needs_enough_samples(self):
+        """Test that the default limit is used until enough samples exist."""
+        for _ in range(h._GAS_MIN_SAMPLES - 1):
+            h._record_gas("TalentPool", "completePool", 100000)
+        
+        assert h._estimate_gas("TalentPool", "completePool", 200000) == 200000
+    
+    def test_estimate_uses_p95_with_headroom(self):
+        """Test that the estimate is the p95 of samples plus 10%, capped at the default."""
+        for _ in range(h._GAS_MIN_SAMPLES):
+            h._record_gas("TalentPool", "completePool", 100000)
+        
+        assert h._estimate_gas("TalentPool", "completePool", 200000) == 110000
+        assert h._estimate_gas("TalentPool", "completePool", 105000) == 105000
+    
+    def test_insufficient_gas_result_resets_samples(self):
+        """Test that an INSUFFICIENT_GAS result drops the call's samples."""
+        for _ in range(h._GAS_MIN_SAMPLES):
+            h._record_gas("Governance", "delegate", 100000)
+        
+        result = h._result("INSUFFICIENT_GAS", MagicMock(), gas_key=("Governance", "delegate"))
+        
+        assert result.success is False
+        assert h._estimate_gas("Governance", "delegate", 150000) == 150000
+    
+    @pytest.mark.parametrize("function_name, has_dynamic", [
+        ("completePool", False),
+        ("selectCandidate", False),
+        ("renewSkillToken", False),
+        ("markExpiredTokens", True),
+        ("endorseSkillToken", True),
+        ("castVoteWithSignature", True),
+    ])
+    def test_param_plan_flags_dynamic_parameters(self, function_name, has_dynamic):
+        """Test that arrays, strings and bytes mark a write as dynamically sized."""
+        assert h._param_plan(function_name)[1] is has_dynamic
+    
+    def test_fixed_size_write_uses_estimate(self, sdk):
+        """Test that writes with only fixed-size parameters use the estimate."""
+        _, transaction = sdk
+        for _ in range(h._GAS_MIN_SAMPLES):
+            h._record_gas("TalentPool", "completePool", 100000)
+        
+        h._build_contract_call("completePool", (1,))
+        
+        transaction.setGas.assert_called_once_with(110000)
+    
+    def test_string_write_keeps_default_gas(self, sdk):
+        """Test that writes with string parameters ignore past samples."""
+        _, transaction = sdk
+        for _ in range(h._GAS_MIN_SAMPLES):
+            h._record_gas("SkillToken", "endorseSkillToken", 50000)
+        
+        h._build_contract_call("endorseSkillToken", (1, "Great work"))
+        
+        transaction.setGas.assert_called_once_with(200000)
+    
+    @pytest.mark.asyncio
+    async def test_insufficient_gas_retries_with_default(self, sdk):
+        """Test that a write out of estimated gas is resubmitted once with the default limit."""
+        _, transaction = sdk
+        for _ in range(h._GAS_MIN_SAMPLES):
+            h._record_gas("TalentPool", "completePool", 100000)
+        finalized = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        statuses = ["INSUFFICIENT_GAS", h._SUCCESS]
+        
+        with patch.object(h._client_pool, "acquire", return_value=MagicMock()), \
+             patch.object(h, "_exec", AsyncMock(return_value=MagicMock())), \
+             patch.object(h, "_await_confirmation", AsyncMock(side_effect=statuses)), \
+             patch.object(h, "_finalize", AsyncMock(return_value=finalized)) as finalize:
+            outcome = await h._submit_contract_call("completePool", (1,))
+        
+        assert outcome == finalized
+        assert [c.args[0] for c in transaction.setGas.call_args_list] == [110000, 200000]
+        assert finalize.await_args.args[4] is h._SUCCESS
+    
+    @pytest.mark.asyncio
+    async def test_insufficient_gas_at_default_is_final(self, sdk):
+        """Test that running out of the default limit is reported, not retried."""
+        _, transaction = sdk
+        failed = (TransactionResult(success=False, error="INSUFFICIENT_GAS"), None)
+        
+        with patch.object(h._client_pool, "acquire", return_value=MagicMock()), \
+             patch.object(h, "_exec", AsyncMock(return_value=MagicMock())), \
+             patch.object(h, "_await_confirmation", AsyncMock(return_value="INSUFFICIENT_GAS")), \
+             patch.object(h, "_finalize", AsyncMock(return_value=failed)) as finalize:
+            outcome = await h._submit_contract_call("completePool", (1,))
+        
+        assert outcome == failed
+        transaction.setGas.assert_called_once_with(200000)
+        finalize.assert_awaited_once()
+    
+    def test_batch_write_adds_per_item_gas(self, sdk):
+        """Test that batch writes add gas per element of their first array."""
+        _, transaction = sdk
+        
+        h._build_contract_call(
+            "updateOracleStatusBatch", (["0xa", "0xb", "0xc"], [True, False, True], ["", "", ""])
+        )
+        
+        per_item = h._PER_ITEM_GAS["updateOracleStatusBatch"]
+        transaction.setGas.assert_called_once_with(200000 + 3 * per_item)
+
+
+class TestWriteRetries:
+    """Test resubmission of writes the network shed under load."""
+    
+    @pytest.fixture
+    def submit(self):
+        """Mock everything around _submit_contract_call's retry loop."""
+        finalized = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        built = ("0.0.1001", MagicMock())
+        with patch.object(h, "_build_contract_call", return_value=built) as build, \
+             patch.object(h._client_pool, "acquire", return_value=MagicMock()), \
+             patch.object(h, "_exec", AsyncMock(return_value=MagicMock())) as execute, \
+             patch.object(h, "_await_confirmation", AsyncMock()) as confirm, \
+             patch.object(h, "_finalize", AsyncMock(return_value=finalized)) as finalize, \
+             patch.object(h.asyncio, "sleep", AsyncMock()):
+            yield build, execute, confirm, finalize
+    
+    @pytest.mark.asyncio
+    async def test_retryable_status_is_resubmitted(self, submit):
+        """Test that BUSY and throttling statuses are resubmitted until one lands."""
+        build, _, confirm, finalize = submit
+        confirm.side_effect = ["BUSY", "THROTTLED_AT_CONSENSUS", h._SUCCESS]
+        
+        await h._submit_contract_call("completePool", (1,))
+        
+        assert build.call_count == 3
+        finalize.assert_awaited_once()
+        assert finalize.await_args.args[4] is h._SUCCESS
+    
+    @pytest.mark.asyncio
+    async def test_retryable_precheck_is_resubmitted(self, submit):
+        """Test that a precheck exception naming a retryable status is resubmitted."""
+        build, execute, confirm, finalize = submit
+        execute.side_effect = [Exception("PrecheckStatusException: BUSY"), MagicMock()]
+        confirm.return_value = h._SUCCESS
+        
+        outcome = await h._submit_contract_call("completePool", (1,))
+        
+        assert outcome[0].success is True
+        assert build.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_other_status_is_not_resubmitted(self, submit):
+        """Test that a reverted write is finalized after a single attempt."""
+        build, _, confirm, finalize = submit
+        confirm.return_value = "CONTRACT_REVERT_EXECUTED"
+        
+        await h._submit_contract_call("completePool", (1,))
+        
+        assert build.call_count == 1
+        assert finalize.await_args.args[4] == "CONTRACT_REVERT_EXECUTED"
+    
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self, submit):
+        """Test that a write still shed after every retry reports the last status."""
+        build, _, confirm, finalize = submit
+        confirm.return_value = "BUSY"
+        
+        await h._submit_contract_call("completePool", (1,))
+        
+        assert build.call_count == h._WRITE_RETRIES + 1
+        assert finalize.await_args.args[4] == "BUSY"
+    
+    @pytest.mark.asyncio
+    async def test_other_precheck_error_fails(self, submit):
+        """Test that a non-retryable precheck error fails the write immediately."""
+        build, execute, _, finalize = submit
+        execute.side_effect = Exception("PrecheckStatusException: INVALID_SIGNATURE")
+        
+        result, record = await h._submit_contract_call("completePool", (1,))
+        
+        assert result.success is False
+        assert "INVALID_SIGNATURE" in result.error
+        assert record is None
+        assert build.call_count == 1
+        finalize.assert_not_awaited()
+
+
+class TestWriteDedupe:
+    """Test that duplicate writes collapse into one transaction."""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_write_returns_first_result(self):
+        """Test that a repeated successful write reuses the first transaction."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        
+        with patch.object(h, "_submit_contract_call", AsyncMock(return_value=outcome)) as submit:
+            first = await h._execute_contract_call("completePool", (1,))
+            second = await h._execute_contract_call("completePool", (1,))
+        
+        assert first == second == outcome
+        submit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_reused(self):
+        """Test that a failed write is submitted again on repeat."""
+        outcome = (TransactionResult(success=False, error="BUSY"), None)
+        
+        with patch.object(h, "_submit_contract_call", AsyncMock(return_value=outcome)) as submit:
+            await h._execute_contract_call("completePool", (1,))
+            await h._execute_contract_call("completePool", (1,))
+        
+        assert submit.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_writes_share_one_transaction(self):
+        """Test that identical concurrent writes are submitted once."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        
+        with patch.object(h, "_submit_contract_call", AsyncMock(return_value=outcome)) as submit:
+            results = await asyncio.gather(
+                h._execute_contract_call("closePool", (3,)),
+                h._execute_contract_call("closePool", (3,))
+            )
+        
+        assert results == [outcome, outcome]
+        submit.assert_awaited_once()
+
+
+class TestExecuteProposal:
+    """Test the local guard against re-executing proposals."""
+    
+    @pytest.fixture(autouse=True)
+    def executed(self, monkeypatch):
+        """Start each test with no proposals recorded as executed."""
+        monkeypatch.setattr(h, "_EXECUTED_PROPOSALS", {})
+    
+    @pytest.mark.asyncio
+    async def test_repeat_execute_proposal_returns_first_result(self):
+        """Test that re-executing a proposal within the window returns the first result."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        
+        with patch.object(h, "_submit_contract_call", AsyncMock(return_value=outcome)) as submit, \
+             patch.object(h, "invalidate_governance_cache"):
+            first = await h.execute_proposal("5")
+            second = await h.execute_proposal("5")
+        
+        assert first.success is second.success is True
+        assert second.transaction_id == "0.0.2@1.2"
+        submit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_executed_proposal_is_rejected_after_window(self):
+        """Test that an executed proposal is rejected locally once its result expires."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        
+        with patch.object(h, "_submit_contract_call", AsyncMock(return_value=outcome)) as submit, \
+             patch.object(h, "invalidate_governance_cache"):
+            await h.execute_proposal("5")
+            h._RECENT_WRITES.clear()
+            result = await h.execute_proposal("5")
+        
+        assert result.success is False
+        assert "already been executed" in result.error
+        submit.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_failed_execution_is_not_recorded(self):
+        """Test that a failed execution can be retried."""
+        outcome = (TransactionResult(success=False, error="CONTRACT_REVERT_EXECUTED"), None)
+        
+        with patch.object(h, "_submit_contract_call", AsyncMock(return_value=outcome)) as submit:
+            await h.execute_proposal("5")
+            await h.execute_proposal("5")
+        
+        assert submit.await_count == 2
+        assert "5" not in h._EXECUTED_PROPOSALS
+
+
+class TestTransactionBatching:
+    """Test atomic batch submission and folding of batch results."""
+    
+    def test_combine_counts_shared_transaction_once(self):
+        """Test that results sharing a transaction are counted once."""
+        shared = TransactionResult(success=True, transaction_id="0.0.2@1.2", gas_used=300)
+        other = TransactionResult(success=True, transaction_id="0.0.2@3.4", gas_used=100)
+        
+        combined = h._combine_results([shared, shared, other], "0.0.1001")
+        
+        assert combined.success is True
+        assert combined.transaction_id == "0.0.2@1.2,0.0.2@3.4"
+        assert combined.gas_used == 400
+        assert combined.error is None
+        assert combined.contract_address == "0.0.1001"
+    
+    def test_combine_fails_on_any_failure(self):
+        """Test that one failure fails the whole and repeated errors are listed once."""
+        combined = h._combine_results([
+            TransactionResult(success=True, transaction_id="0.0.2@1.2", gas_used=300),
+            TransactionResult(success=False, error="CONTRACT_REVERT_EXECUTED"),
+            TransactionResult(success=False, error="CONTRACT_REVERT_EXECUTED"),
+            TransactionResult(success=False),
+        ])
+        
+        assert combined.success is False
+        assert combined.error == "CONTRACT_REVERT_EXECUTED; Transaction failed"
+        assert combined.transaction_id == "0.0.2@1.2"
+        assert combined.gas_used == 300
+    
+    @pytest.mark.asyncio
+    async def test_batch_submit_empty(self):
+        """Test that an empty batch submits nothing."""
+        assert await h.batch_submit([]) == []
+    
+    @pytest.mark.asyncio
+    async def test_batch_submit_shares_one_result(self):
+        """Test that an atomic batch reports its single outcome for every transaction."""
+        transactions = [MagicMock(), MagicMock()]
+        batch_cls = MagicMock()
+        receipt = MagicMock(status=h._SUCCESS)
+        
+        with patch.object(h.hedera, "BatchTransaction", batch_cls, create=True), \
+             patch.object(h._client_pool, "acquire", return_value=MagicMock()), \
+             patch.object(h, "_exec", AsyncMock(return_value=MagicMock())), \
+             patch.object(h, "_await_receipt", AsyncMock(return_value=receipt)):
+            results = await h.batch_submit(transactions)
+        
+        assert batch_cls.return_value.addInnerTransaction.call_count == 2
+        assert [result.success for result in results] == [True, True]
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+    
+    @pytest.mark.asyncio
+    async def test_batch_submit_failure_fails_every_transaction(self):
+        """Test that a failed batch fails every transaction in it."""
+        with patch.object(h.hedera, "BatchTransaction", MagicMock(), create=True), \
+             patch.object(h._client_pool, "acquire", side_effect=RuntimeError("no client")):
+            results = await h.batch_submit([MagicMock(), MagicMock()])
+        
+        assert [result.error for result in results] == ["no client", "no client"]
+    
+    @pytest.mark.asyncio
+    async def test_batch_submit_without_batch_support_stops_at_failure(self):
+        """Test that the sequential fallback stops at the first failure."""
+        submitted = [
+            TransactionResult(success=True, transaction_id="0.0.2@1.2"),
+            TransactionResult(success=False, error="CONTRACT_REVERT_EXECUTED"),
+        ]
+        
+        with patch.object(h.hedera, "BatchTransaction", None, create=True), \
+             patch.object(h, "_submit_transaction", AsyncMock(side_effect=submitted)) as submit:
+            results = await h.batch_submit([MagicMock(), MagicMock(), MagicMock()])
+        
+        assert submit.await_count == 2
+        assert results[:2] == submitted
+        assert results[2].success is False
+        assert results[2].error.startswith("Not submitted")
+
+
+class TestExpirySweep:
+    """Test that large expiry sweeps are split into bounded, concurrent chunks."""
+    
+    @pytest.fixture
+    def chunked(self, monkeypatch):
+        """Use small chunks and a deployed SkillToken contract."""
+        monkeypatch.setattr(h, "_EXPIRY_CHUNK_SIZE", 2)
+        monkeypatch.setattr(h, "_EXPIRY_CONCURRENCY", 2)
+        with patch.object(h, "_resolve_contract", return_value=("0.0.1002", MagicMock())):
+            yield
+    
+    @pytest.mark.asyncio
+    async def test_sweep_is_split_into_chunks(self, chunked):
+        """Test that token IDs are submitted in chunks with their results combined."""
+        outcomes = [
+            (TransactionResult(success=True, transaction_id=f"0.0.2@{n}.0", gas_used=100), None)
+            for n in range(3)
+        ]
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(side_effect=outcomes)) as execute:
+            result = await h.mark_expired_tokens(["1", "2", "3", "4", "5"])
+        
+        chunks = [call.args[1][0] for call in execute.await_args_list]
+        assert chunks == [[1, 2], [3, 4], [5]]
+        assert all(call.args[0] == "markExpiredTokens" for call in execute.await_args_list)
+        assert result.success is True
+        assert result.transaction_id == "0.0.2@0.0,0.0.2@1.0,0.0.2@2.0"
+        assert result.gas_used == 300
+        assert result.contract_address == "0.0.1002"
+    
+    @pytest.mark.asyncio
+    async def test_chunks_are_submitted_with_bounded_concurrency(self, chunked):
+        """Test that no more than the configured number of chunks are in flight."""
+        active = 0
+        peak = 0
+        
+        async def _execute(function_name, args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return TransactionResult(success=True, transaction_id=str(args[0])), None
+        
+        with patch.object(h, "_execute_contract_call", side_effect=_execute):
+            await h.mark_expired_tokens([str(n) for n in range(10)])
+        
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_failed_chunk_fails_sweep(self, chunked):
+        """Test that a failed chunk is reported while the others still land."""
+        outcomes = [
+            (TransactionResult(success=True, transaction_id="0.0.2@1.0"), None),
+            (TransactionResult(success=False, error="INSUFFICIENT_GAS"), None),
+        ]
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(side_effect=outcomes)):
+            result = await h.mark_expired_tokens(["1", "2", "3"])
+        
+        assert result.success is False
+        assert result.error == "INSUFFICIENT_GAS"
+        assert result.transaction_id == "0.0.2@1.0"
+    
+    @pytest.mark.asyncio
+    async def test_undeployed_contract(self):
+        """Test that the sweep is rejected when SkillToken is not deployed."""
+        with patch.object(h, "_resolve_contract", return_value=(None, None)), \
+             patch.object(h, "_execute_contract_call", AsyncMock()) as execute:
+            result = await h.mark_expired_tokens(["1"])
+        
+        assert result.success is False
+        assert "not deployed" in result.error
+        execute.assert_not_awaited()
+
+
+class TestEndorseAndFetch:
+    """Test endorsing a skill token and returning its endorsements in one call."""
+    
+    ENDORSEMENT = {"endorser": "0xabc", "endorsement_data": "Great work", "timestamp": 1700000000}
+    
+    @staticmethod
+    def _endorsements(*endorsements):
+        """Build a get_skill_endorsements response."""
+        return {"success": True, "endorsements": list(endorsements)}
+    
+    @pytest.mark.asyncio
+    async def test_new_endorsement_is_appended_from_record(self):
+        """Test that the endorsement in the transaction's log is appended to the read."""
+        earlier = dict(self.ENDORSEMENT, endorsement_data="Solid")
+        written = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), MagicMock())
+        current = self._endorsements(earlier)
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=written)), \
+             patch.object(h, "get_skill_endorsements", AsyncMock(return_value=current)) as read, \
+             patch.object(h, "_endorsement_from_record", return_value=dict(self.ENDORSEMENT)):
+            result, endorsements = await h.endorse_and_fetch("7", "Great work")
+        
+        assert result.success is True
+        assert endorsements["endorsements"] == [earlier, self.ENDORSEMENT]
+        read.assert_awaited_once_with("7")
+    
+    @pytest.mark.asyncio
+    async def test_observed_endorsement_is_not_duplicated(self):
+        """Test that an endorsement the read already saw is not appended again."""
+        written = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), MagicMock())
+        current = self._endorsements(dict(self.ENDORSEMENT))
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=written)), \
+             patch.object(h, "get_skill_endorsements", AsyncMock(return_value=current)), \
+             patch.object(h, "_endorsement_from_record", return_value=dict(self.ENDORSEMENT)):
+            _, endorsements = await h.endorse_and_fetch("7", "Great work")
+        
+        assert endorsements["endorsements"] == [self.ENDORSEMENT]
+    
+    @pytest.mark.asyncio
+    async def test_unparseable_record_falls_back_to_a_read(self):
+        """Test that the list is read again when the record carries no endorsement."""
+        written = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), MagicMock())
+        refreshed = self._endorsements(dict(self.ENDORSEMENT))
+        reads = [self._endorsements(), refreshed]
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=written)), \
+             patch.object(h, "get_skill_endorsements", AsyncMock(side_effect=reads)) as read, \
+             patch.object(h, "_endorsement_from_record", return_value=None):
+            _, endorsements = await h.endorse_and_fetch("7", "Great work")
+        
+        assert endorsements is refreshed
+        assert read.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_failed_endorsement_returns_the_read(self):
+        """Test that a failed endorsement returns the concurrent read unchanged."""
+        failed = (TransactionResult(success=False, error="CONTRACT_REVERT_EXECUTED"), None)
+        current = self._endorsements()
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=failed)), \
+             patch.object(h, "get_skill_endorsements", AsyncMock(return_value=current)) as read:
+            result, endorsements = await h.endorse_and_fetch("7", "Great work")
+        
+        assert result.success is False
+        assert endorsements is current
+        read.assert_awaited_once()
+
+
+class TestBatchExecuteProposals:
+    """Test batch proposal execution and its per-proposal fallback."""
+    
+    @pytest.fixture
+    def governance(self):
+        """Mock the Governance contract lookup and cache invalidation."""
+        with patch.object(h, "_resolve_contract", return_value=("0.0.1003", MagicMock())), \
+             patch.object(h, "invalidate_governance_cache"):
+            yield
+    
+    @pytest.mark.asyncio
+    async def test_successful_batch_is_not_split(self, governance):
+        """Test that a batch that lands is not followed by individual executions."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        execute = AsyncMock(return_value=outcome)
+        
+        with patch.object(h, "_execute_contract_call", execute), \
+             patch.object(h, "execute_proposal", AsyncMock()) as execute_one:
+            result = await h.batch_execute_proposals([1, 2])
+        
+        assert result.success is True
+        execute.assert_awaited_once_with("batchExecuteProposals", ([1, 2],))
+        execute_one.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_reverted_batch_falls_back_to_individual_executions(self, governance):
+        """Test that a reverted batch is retried per proposal and the results combined."""
+        reverted = (TransactionResult(success=False, error="CONTRACT_REVERT_EXECUTED"), None)
+        individual = [
+            TransactionResult(success=True, transaction_id="0.0.2@1.0", gas_used=100),
+            TransactionResult(success=False, error="Proposal not ready"),
+            TransactionResult(success=True, transaction_id="0.0.2@3.0", gas_used=100),
+        ]
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=reverted)), \
+             patch.object(h, "execute_proposal", AsyncMock(side_effect=individual)) as execute_one:
+            result = await h.batch_execute_proposals([1, 2, 3])
+        
+        assert [call.args[0] for call in execute_one.await_args_list] == ["1", "2", "3"]
+        assert result.success is False
+        assert result.error == "Proposal not ready"
+        assert result.transaction_id == "0.0.2@1.0,0.0.2@3.0"
+        assert result.contract_address == "0.0.1003"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("proposal_ids, error", [
+        ([1, 2], "Governance contract not deployed"),
+        ([1], "CONTRACT_REVERT_EXECUTED"),
+    ])
+    async def test_no_fallback(self, governance, proposal_ids, error):
+        """Test that an undeployed contract or a single proposal is not retried individually."""
+        failed = (TransactionResult(success=False, error=error), None)
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=failed)), \
+             patch.object(h, "execute_proposal", AsyncMock()) as execute_one:
+            result = await h.batch_execute_proposals(proposal_ids)
+        
+        assert result.error == error
+        execute_one.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_ids_are_coerced_and_deduplicated(self, governance):
+        """Test that string and int IDs are accepted and repeats dropped in order."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=outcome)) as execute:
+            await h.batch_execute_proposals(["3", 1, 3, "1", 2])
+        
+        execute.assert_awaited_once_with("batchExecuteProposals", ([3, 1, 2],))
+    
+    @pytest.mark.asyncio
+    async def test_invalid_id_is_rejected(self, governance):
+        """Test that a non-numeric ID fails the batch before anything is submitted."""
+        with patch.object(h, "_execute_contract_call", AsyncMock()) as execute:
+            result = await h.batch_execute_proposals([1, "abc"])
+        
+        assert result.success is False
+        execute.assert_not_awaited()
+
+
+class TestVoteSignatures:
+    """Test decoding and validation of vote signatures."""
+    
+    SIGNATURE = bytes(range(65))
+    
+    @pytest.mark.parametrize("signature", [
+        SIGNATURE.hex(),
+        "0x" + SIGNATURE.hex(),
+        SIGNATURE,
+        bytearray(SIGNATURE),
+    ])
+    def test_decode_accepts_hex_and_bytes(self, signature):
+        """Test that hex with or without 0x and raw bytes decode to the same bytes."""
+        decoded = h._decode_sig(signature)
+        
+        assert decoded == self.SIGNATURE
+        assert type(decoded) is bytes
+    
+    @pytest.mark.parametrize("signature", ["0x1234", "zz" * 65, SIGNATURE + b"\x00"])
+    def test_decode_rejects_malformed(self, signature):
+        """Test that non-hex or wrongly sized signatures are rejected."""
+        with pytest.raises(ValueError):
+            h._decode_sig(signature)
+    
+    @pytest.mark.asyncio
+    async def test_vote_submits_decoded_signature(self):
+        """Test that the vote is submitted with the decoded signature bytes."""
+        outcome = (TransactionResult(success=True, transaction_id="0.0.2@1.2"), None)
+        
+        with patch.object(h, "_execute_contract_call", AsyncMock(return_value=outcome)) as execute:
+            result = await h.cast_vote_with_signature("5", 1, "Agree", "0x" + self.SIGNATURE.hex())
+        
+        assert result.success is True
+        execute.assert_awaited_once_with("castVoteWithSignature", ("5", 1, "Agree", self.SIGNATURE))
+    
+    @pytest.mark.asyncio
+    async def test_invalid_signature_is_not_submitted(self):
+        """Test that a malformed signature fails the vote without a transaction."""
+        with patch.object(h, "_execute_contract_call", AsyncMock()) as execute:
+            result = await h.cast_vote_with_signature("5", 1, "Agree", "0x1234")
+        
+        assert result.success is False
+        assert result.error.startswith("Invalid signature")
+        execute.assert_not_awaited()
+
+
+class TestContractResolution:
+    """Test the memo of resolved contracts and its expiring not-deployed entries."""
+    
+    DEPLOYED = {"contracts": {"TalentPool": {"address": "0.0.1001"}}}
+    
+    @pytest.fixture(autouse=True)
+    def memo(self, monkeypatch):
+        """Start from an empty memo and no loaded config."""
+        monkeypatch.setattr(h, "_contract_config", None)
+        monkeypatch.setattr(h, "_contract_id_cache", {})
+        monkeypatch.setattr(h, "_contract_misses", {})
+        with patch.object(h, "ContractId") as contract_id_cls:
+            yield contract_id_cls
+    
+    def test_deployed_contract_is_memoized(self):
+        """Test that a deployed contract is read from the config once."""
+        with patch.object(h, "get_contract_config", return_value=self.DEPLOYED) as config:
+            first = h._resolve_contract("TalentPool")
+            second = h._resolve_contract("TalentPool")
+        
+        assert first is second
+        assert first[0] == "0.0.1001"
+        config.assert_called_once()
+    
+    def test_missing_contract_is_memoized_until_expiry(self):
+        """Test that a missing contract is not re-checked before its entry expires."""
+        with patch.object(h, "get_contract_config", return_value={"contracts": {}}) as config:
+            assert h._resolve_contract("TalentPool") == (None, None)
+            assert h._resolve_contract("TalentPool") == (None, None)
+        
+        config.assert_called_once()
+    
+    def test_expired_miss_is_rechecked(self):
+        """Test that an expired miss re-reads the config and stays missing without a reload."""
+        with patch.object(h, "get_contract_config", return_value={"contracts": {}}) as config, \
+             patch.object(h, "reload_contract_manager") as reload:
+            h._resolve_contract("TalentPool")
+            h._contract_misses["TalentPool"] = 0.0
+            
+            assert h._resolve_contract("TalentPool") == (None, None)
+        
+        assert config.call_count == 2
+        assert h._contract_misses["TalentPool"] > time.monotonic()
+        reload.assert_not_called()
+    
+    def test_contract_deployed_after_miss_is_picked_up(self):
+        """Test that a contract deployed after a miss is resolved once the miss expires."""
+        configs = [{"contracts": {}}, self.DEPLOYED, self.DEPLOYED]
+        
+        with patch.object(h, "get_contract_config", side_effect=configs), \
+             patch.object(h, "invalidate_pool_cache"):
+            h._resolve_contract("TalentPool")
+            h._contract_misses["TalentPool"] = 0.0
+            
+            address, contract_id = h._resolve_contract("TalentPool")
+        
+        assert address == "0.0.1001"
+        assert contract_id is not None
+        assert h._contract_misses == {}
+    
+    def test_reload_clears_misses(self):
+        """Test that reloading the config drops memoized misses."""
+        with patch.object(h, "get_contract_config", return_value={"contracts": {}}), \
+             patch.object(h, "invalidate_pool_cache"):
+            h._resolve_contract("TalentPool")
+            h.reload_contract_manager()
+        
+        assert h._contract_misses == {}
+        assert h._contract_id_cache == {}
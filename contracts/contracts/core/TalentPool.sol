@@ -523,13 +523,7 @@ contract TalentPool is AccessControl, Pausable, ReentrancyGuard, ITalentPool {
     }
 
     function getActivePoolsCount() external view override returns (uint256) {
-        uint256 count = 0;
-        for (uint256 i = 0; i < _poolIdCounter.current(); i++) {
-            if (_pools[i].status == PoolStatus.Active) {
-                count++;
-            }
-        }
-        return count;
+        return _activePoolsCount();
     }
 
     function getTotalPoolsCount() external view override returns (uint256) {
@@ -600,7 +594,46 @@ contract TalentPool is AccessControl, Pausable, ReentrancyGuard, ITalentPool {
         );
     }
 
+    /**
+     * @dev Pool metrics, global stats and pool counts in a single call, so a
+     * dashboard needs one query instead of four
+     */
+    function getDashboardSnapshot(
+        uint256 poolId
+    )
+        external
+        view
+        poolExists(poolId)
+        returns (
+            PoolMetrics memory metrics,
+            uint256 totalPools,
+            uint256 totalApplications,
+            uint256 totalMatches,
+            uint256 totalStaked,
+            uint256 activePoolsCount,
+            uint256 totalPoolsCount
+        )
+    {
+        return (
+            _poolMetrics[poolId],
+            _totalPoolsCreated,
+            _totalApplicationsSubmitted,
+            _totalMatches,
+            _totalStakedAmount,
+            _activePoolsCount(),
+            _poolIdCounter.current()
+        );
+    }
+
     // Internal functions
+    function _activePoolsCount() internal view returns (uint256 count) {
+        for (uint256 i = 0; i < _poolIdCounter.current(); i++) {
+            if (_pools[i].status == PoolStatus.Active) {
+                count++;
+            }
+        }
+    }
+
     function _createSinglePool(
         string calldata title,
         string calldata description,
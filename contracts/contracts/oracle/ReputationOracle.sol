@@ -769,6 +769,30 @@ contract ReputationOracle is
         emit OracleStatusChanged(oracle, isActive, reason);
     }
 
+    function updateOracleStatusBatch(
+        address[] calldata oracles,
+        bool[] calldata isActive,
+        string[] calldata reasons
+    ) external onlyRole(ORACLE_ADMIN_ROLE) {
+        require(
+            oracles.length == isActive.length &&
+                oracles.length == reasons.length,
+            "ReputationOracle: array length mismatch"
+        );
+
+        for (uint256 i = 0; i < oracles.length; i++) {
+            require(
+                _oracles[oracles[i]].oracle != address(0),
+                "ReputationOracle: oracle not registered"
+            );
+
+            _oracles[oracles[i]].isActive = isActive[i];
+            _isActiveOracle[oracles[i]] = isActive[i];
+
+            emit OracleStatusChanged(oracles[i], isActive[i], reasons[i]);
+        }
+    }
+
     function slashOracle(
         address oracle,
         uint256 amount,
@@ -774,6 +774,79 @@ describe("ReputationOracle Tests", function () {
     });
   });
 
+  describe("Oracle Status Batch Update", function () {
+    beforeEach(async function () {
+      await reputationOracle.connect(oracle1).registerOracle(
+        "Oracle Node 1", ["blockchain", "smart-contracts"], { value: MIN_ORACLE_STAKE }
+      );
+      await reputationOracle.connect(oracle2).registerOracle(
+        "Oracle Node 2", ["frontend", "backend"], { value: MIN_ORACLE_STAKE }
+      );
+    });
+
+    it("Should reject mismatched array lengths", async function () {
+      await expect(reputationOracle.updateOracleStatusBatch(
+        [oracle1.address, oracle2.address],
+        [false],
+        ["Maintenance", "Maintenance"]
+      )).to.be.revertedWith("ReputationOracle: array length mismatch");
+
+      await expect(reputationOracle.updateOracleStatusBatch(
+        [oracle1.address, oracle2.address],
+        [false, false],
+        ["Maintenance"]
+      )).to.be.revertedWith("ReputationOracle: array length mismatch");
+    });
+
+    it("Should reject unregistered oracles", async function () {
+      await expect(reputationOracle.updateOracleStatusBatch(
+        [oracle1.address, user1.address],
+        [false, false],
+        ["Maintenance", "Maintenance"]
+      )).to.be.revertedWith("ReputationOracle: oracle not registered");
+
+      // The whole batch reverts, including the registered oracle before it
+      expect(await reputationOracle.isAuthorizedOracle(oracle1.address)).to.be.true;
+    });
+
+    it("Should flip the status of each oracle", async function () {
+      await reputationOracle.updateOracleStatusBatch(
+        [oracle1.address, oracle2.address],
+        [false, true],
+        ["Maintenance", "Still healthy"]
+      );
+
+      expect((await reputationOracle.getOracleInfo(oracle1.address)).isActive).to.be.false;
+      expect(await reputationOracle.isAuthorizedOracle(oracle1.address)).to.be.false;
+      expect((await reputationOracle.getOracleInfo(oracle2.address)).isActive).to.be.true;
+      expect(await reputationOracle.isAuthorizedOracle(oracle2.address)).to.be.true;
+
+      await reputationOracle.updateOracleStatusBatch([oracle1.address], [true], ["Back online"]);
+      expect(await reputationOracle.isAuthorizedOracle(oracle1.address)).to.be.true;
+    });
+
+    it("Should emit a status event per oracle", async function () {
+      const tx = reputationOracle.updateOracleStatusBatch(
+        [oracle1.address, oracle2.address],
+        [false, true],
+        ["Maintenance", "Still healthy"]
+      );
+
+      await expect(tx)
+        .to.emit(reputationOracle, "OracleStatusChanged")
+        .withArgs(oracle1.address, false, "Maintenance");
+      await expect(tx)
+        .to.emit(reputationOracle, "OracleStatusChanged")
+        .withArgs(oracle2.address, true, "Still healthy");
+    });
+
+    it("Should only allow oracle admins to update statuses", async function () {
+      await expect(reputationOracle.connect(user1).updateOracleStatusBatch(
+        [oracle1.address], [false], ["Maintenance"]
+      )).to.be.reverted;
+    });
+  });
+
   describe("Pausable Functionality", function () {
     it("Should pause oracle operations", async function () {
       await reputationOracle.pause();
@@ -646,6 +646,38 @@ describe("TalentPool Enhanced Tests", function () {
       expect(stats.totalMatches).to.equal(0);
       expect(stats.totalStaked).to.equal(ethers.utils.parseEther("2.5"));
     });
+
+    it("Should get a dashboard snapshot matching the individual getters", async function () {
+      await talentPool.connect(candidate1).submitApplication(
+        0, [0], "Cover letter", "Portfolio",
+        { value: ethers.utils.parseEther("0.1") }
+      );
+      await talentPool.connect(addresses[0]).closePool(1);
+
+      const snapshot = await talentPool.getDashboardSnapshot(0);
+      const metrics = await talentPool.getPoolMetrics(0);
+      const stats = await talentPool.getGlobalStats();
+
+      expect(snapshot.metrics.totalStaked).to.equal(metrics.totalStaked);
+      expect(snapshot.metrics.averageMatchScore).to.equal(metrics.averageMatchScore);
+      expect(snapshot.metrics.completionRate).to.equal(metrics.completionRate);
+      expect(snapshot.metrics.averageTimeToFill).to.equal(metrics.averageTimeToFill);
+      expect(snapshot.totalPools).to.equal(stats.totalPools);
+      expect(snapshot.totalApplications).to.equal(stats.totalApplications);
+      expect(snapshot.totalMatches).to.equal(stats.totalMatches);
+      expect(snapshot.totalStaked).to.equal(stats.totalStaked);
+      expect(snapshot.activePoolsCount).to.equal(await talentPool.getActivePoolsCount());
+      expect(snapshot.totalPoolsCount).to.equal(await talentPool.getTotalPoolsCount());
+
+      // One of the two pools was closed
+      expect(snapshot.activePoolsCount).to.equal(1);
+      expect(snapshot.totalPoolsCount).to.equal(2);
+      expect(snapshot.totalApplications).to.equal(1);
+    });
+
+    it("Should reject a dashboard snapshot for a nonexistent pool", async function () {
+      await expect(talentPool.getDashboardSnapshot(2)).to.be.revertedWith("Pool not found");
+    });
   });
 
   describe("Pausable Functionality", function () {